@@ -7,22 +7,176 @@ Provides analytics data for:
 - Link extraction trends
 - Source health trends
 - Post-level performance metrics
+
+Raw fingerprints are the source of truth. Timelines and trends read the
+derived `daily_rollups` collection, which mongo_storage.save_new_links keeps
+current and mongo_storage.rebuild_daily_rollups can regenerate. The hourly
+timeline reads `hourly_rollups`, which save_new_links fills per write hour.
+
+Every panel counts links the same way: one per stored link fingerprint (not
+one per fingerprint document), and promo-code fingerprints are not links, so
+they are left out everywhere.
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 from datetime import datetime, timedelta
-from collections import defaultdict
+import copy
+import functools
+import inspect
+import threading
+import time
 import pytz
-from .mongo_storage import MongoDBStorage
+from .mongo_storage import MongoDBStorage, _get_storage
+
+
+# Cursor options for every analytics aggregation: stream results in modest
+# batches and let large $group/$sort stages spill to disk instead of failing
+_CURSOR_OPTIONS = {"batchSize": 200, "allowDiskUse": True}
+
+
+# Link fingerprint documents (promo codes share the collection) and the
+# number of links each one records; the unit every panel counts in
+_LINK_DOCS = {"type": {"$ne": "promo_code"}}
+_LINK_COUNT = {"$size": {"$ifNull": ["$fingerprints", []]}}
+
+
+# Fingerprints only record links that were added, so the dashboard's outcome
+# fields are constants; they are kept (shared, not rebuilt per row) for the
+# plugin's charts and tables
+DEFAULT_SUCCESS_FIELDS = {"success_rate": 100.0}
+_TIMELINE_SUCCESS_FIELDS = {**DEFAULT_SUCCESS_FIELDS, "failed": 0}
+_POST_SUCCESS_FIELDS = {**DEFAULT_SUCCESS_FIELDS, "failed_updates": 0}
+
+
+def _cutoff_date(days: int) -> datetime:
+    """Midnight (UTC) of the first day in a `days`-long analytics window"""
+    start = (datetime.utcnow() - timedelta(days=days)).date()
+    return datetime(start.year, start.month, start.day)
+
+
+def _fingerprint_window(cutoff: datetime) -> Dict:
+    """
+    Match fingerprints in the window starting at `cutoff`
+    
+    Range-matches the native `date` field. Documents written before that field
+    existed (and not yet backfilled by scripts/migrate_fingerprint_dates.py)
+    only have `date_iso`, which sorts the same way as a string.
+    """
+    return {"$or": [
+        {"date": {"$gte": cutoff}},
+        {"date": {"$exists": False}, "date_iso": {"$gte": cutoff.strftime("%Y-%m-%d")}},
+    ]}
+
+
+def _facet_count(facet_result: Dict, key: str) -> int:
+    """Read a {"$count": "n"} sub-pipeline result out of a $facet document"""
+    rows = facet_result.get(key) or []
+    return rows[0]["n"] if rows else 0
+
+
+# Server-side equivalent of AnalyticsEngine._determine_health_status
+_HEALTH_STATUS_EXPR = {"$switch": {
+    "branches": [
+        {"case": {"$eq": [{"$ifNull": ["$total_extractions", 0]}, 0]}, "then": "unknown"},
+        {"case": {"$gte": [{"$ifNull": ["$consecutive_failures", 0]}, 5]}, "then": "critical"},
+        {"case": {"$gte": [{"$ifNull": ["$consecutive_failures", 0]}, 3]}, "then": "failing"},
+        {"case": {"$lt": [
+            {"$divide": [
+                {"$ifNull": ["$successful_extractions", 0]},
+                {"$max": ["$total_extractions", 1]}
+            ]},
+            0.8
+        ]}, "then": "warning"}
+    ],
+    "default": "healthy"
+}}
+
+
+def _ttl_cached(short_ttl: int = 120, long_ttl: int = 600):
+    """
+    Memoize an AnalyticsEngine getter per (method, arguments) for a short window.
+    
+    Dashboard refreshes hit the same getters with the same `days` repeatedly, so
+    results are served from memory until they expire. Single-day views use the
+    shorter TTL since they change the most; longer periods use `long_ttl`.
+    Expired entries are pruned whenever a new result is stored, and callers
+    get a deep copy so mutating a result never alters the cached value. The
+    cache dict is only touched under the engine's lock; the query itself runs
+    outside it.
+    """
+    def decorator(fn):
+        signature = inspect.signature(fn)
+        
+        @functools.wraps(fn)
+        def wrapper(self, *args, **kwargs):
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            arguments = tuple((k, v) for k, v in bound.arguments.items() if k != "self")
+            key = (fn.__name__,) + arguments
+            
+            now = time.monotonic()
+            with self._cache_lock:
+                cached = self._cache.get(key)
+            if cached and cached[0] > now:
+                return copy.deepcopy(cached[1])
+            
+            value = fn(self, *args, **kwargs)
+            ttl = short_ttl if bound.arguments.get("days", 0) <= 1 else long_ttl
+            with self._cache_lock:
+                for expired in [k for k, (expiry, _) in list(self._cache.items()) if expiry <= now]:
+                    del self._cache[expired]
+                self._cache[key] = (now + ttl, value)
+            return copy.deepcopy(value)
+        
+        return wrapper
+    return decorator
 
 
 class AnalyticsEngine:
     """Generate analytics and insights from historical data"""
     
-    def __init__(self):
-        self.storage = MongoDBStorage()
+    def __init__(self, storage: Optional[MongoDBStorage] = None):
+        # Reuse the shared storage (and its pooled MongoClient) unless one is injected
+        self.storage = storage if storage is not None else _get_storage()
         self.db = self.storage.db
+        # (method, arguments) -> (expiry monotonic ts, value); see _ttl_cached
+        self._cache: Dict[tuple, tuple] = {}
+        # Request handlers run in a threadpool and share this engine
+        self._cache_lock = threading.Lock()
+    
+    def invalidate(self, prefix: str = ""):
+        """Drop cached results for getters whose name starts with prefix (all by default)"""
+        with self._cache_lock:
+            for key in [k for k in list(self._cache) if k[0].startswith(prefix)]:
+                self._cache.pop(key, None)
     
+    @_ttl_cached()
+    def get_dashboard_bundle(self, days: int = 30) -> Dict:
+        """
+        Get every dashboard panel for one period in a single call
+        
+        All panels share one cutoff, so they agree on the window even if the
+        day rolls over mid-refresh.
+        
+        Args:
+            days: Number of days to analyze (default 30)
+            
+        Returns:
+            Dict with summary, timeline, posts, sites and sources
+        """
+        cutoff = _cutoff_date(days)
+        # One source_monitoring scan feeds both the health counts and sources
+        facets = self._source_facets(cutoff)
+        return {
+            "period_days": days,
+            "summary": self._summary(cutoff, days, self._get_health_distribution(cutoff, facets)),
+            "timeline": list(self._timeline(cutoff)),
+            "posts": self._posts(cutoff),
+            "sites": self._sites(cutoff),
+            "sources": self._sources(cutoff, facets)
+        }
+    
+    @_ttl_cached()
     def get_dashboard_summary(self, days: int = 30) -> Dict:
         """
         Get high-level dashboard summary
@@ -33,34 +187,52 @@ class AnalyticsEngine:
         Returns:
             Dict with summary metrics
         """
-        cutoff_date = (datetime.utcnow() - timedelta(days=days)).strftime("%Y-%m-%d")
-        
-        # Get data from fingerprints (actual link tracking data)
-        total_links = self.db["fingerprints"].count_documents({
-            "date_iso": {"$gte": cutoff_date}
-        })
-        
-        # Active posts (posts that have fingerprints in period)
-        active_posts = len(self.db["fingerprints"].distinct("post_id", {
-            "date_iso": {"$gte": cutoff_date}
-        }))
-        
-        # Get unique dates with updates
-        unique_dates = len(self.db["fingerprints"].distinct("date_iso", {
-            "date_iso": {"$gte": cutoff_date}
-        }))
-        
-        # Check if update_history exists and has data
-        update_history_count = self.db["update_history"].count_documents({})
-        if update_history_count > 0:
+        return self._summary(_cutoff_date(days), days)
+    
+    def _summary(self, cutoff: datetime, days: int, health_counts: Optional[Dict[str, int]] = None) -> Dict:
+        cutoff_date = cutoff.strftime("%Y-%m-%d")
+        
+        # Single pass over fingerprints: link count, active posts and unique dates
+        fingerprint_pipeline = [
+            {"$match": {**_fingerprint_window(cutoff), **_LINK_DOCS}},
+            {"$group": {
+                "_id": None,
+                "total_links": {"$sum": _LINK_COUNT},
+                "posts": {"$addToSet": "$post_id"},
+                "dates": {"$addToSet": "$date_iso"}
+            }},
+            {"$project": {
+                "total_links": 1,
+                "active_posts": {"$size": "$posts"},
+                "unique_dates": {"$size": "$dates"}
+            }}
+        ]
+        fingerprint_stats = next(self.db["fingerprints"].aggregate(fingerprint_pipeline, **_CURSOR_OPTIONS), {})
+        total_links = fingerprint_stats.get("total_links", 0)
+        active_posts = fingerprint_stats.get("active_posts", 0)
+        unique_dates = fingerprint_stats.get("unique_dates", 0)
+        
+        # update_history totals in one round-trip ("any" tells us if history exists at all).
+        # History records only carry the ISO date string, so match on date_iso here.
+        history_pipeline = [
+            {"$facet": {
+                "any": [{"$limit": 1}, {"$count": "n"}],
+                "total": [
+                    {"$match": {"date_iso": {"$gte": cutoff_date}}},
+                    {"$count": "n"}
+                ],
+                "successful": [
+                    {"$match": {"date_iso": {"$gte": cutoff_date}, "status": "success"}},
+                    {"$count": "n"}
+                ]
+            }}
+        ]
+        history_stats = next(self.db["update_history"].aggregate(history_pipeline, **_CURSOR_OPTIONS), {})
+        
+        if history_stats.get("any"):
             # Use update_history if available
-            total_updates = self.db["update_history"].count_documents({
-                "date_iso": {"$gte": cutoff_date}
-            })
-            successful_updates = self.db["update_history"].count_documents({
-                "date_iso": {"$gte": cutoff_date},
-                "status": "success"
-            })
+            total_updates = _facet_count(history_stats, "total")
+            successful_updates = _facet_count(history_stats, "successful")
         else:
             # Estimate from fingerprints
             total_updates = unique_dates * active_posts if active_posts > 0 else 0
@@ -69,8 +241,9 @@ class AnalyticsEngine:
         success_rate = (successful_updates / total_updates * 100) if total_updates > 0 else 0
         avg_links = total_links / total_updates if total_updates > 0 else 0
         
-        # Current health status
-        health_counts = self._get_health_distribution()
+        # Current health status (passed in when the caller already scanned source_monitoring)
+        if health_counts is None:
+            health_counts = self._get_health_distribution(cutoff)
         
         return {
             "period_days": days,
@@ -84,6 +257,7 @@ class AnalyticsEngine:
             "health_distribution": health_counts
         }
     
+    @_ttl_cached()
     def get_update_timeline(self, days: int = 30, granularity: str = "daily") -> List[Dict]:
         """
         Get timeline of updates over period
@@ -95,35 +269,63 @@ class AnalyticsEngine:
         Returns:
             List of data points with date, success, failed counts
         """
-        cutoff_date = (datetime.utcnow() - timedelta(days=days)).strftime("%Y-%m-%d")
-        
-        # Aggregate fingerprints by date
+        return list(self.iter_update_timeline(days, granularity))
+    
+    def iter_update_timeline(self, days: int = 30, granularity: str = "daily") -> Iterator[Dict]:
+        """Yield timeline data points as the cursor delivers them (uncached, for streaming)"""
+        return self._timeline(_cutoff_date(days), granularity)
+    
+    def _timeline(self, cutoff: datetime, granularity: str = "daily") -> Iterator[Dict]:
+        # Bucket server-side so coarser views return fewer rows
+        if granularity == "hourly":
+            # Links counted against the hour they were written (`hour` is
+            # already truncated when the rollup is stored)
+            collection = "hourly_rollups"
+            match = {"date": {"$gte": cutoff}}
+            bucket = {"$dateToString": {"format": "%Y-%m-%dT%H:00", "date": "$hour"}}
+            links = "$links_added"
+        elif granularity == "weekly":
+            collection = "daily_rollups"
+            match = {"date": {"$gte": cutoff}}
+            bucket = {"$dateToString": {
+                "format": "%Y-%m-%d",
+                "date": {"$dateTrunc": {"date": "$date", "unit": "week", "startOfWeek": "monday"}}
+            }}
+            links = "$links_added"
+        else:
+            # Aggregate the pre-computed daily rollups (one doc per date/site/post)
+            collection = "daily_rollups"
+            match = {"date": {"$gte": cutoff}}
+            bucket = "$date_iso"
+            links = "$links_added"
+        
+        # Distinct posts per bucket via two $groups: each intermediate doc is one
+        # (bucket, post) pair rather than an ever-growing $addToSet array
         pipeline = [
-            {"$match": {"date_iso": {"$gte": cutoff_date}}},
+            {"$match": match},
             {"$group": {
-                "_id": "$date_iso",
-                "total_links": {"$sum": 1},
-                "unique_posts": {"$addToSet": "$post_id"}
+                "_id": {"bucket": bucket, "post": "$post_id"},
+                "links": {"$sum": links}
             }},
-            {"$project": {
-                "date": "$_id",
-                "total_links": 1,
-                "posts_updated": {"$size": "$unique_posts"}
+            {"$group": {
+                "_id": "$_id.bucket",
+                "posts_updated": {"$sum": 1},
+                "total_links": {"$sum": "$links"}
             }},
             {"$sort": {"_id": 1}}
         ]
         
-        results = list(self.db["fingerprints"].aggregate(pipeline))
-        
-        return [{
-            "date": r["_id"],
-            "total_updates": r.get("posts_updated", 0),
-            "successful": r.get("posts_updated", 0),
-            "failed": 0,
-            "total_links": r.get("total_links", 0),
-            "success_rate": 100.0
-        } for r in results]
+        for r in self.db[collection].aggregate(pipeline, **_CURSOR_OPTIONS):
+            posts_updated = r.get("posts_updated", 0)
+            yield {
+                **_TIMELINE_SUCCESS_FIELDS,
+                "date": r["_id"],
+                "total_updates": posts_updated,
+                "successful": posts_updated,
+                "total_links": r.get("total_links", 0)
+            }
     
+    @_ttl_cached()
     def get_post_performance(self, days: int = 30) -> List[Dict]:
         """
         Get performance metrics per post
@@ -134,43 +336,64 @@ class AnalyticsEngine:
         Returns:
             List of posts with their performance metrics
         """
-        cutoff_date = (datetime.utcnow() - timedelta(days=days)).strftime("%Y-%m-%d")
-        
+        return self._posts(_cutoff_date(days))
+    
+    def _posts(self, cutoff: datetime) -> List[Dict]:
         pipeline = [
-            {"$match": {"date_iso": {"$gte": cutoff_date}}},
+            {"$match": {**_fingerprint_window(cutoff), **_LINK_DOCS}},
+            # One doc per (post, day), so counting them gives the distinct update days
             {"$group": {
-                "_id": "$post_id",
-                "total_links_added": {"$sum": 1},
-                "unique_dates": {"$addToSet": "$date_iso"},
+                "_id": {"post": "$post_id", "date": "$date_iso"},
+                "links": {"$sum": _LINK_COUNT},
                 "sites": {"$addToSet": "$site_key"}
             }},
+            {"$group": {
+                "_id": "$_id.post",
+                "total_updates": {"$sum": 1},
+                "total_links_added": {"$sum": "$links"},
+                "sites": {"$push": "$sites"}
+            }},
             {"$project": {
                 "post_id": "$_id",
-                "total_updates": {"$size": "$unique_dates"},
-                "successful_updates": {"$size": "$unique_dates"},
+                "total_updates": 1,
                 "total_links_added": 1,
-                "sites_count": {"$size": "$sites"}
+                # A post is published to a handful of sites, so the union stays tiny
+                "sites_count": {"$size": {"$reduce": {
+                    "input": "$sites",
+                    "initialValue": [],
+                    "in": {"$setUnion": ["$$value", "$$this"]}
+                }}}
             }},
-            {"$sort": {"total_links_added": -1}}
+            {"$sort": {"total_links_added": -1}},
+            # Join the slug for just the posts in the result (indexed on posts.post_id)
+            {"$lookup": {
+                "from": "posts",
+                "localField": "_id",
+                "foreignField": "post_id",
+                "pipeline": [{"$project": {"content_slug": 1, "_id": 0}}],
+                "as": "cfg"
+            }},
+            {"$addFields": {"content_slug": {"$ifNull": [
+                {"$arrayElemAt": ["$cfg.content_slug", 0]},
+                {"$concat": ["Post ", {"$toString": "$_id"}]}
+            ]}}},
+            {"$project": {"cfg": 0}}
         ]
         
-        results = list(self.db["fingerprints"].aggregate(pipeline))
-        
-        # Get post configs to add post info
-        post_configs = {p["post_id"]: p for p in self.db["posts"].find({}, {"post_id": 1, "content_slug": 1})}
+        cursor = self.db["fingerprints"].aggregate(pipeline, **_CURSOR_OPTIONS)
         
         return [{
+            **_POST_SUCCESS_FIELDS,
             "post_id": r["post_id"],
-            "content_slug": post_configs.get(r["post_id"], {}).get("content_slug", f"Post {r['post_id']}"),
+            "content_slug": r["content_slug"],
             "total_updates": r["total_updates"],
-            "successful_updates": r["successful_updates"],
-            "failed_updates": 0,
-            "success_rate": 100.0,
+            "successful_updates": r["total_updates"],
             "total_links_added": r["total_links_added"],
             "avg_links_per_update": round(r["total_links_added"] / r["total_updates"], 2) if r["total_updates"] > 0 else 0,
             "sites_count": r.get("sites_count", 1)
-        } for r in results]
+        } for r in cursor]
     
+    @_ttl_cached()
     def get_source_performance(self, days: int = 30) -> List[Dict]:
         """
         Get performance metrics per source URL
@@ -181,23 +404,16 @@ class AnalyticsEngine:
         Returns:
             List of sources with their metrics
         """
-        cutoff = datetime.utcnow() - timedelta(days=days)
-        
-        # Get all source monitoring data
-        sources = list(self.db["source_monitoring"].find({}))
-        
+        return self._sources(_cutoff_date(days))
+    
+    def _sources(self, cutoff: datetime, facets: Optional[Dict[str, List[Dict]]] = None) -> List[Dict]:
+        if facets is None:
+            facets = self._source_facets(cutoff)
         source_data = []
-        for source in sources:
-            # Calculate recent performance
-            recent_history = source.get("extraction_history", [])
-            recent_history = [h for h in recent_history if datetime.fromisoformat(h["date"]) >= cutoff]
-            
-            if not recent_history:
-                continue
-            
-            total = len(recent_history)
-            successful = sum(1 for h in recent_history if h.get("success", False))
-            total_links = sum(h.get("links_found", 0) for h in recent_history)
+        for source in facets["detail"]:
+            total = source["total"]
+            successful = source["successful"]
+            total_links = source["total_links"]
             
             source_data.append({
                 "source_url": source["source_url"],
@@ -212,11 +428,9 @@ class AnalyticsEngine:
                 "last_success": source.get("last_success")
             })
         
-        # Sort by total extractions
-        source_data.sort(key=lambda x: x["total_extractions"], reverse=True)
-        
         return source_data
     
+    @_ttl_cached()
     def get_extractor_performance(self, days: int = 30) -> List[Dict]:
         """
         Get performance metrics per extractor type
@@ -227,46 +441,48 @@ class AnalyticsEngine:
         Returns:
             List of extractors with their metrics
         """
-        # Get all post configs with extractors
-        posts = list(self.db["posts"].find({}, {"post_id": 1, "extractor": 1, "extractor_map": 1}))
+        cutoff = _cutoff_date(days)
         
-        # Count usage per extractor
-        extractor_stats = defaultdict(lambda: {
-            "posts_using": set(),
-            "total_links": 0
-        })
-        
-        cutoff_date = (datetime.utcnow() - timedelta(days=days)).strftime("%Y-%m-%d")
-        
-        for post in posts:
-            extractor = post.get("extractor", "default")
-            
-            # Get fingerprints for this post
-            links_count = self.db["fingerprints"].count_documents({
-                "post_id": post["post_id"],
-                "date_iso": {"$gte": cutoff_date}
-            })
-            
-            if links_count > 0:
-                extractor_stats[extractor]["posts_using"].add(post["post_id"])
-                extractor_stats[extractor]["total_links"] += links_count
+        # Join each post to its link count in the window and group by
+        # extractor in a single round-trip (instead of one count per post)
+        pipeline = [
+            {"$project": {"post_id": 1, "extractor": 1}},
+            {"$lookup": {
+                "from": "fingerprints",
+                "let": {"pid": "$post_id"},
+                "pipeline": [
+                    {"$match": {
+                        "$expr": {"$eq": ["$post_id", "$$pid"]},
+                        **_fingerprint_window(cutoff),
+                        **_LINK_DOCS
+                    }},
+                    {"$group": {"_id": None, "n": {"$sum": _LINK_COUNT}}}
+                ],
+                "as": "fp"
+            }},
+            {"$addFields": {"links_count": {"$ifNull": [{"$arrayElemAt": ["$fp.n", 0]}, 0]}}},
+            {"$match": {"links_count": {"$gt": 0}}},
+            {"$group": {
+                "_id": {"$ifNull": ["$extractor", "default"]},
+                "posts_using": {"$sum": 1},
+                "total_links": {"$sum": "$links_count"}
+            }}
+        ]
         
         # Format results
-        results = []
-        for extractor, stats in extractor_stats.items():
-            posts_count = len(stats["posts_using"])
-            results.append({
-                "extractor": extractor,
-                "posts_using": posts_count,
-                "total_links_extracted": stats["total_links"],
-                "avg_links_per_post": round(stats["total_links"] / posts_count, 2) if posts_count > 0 else 0
-            })
+        results = [{
+            "extractor": r["_id"],
+            "posts_using": r["posts_using"],
+            "total_links_extracted": r["total_links"],
+            "avg_links_per_post": round(r["total_links"] / r["posts_using"], 2) if r["posts_using"] > 0 else 0
+        } for r in self.db["posts"].aggregate(pipeline, **_CURSOR_OPTIONS)]
         
         # Sort by posts using
         results.sort(key=lambda x: x["posts_using"], reverse=True)
         
         return results
     
+    @_ttl_cached()
     def get_site_performance(self, days: int = 30) -> List[Dict]:
         """
         Get performance metrics per WordPress site
@@ -277,23 +493,22 @@ class AnalyticsEngine:
         Returns:
             List of sites with their metrics
         """
-        cutoff_date = (datetime.utcnow() - timedelta(days=days)).strftime("%Y-%m-%d")
-        
+        return self._sites(_cutoff_date(days))
+    
+    def _sites(self, cutoff: datetime) -> List[Dict]:
         # Get all fingerprints grouped by site_key
         pipeline = [
-            {"$match": {"date_iso": {"$gte": cutoff_date}}},
+            {"$match": {**_fingerprint_window(cutoff), **_LINK_DOCS}},
             {"$group": {
                 "_id": "$site_key",
-                "total_links": {"$sum": 1},
+                "total_links": {"$sum": _LINK_COUNT},
                 "unique_posts": {"$addToSet": "$post_id"}
             }},
             {"$sort": {"total_links": -1}}
         ]
         
-        results = list(self.db["fingerprints"].aggregate(pipeline))
-        
         site_data = []
-        for r in results:
+        for r in self.db["fingerprints"].aggregate(pipeline, **_CURSOR_OPTIONS):
             site_key = r["_id"] or "default"
             posts_count = len(r["unique_posts"])
             
@@ -325,6 +540,7 @@ class AnalyticsEngine:
             "failed": 0
         } for hour in range(24)]
     
+    @_ttl_cached()
     def get_links_added_trend(self, days: int = 30) -> List[Dict]:
         """
         Get daily trend of links added
@@ -335,13 +551,13 @@ class AnalyticsEngine:
         Returns:
             List of daily data points with links added count
         """
-        cutoff_date = (datetime.utcnow() - timedelta(days=days)).strftime("%Y-%m-%d")
+        cutoff = _cutoff_date(days)
         
         pipeline = [
-            {"$match": {"date_iso": {"$gte": cutoff_date}}},
+            {"$match": {"date": {"$gte": cutoff}}},
             {"$group": {
                 "_id": {"date": "$date_iso", "site": "$site_key"},
-                "count": {"$sum": 1}
+                "count": {"$sum": "$links_added"}
             }},
             {"$group": {
                 "_id": "$_id.date",
@@ -351,23 +567,64 @@ class AnalyticsEngine:
             {"$sort": {"_id": 1}}
         ]
         
-        results = list(self.db["fingerprints"].aggregate(pipeline))
-        
         return [{
             "date": r["_id"],
             "total_links": r["total_links"],
             "by_site": r["by_site"]
-        } for r in results]
+        } for r in self.db["daily_rollups"].aggregate(pipeline, **_CURSOR_OPTIONS)]
     
-    def _get_health_distribution(self) -> Dict[str, int]:
-        """Get count of sources by health status"""
-        sources = list(self.db["source_monitoring"].find({}))
+    def _source_facets(self, cutoff: datetime) -> Dict[str, List[Dict]]:
+        """
+        Scan source_monitoring once for both health counts and per-source totals
         
+        Returns:
+            {"health": [{_id: status, n}], "detail": [per-source window totals]}
+        """
+        # History dates are ISO strings, so an ISO cutoff compares correctly server-side
+        cutoff_iso = cutoff.isoformat()
+        
+        pipeline = [{"$facet": {
+            # Bucket and count in Mongo so at most five rows come back
+            "health": [
+                {"$project": {"status": _HEALTH_STATUS_EXPR}},
+                {"$group": {"_id": "$status", "n": {"$sum": 1}}}
+            ],
+            # Filter each source's history to the window and reduce it in Mongo,
+            # so only per-source totals come back over the wire
+            "detail": [
+                {"$project": {
+                    "source_url": 1,
+                    "consecutive_failures": 1,
+                    "total_extractions": 1,
+                    "successful_extractions": 1,
+                    "last_success": 1,
+                    "recent": {"$filter": {
+                        "input": {"$ifNull": ["$extraction_history", []]},
+                        "as": "h",
+                        "cond": {"$gte": ["$$h.date", cutoff_iso]}
+                    }}
+                }},
+                {"$addFields": {
+                    "total": {"$size": "$recent"},
+                    "successful": {"$size": {"$filter": {"input": "$recent", "as": "h", "cond": "$$h.success"}}},
+                    "total_links": {"$sum": "$recent.links_found"}
+                }},
+                {"$match": {"total": {"$gt": 0}}},
+                {"$project": {"recent": 0}},
+                {"$sort": {"total": -1}}
+            ]
+        }}]
+        
+        return next(self.db["source_monitoring"].aggregate(pipeline, **_CURSOR_OPTIONS), {"health": [], "detail": []})
+    
+    def _get_health_distribution(self, cutoff: datetime, facets: Optional[Dict[str, List[Dict]]] = None) -> Dict[str, int]:
+        """Get count of sources by health status"""
+        if facets is None:
+            facets = self._source_facets(cutoff)
         distribution = {"healthy": 0, "warning": 0, "failing": 0, "critical": 0, "unknown": 0}
         
-        for source in sources:
-            status = self._determine_health_status(source)
-            distribution[status] += 1
+        for row in facets["health"]:
+            distribution[row["_id"]] = row["n"]
         
         return distribution
     
@@ -399,5 +656,11 @@ def get_analytics_engine() -> AnalyticsEngine:
     """Get or create the analytics engine singleton"""
     global _analytics_engine
     if _analytics_engine is None:
-        _analytics_engine = AnalyticsEngine()
+        _analytics_engine = AnalyticsEngine(storage=_get_storage())
     return _analytics_engine
+
+
+def invalidate_analytics_cache(prefix: str = ""):
+    """Invalidate cached analytics after new data is written (no-op before first use)"""
+    if _analytics_engine is not None:
+        _analytics_engine.invalidate(prefix)
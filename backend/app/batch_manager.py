@@ -11,11 +11,13 @@ Now uses MongoDB for persistent storage instead of in-memory storage.
 """
 
 import uuid
+import time
 import asyncio
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 from enum import Enum
-import pytz
+from zoneinfo import ZoneInfo
 
 from . import mongo_storage
 
@@ -29,8 +31,44 @@ class UpdateStatus(str, Enum):
     FAILED = "failed"
 
 
+IST = ZoneInfo("Asia/Kolkata")
+# IST has no DST, so log timestamps can be computed from a fixed offset
+IST_OFFSET_SECONDS = 5 * 3600 + 30 * 60
+
+
+def _ist_clock() -> str:
+    """Current IST wall-clock time as HH:MM:SS"""
+    seconds = int(time.time() + IST_OFFSET_SECONDS) % 86400
+    hours, rem = divmod(seconds, 3600)
+    minutes, seconds = divmod(rem, 60)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+
+
+# Per-post statuses after which no further progress ticks are expected
+TERMINAL_STATUSES = (UpdateStatus.SUCCESS, UpdateStatus.NO_CHANGES, UpdateStatus.FAILED)
+
+# Number of log lines kept visible per post (log_count and the logs endpoint are capped at this)
+MAX_LOG_LINES = 100
+
+# Maximum number of batch requests kept in memory (least recently used are evicted)
+CACHE_SIZE = 128
+
+# Minimum seconds between MongoDB writes of the same request (<= 10 writes/sec)
+FLUSH_INTERVAL = 0.1
+
+
+# Sentinel so that fields never saved always compare as dirty
+_UNSAVED = object()
+
+
 class PostUpdateState:
     """State for a single post update"""
+    __slots__ = (
+        "post_id", "status", "progress", "message", "links_found", "links_added",
+        "error", "started_at", "completed_at", "log_count", "_saved", "_unsaved_logs",
+        "_legacy_logs",
+    )
+    
     def __init__(self, post_id: int):
         self.post_id = post_id
         self.status = UpdateStatus.QUEUED
@@ -41,7 +79,30 @@ class PostUpdateState:
         self.error: Optional[str] = None
         self.started_at: Optional[str] = None
         self.completed_at: Optional[str] = None
-        self.logs: List[str] = []
+        self.log_count = 0
+        # Change tracking for partial MongoDB updates; log lines wait here as
+        # (ts, line) until the next save appends them to the batch_logs collection
+        self._saved: Dict[str, Any] = {}
+        self._unsaved_logs: List[Tuple[datetime, str]] = []
+        # Requests saved before batch_logs existed embed their lines in the post document
+        self._legacy_logs: Optional[List[str]] = None
+    
+    @classmethod
+    def from_dict(cls, post_id: int, data: Dict[str, Any]) -> "PostUpdateState":
+        """Rebuild a post state from its MongoDB sub-document"""
+        state = cls(post_id)
+        state.status = data["status"]
+        state.progress = data["progress"]
+        state.message = data["message"]
+        state.links_found = data["links_found"]
+        state.links_added = data["links_added"]
+        state.error = data.get("error")
+        state.started_at = data.get("started_at")
+        state.completed_at = data.get("completed_at")
+        state.log_count = data.get("log_count", 0)
+        if "logs" in data:
+            state._legacy_logs = list(data["logs"] or ())[-MAX_LOG_LINES:]
+        return state
     
     def to_dict(self):
         return {
@@ -54,24 +115,47 @@ class PostUpdateState:
             "error": self.error,
             "started_at": self.started_at,
             "completed_at": self.completed_at,
-            "log_count": len(self.logs)
+            "log_count": self.log_count
         }
     
     def add_log(self, message: str):
-        timestamp = datetime.now(pytz.timezone("Asia/Kolkata")).strftime("%H:%M:%S")
-        self.logs.append(f"[{timestamp}] {message}")
-        # Keep only last 100 log lines
-        if len(self.logs) > 100:
-            self.logs = self.logs[-100:]
+        self._unsaved_logs.append((datetime.utcnow(), f"[{_ist_clock()}] {message}"))
+        self.log_count = min(self.log_count + 1, MAX_LOG_LINES)
+    
+    def dirty_fields(self) -> Dict[str, Any]:
+        """Fields whose value changed since the last save"""
+        return {
+            field: value
+            for field, value in self.to_dict().items()
+            if self._saved.get(field, _UNSAVED) != value
+        }
+    
+    def is_legacy(self) -> bool:
+        """True for posts saved before log lines moved to the batch_logs collection"""
+        return self._legacy_logs is not None
+    
+    def pending_logs(self) -> List[str]:
+        """Log lines not yet written to MongoDB"""
+        return [line for _, line in self._unsaved_logs]
+    
+    def mark_saved(self):
+        """Record the current state as persisted"""
+        self._saved = self.to_dict()
+        self._unsaved_logs = []
 
 
 class BatchUpdateRequest:
     """Manages a batch update request"""
+    __slots__ = (
+        "request_id", "post_ids", "initiator", "created_at", "started_at",
+        "completed_at", "posts", "overall_status", "_persisted", "_saved",
+    )
+    
     def __init__(self, request_id: str, post_ids: List[int], initiator: str = "unknown"):
         self.request_id = request_id
         self.post_ids = post_ids
         self.initiator = initiator
-        self.created_at = datetime.now(pytz.timezone("Asia/Kolkata")).isoformat()
+        self.created_at = datetime.now(IST).isoformat()
         self.started_at: Optional[str] = None
         self.completed_at: Optional[str] = None
         self.posts: Dict[int, PostUpdateState] = {
@@ -79,14 +163,41 @@ class BatchUpdateRequest:
             for post_id in post_ids
         }
         self.overall_status = UpdateStatus.QUEUED
+        self._persisted = False
+        self._saved: Dict[str, Any] = {}
+    
+    @classmethod
+    def from_dict(cls, req_data: Dict[str, Any]) -> Optional["BatchUpdateRequest"]:
+        """Rebuild a request from its MongoDB document (None if it has no posts)"""
+        stored_posts = req_data.get("posts", {})
+        # Handle backward compatibility: old batch requests don't have post_ids
+        post_ids = req_data.get("post_ids") or [int(pid) for pid in stored_posts]
+        if not post_ids:
+            return None
+        
+        request = cls(
+            request_id=req_data["request_id"],
+            post_ids=post_ids,
+            initiator=req_data.get("initiator", "unknown")
+        )
+        request.created_at = req_data["created_at"]
+        request.started_at = req_data.get("started_at")
+        request.completed_at = req_data.get("completed_at")
+        request.overall_status = req_data["overall_status"]
+        for post_id_str, state_data in stored_posts.items():
+            post_id = int(post_id_str)
+            request.posts[post_id] = PostUpdateState.from_dict(post_id, state_data)
+        
+        request.mark_saved()
+        return request
     
     def start(self):
-        self.started_at = datetime.now(pytz.timezone("Asia/Kolkata")).isoformat()
+        self.started_at = datetime.now(IST).isoformat()
         self.overall_status = UpdateStatus.RUNNING
         self._save_to_db()  # Persist to MongoDB
     
     def complete(self):
-        self.completed_at = datetime.now(pytz.timezone("Asia/Kolkata")).isoformat()
+        self.completed_at = datetime.now(IST).isoformat()
         
         # Determine overall status
         statuses = [p.status for p in self.posts.values()]
@@ -120,60 +231,63 @@ class BatchUpdateRequest:
             }
         }
     
+    def _summary_fields(self) -> Dict[str, Any]:
+        return {
+            "started_at": self.started_at,
+            "completed_at": self.completed_at,
+            "overall_status": self.overall_status,
+        }
+    
+    def mark_saved(self):
+        """Record the current state (including every post) as persisted"""
+        self._persisted = True
+        self._saved = self._summary_fields()
+        for state in self.posts.values():
+            state.mark_saved()
+    
     def _save_to_db(self):
-        """Save current state to MongoDB"""
-        mongo_storage.save_batch_request(self.to_dict())
+        """Save current state to MongoDB (full document once, then only changed fields)"""
+        if not self._persisted:
+            mongo_storage.save_batch_request(self.to_dict())
+        else:
+            set_fields = {
+                field: value
+                for field, value in self._summary_fields().items()
+                if self._saved.get(field, _UNSAVED) != value
+            }
+            for post_id, state in self.posts.items():
+                for field, value in state.dirty_fields().items():
+                    set_fields[f"posts.{post_id}.{field}"] = value
+            if set_fields:
+                mongo_storage.update_batch_request(self.request_id, set_fields)
+        
+        # Logs live in their own append-only collection, not in the request document
+        log_docs = [
+            {"request_id": self.request_id, "post_id": post_id, "ts": ts, "line": line}
+            for post_id, state in self.posts.items()
+            for ts, line in state._unsaved_logs
+        ]
+        if log_docs:
+            mongo_storage.append_batch_logs(log_docs)
+        self.mark_saved()
 
 
 class BatchUpdateManager:
     """Global manager for batch update requests with MongoDB persistence"""
     def __init__(self):
         self._lock = asyncio.Lock()
-        # Load recent requests from MongoDB into memory for faster access
-        self._cache: Dict[str, BatchUpdateRequest] = {}
-        self._load_recent_requests()
-    
-    def _load_recent_requests(self):
-        """Load recent requests from MongoDB into cache"""
-        try:
-            recent = mongo_storage.get_recent_batch_requests(limit=50)
-            for req_data in recent:
-                request_id = req_data["request_id"]
-                # Reconstruct BatchUpdateRequest from MongoDB data
-                request = BatchUpdateRequest(
-                    request_id=request_id,
-                    post_ids=req_data["post_ids"],
-                    initiator=req_data.get("initiator", "unknown")
-                )
-                request.created_at = req_data["created_at"]
-                request.started_at = req_data.get("started_at")
-                request.completed_at = req_data.get("completed_at")
-                request.overall_status = req_data["overall_status"]
-                
-                # Reconstruct post states
-                for post_id_str, state_data in req_data.get("posts", {}).items():
-                    post_id = int(post_id_str)
-                    state = PostUpdateState(post_id)
-                    state.status = state_data["status"]
-                    state.progress = state_data["progress"]
-                    state.message = state_data["message"]
-                    state.links_found = state_data["links_found"]
-                    state.links_added = state_data["links_added"]
-                    state.error = state_data.get("error")
-                    state.started_at = state_data.get("started_at")
-                    state.completed_at = state_data.get("completed_at")
-                    state.logs = state_data.get("logs", [])
-                    request.posts[post_id] = state
-                
-                self._cache[request_id] = request
-        except Exception as e:
-            print(f"Error loading recent requests from MongoDB: {e}")
+        # Populated lazily by get_request/create_request; nothing is read from MongoDB up front
+        self._cache: "OrderedDict[str, BatchUpdateRequest]" = OrderedDict()
+        # Progress ticks mark a request dirty; writes are coalesced to FLUSH_INTERVAL
+        self._dirty: Set[str] = set()
+        self._last_flush: Dict[str, float] = {}
+        self._flush_tasks: Set[asyncio.Task] = set()
     
     def create_request(self, post_ids: List[int], initiator: str = "unknown") -> BatchUpdateRequest:
         """Create a new batch update request and persist to MongoDB"""
         request_id = str(uuid.uuid4())
         request = BatchUpdateRequest(request_id, post_ids, initiator)
-        self._cache[request_id] = request
+        self._cache_put(request)
         
         # Save to MongoDB
         request._save_to_db()
@@ -183,54 +297,41 @@ class BatchUpdateManager:
         
         return request
     
+    def _cache_put(self, request: BatchUpdateRequest):
+        """Insert a request as most recently used, evicting the oldest past CACHE_SIZE"""
+        self._cache[request.request_id] = request
+        self._cache.move_to_end(request.request_id)
+        while len(self._cache) > CACHE_SIZE:
+            evicted_id, evicted = self._cache.popitem(last=False)
+            if evicted_id in self._dirty:
+                self._flush(evicted)
+            self._last_flush.pop(evicted_id, None)
+    
     def get_request(self, request_id: str) -> Optional[BatchUpdateRequest]:
         """Get request by ID (from cache or MongoDB)"""
         # Try cache first
-        if request_id in self._cache:
-            return self._cache[request_id]
+        request = self._cache.get(request_id)
+        if request is not None:
+            self._cache.move_to_end(request_id)
+            return request
         
         # Try MongoDB
         req_data = mongo_storage.get_batch_request(request_id)
-        if req_data:
-            # Handle backward compatibility: reconstruct post_ids from posts if missing
-            post_ids = req_data.get("post_ids")
-            if not post_ids and "posts" in req_data:
-                # Old batch requests don't have post_ids, extract from posts dict
-                post_ids = [int(pid) for pid in req_data["posts"].keys()]
-            elif not post_ids:
-                # No post_ids and no posts, cannot reconstruct
-                return None
-            
-            # Reconstruct and cache
-            request = BatchUpdateRequest(
-                request_id=request_id,
-                post_ids=post_ids,
-                initiator=req_data.get("initiator", "unknown")
-            )
-            request.created_at = req_data["created_at"]
-            request.started_at = req_data.get("started_at")
-            request.completed_at = req_data.get("completed_at")
-            request.overall_status = req_data["overall_status"]
-            
-            # Reconstruct post states
-            for post_id_str, state_data in req_data.get("posts", {}).items():
-                post_id = int(post_id_str)
-                state = PostUpdateState(post_id)
-                state.status = state_data["status"]
-                state.progress = state_data["progress"]
-                state.message = state_data["message"]
-                state.links_found = state_data["links_found"]
-                state.links_added = state_data["links_added"]
-                state.error = state_data.get("error")
-                state.started_at = state_data.get("started_at")
-                state.completed_at = state_data.get("completed_at")
-                state.logs = state_data.get("logs", [])
-                request.posts[post_id] = state
-            
-            self._cache[request_id] = request
-            return request
+        request = BatchUpdateRequest.from_dict(req_data) if req_data else None
+        if request is not None:
+            self._cache_put(request)
+        return request
+    
+    def get_logs(self, request_id: str, post_id: int, tail: int = MAX_LOG_LINES) -> Optional[List[str]]:
+        """Last `tail` log lines for a post (up to MAX_LOG_LINES if tail <= 0), including unsaved ones"""
+        state = self.get_post_state(request_id, post_id)
+        if not state:
+            return None
         
-        return None
+        tail = min(tail, MAX_LOG_LINES) if tail > 0 else MAX_LOG_LINES
+        logs = (state._legacy_logs or []) + mongo_storage.get_batch_logs(request_id, post_id, tail=tail)
+        logs.extend(state.pending_logs())
+        return logs[-tail:]
     
     def get_post_state(self, request_id: str, post_id: int) -> Optional[PostUpdateState]:
         """Get state for a specific post in a request"""
@@ -264,9 +365,9 @@ class BatchUpdateManager:
             if status is not None:
                 state.status = status
                 if status == UpdateStatus.RUNNING and not state.started_at:
-                    state.started_at = datetime.now(pytz.timezone("Asia/Kolkata")).isoformat()
+                    state.started_at = datetime.now(IST).isoformat()
                 elif status in [UpdateStatus.SUCCESS, UpdateStatus.NO_CHANGES, UpdateStatus.FAILED] and not state.completed_at:
-                    state.completed_at = datetime.now(pytz.timezone("Asia/Kolkata")).isoformat()
+                    state.completed_at = datetime.now(IST).isoformat()
             
             if progress is not None:
                 state.progress = progress
@@ -281,8 +382,37 @@ class BatchUpdateManager:
             if log_message is not None:
                 state.add_log(log_message)
             
-            # Persist to MongoDB
-            request._save_to_db()
+            # Persist to MongoDB: terminal states immediately, progress ticks debounced
+            if status in TERMINAL_STATUSES:
+                self._flush(request)
+            elif request_id not in self._dirty:
+                self._dirty.add(request_id)
+                task = asyncio.create_task(self._maybe_flush(request_id))
+                self._flush_tasks.add(task)
+                task.add_done_callback(self._flush_tasks.discard)
+    
+    def _flush(self, request: BatchUpdateRequest):
+        """Write a request to MongoDB and clear its dirty flag"""
+        self._dirty.discard(request.request_id)
+        self._last_flush[request.request_id] = time.monotonic()
+        request._save_to_db()
+    
+    async def _maybe_flush(self, request_id: str):
+        """Flush a dirty request once FLUSH_INTERVAL has passed since its last write"""
+        elapsed = time.monotonic() - self._last_flush.get(request_id, 0.0)
+        if elapsed < FLUSH_INTERVAL:
+            await asyncio.sleep(FLUSH_INTERVAL - elapsed)
+        
+        if request_id not in self._dirty:
+            return  # Already written by a terminal update
+        request = self._cache.get(request_id)
+        if request is None:
+            self._dirty.discard(request_id)
+            return
+        try:
+            self._flush(request)
+        except Exception as e:
+            print(f"Error saving batch request {request_id} to MongoDB: {e}")
 
 
 # Global instance
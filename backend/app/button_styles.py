@@ -4,7 +4,17 @@ Provides a modular system for customizing button appearance per site.
 Each style defines CSS properties and hover effects.
 """
 
-from typing import Dict, Any
+import hashlib
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping
+
+
+# Characters that may follow a leading number ("01.", "1+", "2-", "3)", "4:")
+_NUMBER_SUFFIXES = ".+-):"
+
+# "00. " .. "99. " numbering prefixes, indexed by link order
+_PREFIXES = tuple(f"{i:02d}. " for i in range(100))
 
 
 # Predefined button style templates
@@ -244,20 +254,49 @@ BUTTON_STYLES = {
 }
 
 
-def get_button_style(style_name: str) -> Dict[str, Any]:
+def _css_declarations(css: Mapping[str, str]) -> str:
+    """Join a CSS property dict into an inline style string."""
+    return "; ".join([f"{k}: {v}" for k, v in css.items()])
+
+
+def _render_style_strings(style: Mapping[str, Any]) -> Dict[str, str]:
+    """Build the inline CSS and hover handler strings for one style.
+    
+    Standard buttons strip dashes from hover property names while the split
+    layout camel-cases them; both forms are kept as they are emitted today.
+    """
+    css = style["css"]
+    hover = style["hover"]
+    strings = {"css_string": _css_declarations(css)}
+    
+    if style.get("layout_type") == "split":
+        strings["hover_over"] = "; ".join([f"this.style.{css_property_to_js(k)} = '{v}'" for k, v in hover.items()])
+        strings["hover_out"] = "; ".join([f"this.style.{css_property_to_js(k)} = '{css.get(k, '')}'" for k in hover.keys()])
+        strings["container_string"] = _css_declarations(style["container"])
+        strings["label_string"] = _css_declarations(style["label"])
+        strings["disabled_string"] = _css_declarations(style.get("disabled", {}))
+        strings["split_template"] = _split_layout_template(strings)
+    else:
+        strings["hover_over"] = "; ".join([f"this.style.{k.replace('-', '')} = '{v}'" for k, v in hover.items()])
+        strings["hover_out"] = "; ".join([f"this.style.{k.replace('-', '')} = '{css.get(k, '')}' " for k in hover.keys()])
+    
+    return strings
+
+
+def get_button_style(style_name: str) -> Mapping[str, Any]:
     """Get button style configuration by name.
     
     Args:
         style_name: Name of the style template (e.g., 'default', 'gradient_blue')
         
     Returns:
-        Dict containing style configuration with 'css' and 'hover' properties
+        Read-only mapping with the style's 'css' and 'hover' properties
     """
     return BUTTON_STYLES.get(style_name, BUTTON_STYLES["default"])
 
 
-def get_all_button_styles() -> Dict[str, Dict[str, Any]]:
-    """Get all available button style templates."""
+def get_all_button_styles() -> Mapping[str, Mapping[str, Any]]:
+    """Get all available button style templates (read-only view)."""
     return BUTTON_STYLES
 
 
@@ -272,10 +311,28 @@ def _title_has_leading_number(title: str) -> bool:
     Returns:
         True if title starts with a number pattern, False otherwise
     """
-    import re
-    # Match patterns: "01.", "1.", "1+", "10.", etc. at the start
-    pattern = r'^\s*\d+[\.\+\-\)\:]\s*'
-    return bool(re.match(pattern, title.strip()))
+    # Hand-rolled equivalent of re.match(r'^\s*\d+[.+\-):]', title):
+    # skip whitespace, require one or more digits, then one suffix character
+    text = title.lstrip()
+    n = len(text)
+    i = 0
+    while i < n and text[i].isdecimal():
+        i += 1
+    return 0 < i < n and text[i] in _NUMBER_SUFFIXES
+
+
+@lru_cache(maxsize=8192)
+def _format_button_text(title: str, order: int, numbering_mode: str) -> str:
+    """Apply the numbering mode to a title.
+    
+    - "always": Always add order number prefix
+    - "never": Never add order number prefix
+    - "auto": Only add number if title doesn't already have one
+    """
+    if numbering_mode == "never" or (numbering_mode != "always" and _title_has_leading_number(title)):
+        return title
+    prefix = _PREFIXES[order] if 0 <= order < 100 else f"{order:02d}. "
+    return prefix + title
 
 
 def generate_button_html(link: Dict[str, Any], style_name: str = "default", numbering_mode: str = "auto") -> str:
@@ -292,41 +349,56 @@ def generate_button_html(link: Dict[str, Any], style_name: str = "default", numb
     Returns:
         HTML string for the button within a WordPress column block
     """
+    out: List[str] = []
+    write_button_html(link, style_name, numbering_mode, out)
+    return "".join(out)
+
+
+def write_button_html(link: Dict[str, Any], style_name: str, numbering_mode: str, out: List[str]) -> None:
+    """Append button HTML to `out` instead of returning it.
+    
+    Page builders collect every fragment in one list and join once at the end.
+    Arguments are the same as generate_button_html.
+    """
+    out.append(_render_button_html(
+        link['url'],
+        link['title'],
+        link['order'],
+        link.get('target', '_blank'),
+        style_name,
+        numbering_mode,
+        link.get('button_text', 'Claim'),
+    ))
+
+
+@lru_cache(maxsize=4096)
+def _render_button_html(url: str, title: str, order: int, target: str, style_name: str,
+                        numbering_mode: str, claim_text: str) -> str:
+    """Render button HTML from primitive link fields.
+    
+    Pure function of its arguments (BUTTON_STYLES is static), so regenerating
+    a post's buttons reuses the HTML of links that have not changed.
+    `claim_text` is only used by split layout styles.
+    """
     style = get_button_style(style_name)
-    target = link.get('target', '_blank')
+    strings = _STYLE_STRINGS.get(style_name, _STYLE_STRINGS["default"])
     rel_attr = ' rel="noopener noreferrer"' if target == '_blank' else ''
     
     # Check if this is a split layout style
     if style.get("layout_type") == "split":
-        return _generate_split_layout_html(link, style, target, rel_attr, numbering_mode)
+        return _generate_split_layout_html(url, title, order, claim_text, strings, target, rel_attr, numbering_mode)
     
-    # Standard button layout (existing code)
-    # Convert CSS dict to inline style string
-    css_string = "; ".join([f"{k}: {v}" for k, v in style["css"].items()])
+    # Standard button layout: inline CSS and hover handlers are precomputed per style
+    css_string = strings["css_string"]
+    hover_over = strings["hover_over"]
+    hover_out = strings["hover_out"]
     
-    # Convert hover dict to onmouseover/onmouseout handlers
-    hover_over = "; ".join([f"this.style.{k.replace('-', '')} = '{v}'" for k, v in style["hover"].items()])
-    hover_out = "; ".join([f"this.style.{k.replace('-', '')} = '{style['css'].get(k, '')}' " for k in style["hover"].keys()])
-    
-    # Determine button text based on numbering mode
-    title = link['title']
-    if numbering_mode == "always":
-        # Always add order number
-        button_text = f"{link['order']:02d}. {title}"
-    elif numbering_mode == "never":
-        # Never add order number
-        button_text = title
-    else:  # "auto" (default)
-        # Only add order number if title doesn't already have one
-        if _title_has_leading_number(title):
-            button_text = title
-        else:
-            button_text = f"{link['order']:02d}. {title}"
+    button_text = _format_button_text(title, order, numbering_mode)
     
     button_html = f'''<!-- wp:column {{"width":"33.33%"}} -->
 <div class="wp-block-column" style="flex-basis:33.33%">
     <div style="margin: 15px 0;">
-        <a href="{link['url']}" target="{target}"{rel_attr} style="{css_string}" onmouseover="{hover_over}" onmouseout="{hover_out}">{button_text}</a>
+        <a href="{url}" target="{target}"{rel_attr} style="{css_string}" onmouseover="{hover_over}" onmouseout="{hover_out}">{button_text}</a>
     </div>
 </div>
 <!-- /wp:column -->'''
@@ -334,79 +406,24 @@ def generate_button_html(link: Dict[str, Any], style_name: str = "default", numb
     return button_html
 
 
-def _generate_split_layout_html(link: Dict[str, Any], style: Dict[str, Any], target: str, rel_attr: str, numbering_mode: str) -> str:
-    """Generate split layout HTML (text on left, button on right).
-    
-    Args:
-        link: Dict with 'url', 'title', 'order', and optional 'target'
-        style: Style configuration dict
-        target: Link target attribute
-        rel_attr: Link rel attribute
-        numbering_mode: How to handle button numbering
-        
-    Returns:
-        HTML string for the split layout button
-    """
-    # Container styles
-    container_string = "; ".join([f"{k}: {v}" for k, v in style["container"].items()])
-    
-    # Label styles
-    label_string = "; ".join([f"{k}: {v}" for k, v in style["label"].items()])
-    
-    # Button styles
-    css_string = "; ".join([f"{k}: {v}" for k, v in style["css"].items()])
-    
-    # Convert hover dict to onmouseover/onmouseout handlers
-    hover_over = "; ".join([f"this.style.{css_property_to_js(k)} = '{v}'" for k, v in style["hover"].items()])
-    hover_out = "; ".join([f"this.style.{css_property_to_js(k)} = '{style['css'].get(k, '')}'" for k in style["hover"].keys()])
-    
-    # Determine label text (left side)
-    title = link['title']
-    if numbering_mode == "always":
-        label_text = f"{link['order']:02d}. {title}"
-    elif numbering_mode == "never":
-        label_text = title
-    else:  # "auto" (default)
-        if _title_has_leading_number(title):
-            label_text = title
-        else:
-            label_text = f"{link['order']:02d}. {title}"
-    
-    # Button text (right side) - typically "Claim" or custom
-    button_text = link.get('button_text', 'Claim')
-    
-    # Disabled/claimed styles from the style config
-    disabled_css = style.get('disabled', {})
-    disabled_string = "; ".join([f"{k}: {v}" for k, v in disabled_css.items()])
-    
-    # Generate unique ID for this button based on URL (for localStorage)
-    import hashlib
-    button_id = hashlib.md5(link['url'].encode()).hexdigest()[:12]
-    
-    # JavaScript for claim functionality with localStorage persistence
-    onclick_js = f"""
-    (function(btn) {{
-        var storageKey = 'claimed_' + '{button_id}';
-        
-        // Check if already claimed
-        if (localStorage.getItem(storageKey) === 'true') {{
-            return false;
-        }}
-        
-        // Mark as claimed
-        setTimeout(function() {{
-            btn.textContent = 'Claimed';
-            btn.style.cssText = '{disabled_string}';
-            btn.style.pointerEvents = 'none';
-            localStorage.setItem(storageKey, 'true');
-        }}, 100);
-        
-        return true;
-    }})(this)
-    """.replace('\n', ' ').strip()
-    
-    # Check claimed state on page load script
-    onload_check = f"""
+# Split layout claim scripts; filled in with str.format (JS braces are doubled).
+# The onclick handler is a single line: it is inlined in an HTML attribute,
+# where a "//" comment would swallow the rest of the script.
+_ONCLICK_JS_TEMPLATE = (
+    "(function(btn) {{ "
+    "var storageKey = 'claimed_' + '{button_id}'; "
+    "if (localStorage.getItem(storageKey) === 'true') {{ return false; }} "
+    "setTimeout(function() {{ "
+    "btn.textContent = 'Claimed'; "
+    "btn.style.cssText = '{disabled_string}'; "
+    "btn.style.pointerEvents = 'none'; "
+    "localStorage.setItem(storageKey, 'true'); "
+    "}}, 100); "
+    "return true; "
+    "}})(this)"
+)
+
+_ONLOAD_CHECK_TEMPLATE = """
     (function() {{
         var storageKey = 'claimed_{button_id}';
         if (localStorage.getItem(storageKey) === 'true') {{
@@ -419,18 +436,91 @@ def _generate_split_layout_html(link: Dict[str, Any], style: Dict[str, Any], tar
         }}
     }})();
     """
+
+
+@lru_cache(maxsize=4096)
+def _button_id_for_url(url: str) -> str:
+    """Stable 12-hex-char button ID for a URL.
     
-    button_html = f'''<!-- wp:column {{"width":"100%"}} -->
+    Stays MD5 so IDs match the 'claimed_<id>' localStorage keys already
+    stored in visitors' browsers.
+    """
+    return hashlib.md5(url.encode()).hexdigest()[:12]
+
+
+_SPLIT_LAYOUT_TEMPLATE = '''<!-- wp:column {{"width":"100%"}} -->
 <div class="wp-block-column" style="flex-basis:100%">
     <div style="{container_string}">
         <span style="{label_string}">{label_text}</span>
-        <a href="{link['url']}" target="{target}"{rel_attr} data-btn-id="{button_id}" style="{css_string}" onmouseover="if(this.textContent!=='Claimed'){{{hover_over}}}" onmouseout="if(this.textContent!=='Claimed'){{{hover_out}}}" onclick="{onclick_js}">{button_text}</a>
+        <a href="{url}" target="{target}"{rel_attr} data-btn-id="{button_id}" style="{css_string}" onmouseover="if(this.textContent!=='Claimed'){{{hover_over}}}" onmouseout="if(this.textContent!=='Claimed'){{{hover_out}}}" onclick="{onclick_js}">{button_text}</a>
     </div>
 </div>
 <!-- /wp:column -->
 <script>{onload_check}</script>'''
+
+
+def _fill_template(template: str, **values: str) -> str:
+    """Substitute some fields of a format template, leaving the rest for later.
     
-    return button_html
+    Values are brace-escaped so the result is still a valid format string.
+    """
+    for name, value in values.items():
+        template = template.replace("{" + name + "}", value.replace("{", "{{").replace("}", "}}"))
+    return template
+
+
+def _split_layout_template(strings: Dict[str, str]) -> str:
+    """Split layout HTML with every per-style string already filled in.
+    
+    Only the per-link fields (url, target, rel_attr, button_id, label_text,
+    button_text) are left as format fields.
+    """
+    claim_scripts = {
+        # The claim scripts only vary by style through the disabled CSS
+        name: _fill_template(template, disabled_string=strings["disabled_string"])
+        for name, template in (("onclick_js", _ONCLICK_JS_TEMPLATE), ("onload_check", _ONLOAD_CHECK_TEMPLATE))
+    }
+    template = _SPLIT_LAYOUT_TEMPLATE
+    for name, script in claim_scripts.items():
+        # Already format-ready, so inserted without escaping
+        template = template.replace("{" + name + "}", script)
+    return _fill_template(
+        template,
+        container_string=strings["container_string"],
+        label_string=strings["label_string"],
+        css_string=strings["css_string"],
+        hover_over=strings["hover_over"],
+        hover_out=strings["hover_out"],
+    )
+
+
+def _generate_split_layout_html(url: str, title: str, order: int, claim_text: str, strings: Dict[str, str],
+                                target: str, rel_attr: str, numbering_mode: str) -> str:
+    """Generate split layout HTML (text on left, button on right).
+    
+    Args:
+        url: Link URL
+        title: Link title (label text)
+        order: Link position, used for numbering
+        claim_text: Button text (right side)
+        strings: Precomputed style strings from _render_style_strings
+        target: Link target attribute
+        rel_attr: Link rel attribute
+        numbering_mode: How to handle button numbering
+        
+    Returns:
+        HTML string for the split layout button
+    """
+    # Styles, hover handlers and claim scripts are baked into the per-style
+    # template; the button ID (for localStorage) is derived from the URL
+    return strings["split_template"].format(
+        url=url,
+        target=target,
+        rel_attr=rel_attr,
+        button_id=_button_id_for_url(url),
+        label_text=_format_button_text(title, order, numbering_mode),
+        button_text=claim_text,
+    )
 
 
 def css_property_to_js(css_property: str) -> str:
@@ -440,3 +530,22 @@ def css_property_to_js(css_property: str) -> str:
     """
     parts = css_property.split('-')
     return parts[0] + ''.join(word.capitalize() for word in parts[1:])
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively wrap dicts in read-only MappingProxyType views."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    return value
+
+
+# Styles are static: freeze them so callers cannot mutate shared state and the
+# cached renderers below stay pure
+BUTTON_STYLES = _freeze(BUTTON_STYLES)
+
+# Inline CSS / hover strings per style, computed once at import.
+# Kept beside (not inside) BUTTON_STYLES so the styles API keeps returning
+# only the style definitions.
+_STYLE_STRINGS: Mapping[str, Mapping[str, str]] = _freeze({
+    name: _render_style_strings(style) for name, style in BUTTON_STYLES.items()
+})
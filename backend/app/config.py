@@ -1,24 +1,49 @@
 import os
+from dataclasses import dataclass
 from functools import lru_cache
-from pydantic import BaseSettings, AnyUrl
+from typing import Optional
 
+from dotenv import load_dotenv
 
-class Settings(BaseSettings):
-    timezone: str = "Asia/Kolkata"
-    redis_url: AnyUrl | None = os.getenv("REDIS_URL")
-    mongodb_uri: str | None = os.getenv("MONGODB_URI")
-    gemini_api_key: str | None = os.getenv("GEMINI_API_KEY")
-    scraper_api_url: AnyUrl | None = os.getenv("SCRAPER_API_URL")
-    scraper_api_key: str | None = os.getenv("SCRAPER_API_KEY")
-    wp_base_url: AnyUrl
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Process settings, read from the environment (and .env) once."""
+    wp_base_url: str
     wp_username: str
     wp_application_password: str
+    timezone: str = "Asia/Kolkata"
+    redis_url: Optional[str] = None
+    mongodb_uri: Optional[str] = None
+    gemini_api_key: Optional[str] = None
+    scraper_api_url: Optional[str] = None
+    scraper_api_key: Optional[str] = None
+
+
+def _require(name: str) -> str:
+    """Read a required env var, naming it in the error if it is unset"""
+    value = os.getenv(name)
+    if value is None:
+        raise RuntimeError(f"Missing required environment variable {name} (set it in the environment or .env)")
+    return value
+
 
-    class Config:
-        env_file = ".env"
-        case_sensitive = False
+def _load() -> Settings:
+    load_dotenv(".env")
+    return Settings(
+        wp_base_url=_require("WP_BASE_URL"),
+        wp_username=_require("WP_USERNAME"),
+        wp_application_password=_require("WP_APPLICATION_PASSWORD"),
+        timezone=os.getenv("TIMEZONE", "Asia/Kolkata"),
+        redis_url=os.getenv("REDIS_URL"),
+        mongodb_uri=os.getenv("MONGODB_URI"),
+        gemini_api_key=os.getenv("GEMINI_API_KEY"),
+        scraper_api_url=os.getenv("SCRAPER_API_URL"),
+        scraper_api_key=os.getenv("SCRAPER_API_KEY"),
+    )
 
 
+# Env vars are read on first use (not at import) and never change after
 @lru_cache
 def get_settings() -> Settings:
-    return Settings()
+    return _load()
@@ -1,15 +1,33 @@
-from typing import Iterable, List, Set, TYPE_CHECKING
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple, TYPE_CHECKING
 from .models import Link, PromoCode
 from .constants import FINGERPRINT_DELIMITER
 from datetime import datetime, timedelta
 import logging
+import time
 
 if TYPE_CHECKING:
     from .extractors.base import BaseExtractor
 
 
+# Lookback fingerprints are re-read by every extractor/site pass in a scheduling
+# cycle; keep them briefly. Key: (storage id, post_id, today_iso, site_key, lookback_days)
+LOOKBACK_CACHE_TTL = 60
+LOOKBACK_CACHE_SIZE = 1024
+_lookback_cache: Dict[tuple, Tuple[float, FrozenSet[str]]] = {}
+
+
+def invalidate_fingerprint_cache(post_id: Optional[int] = None, site_key: Optional[str] = None) -> None:
+    """Drop cached lookback fingerprints for a post/site (everything if no post_id given)"""
+    if post_id is None:
+        _lookback_cache.clear()
+        return
+    for key in [k for k in _lookback_cache if k[1] == post_id and (site_key is None or k[3] in (site_key, None))]:
+        _lookback_cache.pop(key, None)
+
+
 def fingerprint(link: Link) -> str:
-    return f"{link.url}{FINGERPRINT_DELIMITER}{link.published_date_iso}"
+    # Plain concatenation skips the f-string formatting machinery; url is an HttpUrl
+    return str(link.url) + FINGERPRINT_DELIMITER + link.published_date_iso
 
 
 def promo_code_fingerprint(promo_code: PromoCode) -> str:
@@ -38,6 +56,27 @@ def dedupe_by_fingerprint(links: Iterable[Link], known_fingerprints: Set[str]) -
     return out
 
 
+def dedupe_today(links: Iterable[Link], today_iso: str, known_fingerprints: Set[str]) -> List[Link]:
+    """
+    Single-pass equivalent of dedupe_by_fingerprint(filter_only_today(links, today_iso), known).
+    
+    Skips the intermediate list and only fingerprints links dated today.
+    """
+    out: List[Link] = []
+    seen = set()
+    delim = FINGERPRINT_DELIMITER
+    for l in links:
+        d = l.published_date_iso
+        if d != today_iso:
+            continue
+        fp = str(l.url) + delim + d
+        if fp in known_fingerprints or fp in seen:
+            continue
+        seen.add(fp)
+        out.append(l)
+    return out
+
+
 def dedupe_promo_codes_by_fingerprint(
     promo_codes: Iterable[PromoCode], 
     known_fingerprints: Set[str]
@@ -85,29 +124,58 @@ def get_fingerprints_with_lookback(
         storage_module: The storage module with get_known_fingerprints method
         
     Returns:
-        Set of fingerprints from today and previous days (if applicable)
+        Read-only set of fingerprints from today and previous days (if applicable),
+        cached for LOOKBACK_CACHE_TTL seconds
     """
     if storage_module is None:
         from . import mongo_storage as storage_module
     
-    # Start with today's fingerprints
-    known_fps = storage_module.get_known_fingerprints(post_id, today_iso, site_key)
-    
     # Check if extractor needs previous days' fingerprints
     lookback_days = extractor.check_previous_days()
     
-    if lookback_days > 0:
-        today_date = datetime.strptime(today_iso, "%Y-%m-%d")
-        
+    key = (id(storage_module), post_id, today_iso, site_key, lookback_days)
+    now = time.monotonic()
+    cached = _lookback_cache.get(key)
+    if cached and cached[0] > now:
+        return cached[1]
+    
+    known_fps = frozenset(_load_fingerprints_with_lookback(
+        extractor, post_id, today_iso, site_key, storage_module, lookback_days
+    ))
+    if len(_lookback_cache) >= LOOKBACK_CACHE_SIZE:
+        # Evict the oldest insertion (dicts keep insertion order)
+        _lookback_cache.pop(next(iter(_lookback_cache)), None)
+    _lookback_cache[key] = (now + LOOKBACK_CACHE_TTL, known_fps)
+    return known_fps
+
+
+def _load_fingerprints_with_lookback(
+    extractor: 'BaseExtractor',
+    post_id: int,
+    today_iso: str,
+    site_key: Optional[str],
+    storage_module,
+    lookback_days: int
+) -> Set[str]:
+    if lookback_days <= 0:
+        return storage_module.get_known_fingerprints(post_id, today_iso, site_key)
+    
+    today_date = datetime.strptime(today_iso, "%Y-%m-%d")
+    start_iso = (today_date - timedelta(days=lookback_days)).strftime("%Y-%m-%d")
+    
+    if hasattr(storage_module, "get_known_fingerprints_range"):
+        # One ranged query covers today and every lookback day
+        known_fps = storage_module.get_known_fingerprints_range(post_id, start_iso, today_iso, site_key)
+    else:
+        # Copy once, then grow in place rather than re-copying on every union
+        known_fps = set(storage_module.get_known_fingerprints(post_id, today_iso, site_key))
         for i in range(1, lookback_days + 1):
-            prev_date = today_date - timedelta(days=i)
-            prev_iso = prev_date.strftime("%Y-%m-%d")
-            prev_fps = storage_module.get_known_fingerprints(post_id, prev_iso, site_key)
-            known_fps = known_fps.union(prev_fps)
-        
-        logging.info(
-            f"[DEDUPE] {extractor.__class__.__name__}: Checking fingerprints for {lookback_days + 1} days "
-            f"({today_iso} back to {(today_date - timedelta(days=lookback_days)).strftime('%Y-%m-%d')})"
-        )
+            prev_iso = (today_date - timedelta(days=i)).strftime("%Y-%m-%d")
+            known_fps.update(storage_module.get_known_fingerprints(post_id, prev_iso, site_key))
+    
+    logging.info(
+        f"[DEDUPE] {extractor.__class__.__name__}: Checking fingerprints for {lookback_days + 1} days "
+        f"({today_iso} back to {start_iso})"
+    )
     
     return known_fps
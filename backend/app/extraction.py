@@ -1,18 +1,173 @@
-from bs4 import BeautifulSoup
-from typing import List
+from bs4 import BeautifulSoup, SoupStrainer
+from collections import OrderedDict
+from datetime import datetime
+from functools import lru_cache
+import hashlib
+import threading
+from typing import FrozenSet, Iterator, List, Optional, Tuple
+import re
+import soupsieve as sv
+from pydantic import HttpUrl, TypeAdapter, ValidationError
 from .models import Link
 
+# Prefer the C-based lxml parser; fall back to the pure-Python one if it is missing
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
 
-def extract_links_with_heading_filter(html: str, today_iso: str) -> List[Link]:
-    """Fallback deterministic extractor for sections labeled 'links for today' or today's date."""
-    soup = BeautifulSoup(html, "html.parser")
-    anchors: List[Link] = []
+
+# Date headers like "Oct 25, 2025", "25 October, 2025" or "Oct 25": exactly what
+# strptime accepts for "%b %d, %Y", "%d %b, %Y", "%B %d, %Y", "%d %B, %Y", "%b %d"
+# and "%d %b", checked with one compiled regex instead of six parse attempts
+_ABBR_MONTH = r"(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)"
+_FULL_MONTH = r"(?:january|february|march|april|may|june|july|august|september|october|november|december)"
+_DAY = r"(?:3[01]|[12]\d|0?[1-9])"
+_DATE_HEADER_RE = re.compile(
+    rf"(?:{_ABBR_MONTH}\s+{_DAY}|{_DAY}\s+{_ABBR_MONTH})(?:,\s+\d{{4}})?"
+    rf"|(?:{_FULL_MONTH}\s+{_DAY}|{_DAY}\s+{_FULL_MONTH}),\s+\d{{4}}",
+    re.IGNORECASE,
+)
+# First characters a date header can start with (digits and month initials)
+_DATE_FIRST_CHARS = frozenset("0123456789jfmasond")
+
+
+# Recently parsed pages, keyed by a digest of the HTML and the strainer used
+# (most recent last). Digesting a 400 KB page costs under 1 ms against roughly
+# 250 ms for the lxml parse a hit saves. Guarded by _parse_cache_lock: request
+# handlers run extractors from a threadpool.
+PARSE_CACHE_SIZE = 8
+_parse_cache: "OrderedDict[Tuple[bytes, Optional[SoupStrainer]], BeautifulSoup]" = OrderedDict()
+_parse_cache_lock = threading.Lock()
+
+
+def parse_html(html: str, parse_only: Optional[SoupStrainer] = None, mutable: bool = False) -> BeautifulSoup:
+    """
+    Parse HTML with HTML_PARSER, reusing the tree for a page parsed recently.
+    
+    Extractors that read the same page more than once (links and promo codes)
+    share one parse. `parse_only` should be a module-level SoupStrainer so
+    repeat calls share its cache entry.
+    
+    The returned soup is shared between callers (and threads), so it must be
+    treated as read-only: no decompose(), extract(), or attribute edits.
+    Callers that need to modify the tree pass mutable=True to get a fresh,
+    uncached parse instead.
+    """
+    if mutable:
+        return BeautifulSoup(html, HTML_PARSER, parse_only=parse_only)
+    
+    digest = hashlib.blake2b(html.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+    key = (digest, parse_only)
+    with _parse_cache_lock:
+        soup = _parse_cache.get(key)
+        if soup is not None:
+            _parse_cache.move_to_end(key)
+            return soup
+    
+    # Parse outside the lock; two threads racing on the same page both parse
+    # and the later one's tree is kept
+    soup = BeautifulSoup(html, HTML_PARSER, parse_only=parse_only)
+    with _parse_cache_lock:
+        _parse_cache[key] = soup
+        _parse_cache.move_to_end(key)
+        if len(_parse_cache) > PARSE_CACHE_SIZE:
+            _parse_cache.popitem(last=False)
+    return soup
+
+
+# Tags the fallback extractor never builds: document head metadata and
+# top-level scripts/styles. html and body are skipped too (their children are
+# hoisted to the root in order), otherwise a kept <html> would keep the whole
+# page. Every other tag is kept with its subtree, so inline wrappers (em, b,
+# span, center, font) around a date header stay in place.
+_NON_CONTENT_TAGS = frozenset({
+    "html", "body", "head", "title", "meta", "link", "base",
+    "script", "style", "noscript", "template",
+})
+
+
+def _is_content_tag(name: str, attrs=None) -> bool:
+    """SoupStrainer predicate: keep every tag except _NON_CONTENT_TAGS"""
+    return name not in _NON_CONTENT_TAGS
+
+
+_SECTION_STRAINER = SoupStrainer(_is_content_tag)
+
+
+_HEADING_TAGS = frozenset({"h1", "h2", "h3", "h4", "h5", "h6"})
+
+# Link carriers inside a dated section, matched in one compiled pass
+_LINK_SELECTOR = sv.compile('div[data-link], a[href]')
+
+
+# URL hints for _is_reward_link. Excluded keywords are checked first: these are
+# definitely NOT reward links
+_EXCLUDE_KEYWORDS = (
+    'about', 'contact', 'privacy', 'terms', 'policy', 'disclaimer',
+    'disclosure', 'previous', 'next', 'category', 'tag', 'author',
+    '/page/', 'facebook.com', 'twitter.com', 'instagram.com',
+    'pinterest.com', 'youtube.com', 'linkedin.com',
+)
+_REWARD_DOMAINS = ('rewards.coinmaster.com', 'rewards.', 'gift', 'promo', 'bonus')
+_REWARD_KEYWORDS = ('reward', 'spin', 'coin', 'bonus', 'gift', 'promo', 'free')
+
+
+@lru_cache(maxsize=4096)
+def _is_reward_link(url: str) -> bool:
+    """Check if URL is likely a reward/gift link (not navigation)"""
+    url_lower = url.lower()
     
-    # Normalize match terms
+    if any(keyword in url_lower for keyword in _EXCLUDE_KEYWORDS):
+        return False
+    
+    # If it's a rewards domain, it's definitely a reward link
+    if any(domain in url_lower for domain in _REWARD_DOMAINS):
+        return True
+    
+    # Or if it has reward keywords AND query params (like ?c=...)
+    return '?' in url and any(keyword in url_lower for keyword in _REWARD_KEYWORDS)
+
+
+_HTTP_URL = TypeAdapter(HttpUrl)
+
+
+@lru_cache(maxsize=4096)
+def _validated_url(url: str) -> Optional[HttpUrl]:
+    """Parse a URL the way Link.url does; None for malformed URLs"""
+    try:
+        return _HTTP_URL.validate_python(url)
+    except ValidationError:
+        return None
+
+
+def _make_link(url: str, title: str, today_iso: str) -> Optional[Link]:
+    """
+    Build a Link without running full model validation.
+    
+    Titles and the date are already plain strings here; only the URL needs
+    pydantic's parsing, which also normalizes it the way fingerprints expect.
+    Malformed URLs are skipped (None).
+    """
+    valid_url = _validated_url(url)
+    if valid_url is None:
+        return None
+    return Link.model_construct(url=valid_url, title=title, published_date_iso=today_iso)
+
+
+def _is_today_marker(tag, match_terms_re: "re.Pattern[str]") -> bool:
+    """True if a tag's text names today's section and is short (not a giant container)"""
+    text = (tag.get_text() or "").strip().lower()
+    return len(text) < 50 and match_terms_re.search(text) is not None
+
+
+@lru_cache(maxsize=64)
+def _build_match_terms(today_iso: str) -> FrozenSet[str]:
+    """Lowercase phrases that mark today's section ("links for today" and date formats)"""
     match_terms = {"links for today", today_iso.lower()}
     
     # Add various date formats for matching
-    from datetime import datetime
     try:
         dt = datetime.strptime(today_iso, "%Y-%m-%d")
         match_terms.add(dt.strftime("%d %B %Y").lower())  # "26 October 2025"
@@ -23,157 +178,130 @@ def extract_links_with_heading_filter(html: str, today_iso: str) -> List[Link]:
         match_terms.add(dt.strftime("%d %b").lower())  # "26 Oct"
     except ValueError:
         pass
-    
-    # Helper to check if URL is likely a reward/gift link (not navigation)
-    def is_reward_link(url: str) -> bool:
-        url_lower = url.lower()
-        
-        # EXCLUDE first - these are definitely NOT reward links
-        exclude_keywords = ['about', 'contact', 'privacy', 'terms', 'policy', 'disclaimer', 
-                           'disclosure', 'previous', 'next', 'category', 'tag', 'author',
-                           '/page/', 'facebook.com', 'twitter.com', 'instagram.com',
-                           'pinterest.com', 'youtube.com', 'linkedin.com']
-        
-        if any(keyword in url_lower for keyword in exclude_keywords):
-            return False
-        
-        # Must be from a known rewards domain OR have specific reward keywords
-        reward_domains = ['rewards.coinmaster.com', 'rewards.', 'gift', 'promo', 'bonus']
-        reward_keywords = ['reward', 'spin', 'coin', 'bonus', 'gift', 'promo', 'free']
-        
-        # If it's a rewards domain, it's definitely a reward link
-        if any(domain in url_lower for domain in reward_domains):
-            return True
-        
-        # Or if it has reward keywords AND query params (like ?c=...)
-        has_reward_keyword = any(keyword in url_lower for keyword in reward_keywords)
-        has_query_params = '?' in url
-        
-        return has_reward_keyword and has_query_params
+    return frozenset(match_terms)
+
+
+@lru_cache(maxsize=64)
+def _build_match_terms_re(today_iso: str) -> "re.Pattern[str]":
+    """One alternation over today's match terms: a single scan instead of one `in` per term"""
+    terms = sorted(_build_match_terms(today_iso), key=len, reverse=True)
+    return re.compile("|".join(map(re.escape, terms)))
+
 
+def extract_links_with_heading_filter(html: str, today_iso: str) -> List[Link]:
+    """Fallback deterministic extractor for sections labeled 'links for today' or today's date."""
+    return list(iter_links_with_heading_filter(html, today_iso))
+
+
+def iter_links_with_heading_filter(html: str, today_iso: str) -> Iterator[Link]:
+    """Streaming form of extract_links_with_heading_filter: yields Links as they are found."""
+    soup = parse_html(html, _SECTION_STRAINER)
+    # URLs already collected by either strategy; repeats are skipped before
+    # any title or Link is built
+    seen_urls = set()
+    
+    match_terms = _build_match_terms(today_iso)
+    match_terms_re = _build_match_terms_re(today_iso)
+    
     # Strategy 1: Find date in strong tags specifically (like: <strong>Oct 26, 2025:</strong>)
-    # First try strong tags (most specific)
-    for strong_tag in soup.find_all('strong'):
-        text = (strong_tag.get_text() or "").strip().lower()
+    # First try strong tags (most specific); stop scanning at the first match
+    strong_tag = next(
+        (tag for tag in soup.descendants if tag.name == 'strong' and _is_today_marker(tag, match_terms_re)),
+        None,
+    )
+    if strong_tag is not None:
+        # Found today's date! Now collect links from siblings until next date
         
-        # Check if this strong tag contains today's date AND is short (not a giant container)
-        if any(term in text for term in match_terms) and len(text) < 50:
-            # Found today's date! Now collect links from siblings until next date
+        current = strong_tag.parent if strong_tag.parent else strong_tag
+        next_elem = current.find_next_sibling()
+        
+        # Process siblings until we hit another date header
+        while next_elem:
+            # Check if this element or its children contain another date header
+            has_date_header = False
             
-            current = strong_tag.parent if strong_tag.parent else strong_tag
-            next_elem = current.find_next_sibling()
+            # Check every strong tag in this element, stopping at the first
+            # date header that is not today's
+            for strong in next_elem.find_all('strong'):
+                strong_text = strong.get_text().strip()
+                date_text = strong_text.strip(':').strip()
+                # Cheap reject first: a date header starts with a day or a month name
+                if date_text[:1].lower() not in _DATE_FIRST_CHARS:
+                    continue
+                # A date header that is NOT today ends today's section
+                if _DATE_HEADER_RE.fullmatch(date_text) and strong_text.lower() not in match_terms:
+                    has_date_header = True
+                    break
             
-            # Process siblings until we hit another date header
-            while next_elem:
-                # Check if this element or its children contain another date header
-                elem_text = next_elem.get_text().strip().lower()
-                
-                # Look for date patterns in this element
-                has_date_header = False
-                
-                # Check all strong tags in this element
-                for strong in next_elem.find_all('strong'):
-                    strong_text = strong.get_text().strip()
-                    # Check if it matches any of our OTHER date patterns (not today)
-                    try:
-                        # Try to parse as a date
-                        from datetime import datetime
-                        # Common patterns: "Oct 25, 2025", "25 Oct 2025", etc.
-                        for pattern in ["%b %d, %Y", "%d %b, %Y", "%B %d, %Y", "%d %B, %Y", "%b %d", "%d %b"]:
-                            try:
-                                parsed = datetime.strptime(strong_text.strip(':').strip(), pattern)
-                                # If we successfully parsed a date, and it's NOT today, stop
-                                if strong_text.strip().lower() not in match_terms:
-                                    has_date_header = True
-                                    break
-                            except ValueError:
-                                continue
-                        if has_date_header:
-                            break
-                    except:
-                        pass
+            if has_date_header:
+                break  # Stop - we've reached the next day's section
+            
+            # data-link divs, then regular <a> tags (with filtering), gathered
+            # in one pass over this element. Divs are emitted first, the order
+            # the section's buttons are published in.
+            anchors = []
+            for link_elem in _LINK_SELECTOR.select(next_elem):
+                if link_elem.name != 'div':
+                    anchors.append(link_elem)
+                    continue
+                link_url = link_elem.get('data-link')
+                if not link_url or link_url in seen_urls:
+                    continue
                 
-                if has_date_header:
-                    break  # Stop - we've reached the next day's section
+                span = link_elem.find('span')
+                title = span.get_text().strip() if span else link_url
                 
-                # Extract data-link attributes from this element
-                for data_link_div in next_elem.find_all('div', attrs={'data-link': True}):
-                    link_url = data_link_div.get('data-link')
-                    if not link_url:
-                        continue
-                    
-                    span = data_link_div.find('span')
-                    title = span.get_text().strip() if span else link_url
-                    
-                    try:
-                        anchors.append(
-                            Link(
-                                url=link_url,
-                                title=title,
-                                published_date_iso=today_iso,
-                                summary=None,
-                                category=None,
-                            )
-                        )
-                    except Exception:
-                        continue
+                seen_urls.add(link_url)
+                link = _make_link(link_url, title, today_iso)
+                if link is not None:
+                    yield link
+            
+            for link_elem in anchors:
+                link_url = link_elem.get("href")
+                if not link_url or link_url in seen_urls or link_url.startswith('#') or link_url.startswith('javascript:'):
+                    continue
                 
-                # Also check regular <a> tags (with filtering)
-                for link_tag in next_elem.find_all("a", href=True):
-                    href = link_tag.get("href")
-                    if not href or href.startswith('#') or href.startswith('javascript:'):
-                        continue
-                    
-                    if not is_reward_link(href):
-                        continue
-                    
-                    try:
-                        anchors.append(
-                            Link(
-                                url=href,
-                                title=link_tag.get_text().strip() or href,
-                                published_date_iso=today_iso,
-                            )
-                        )
-                    except Exception:
-                        continue
+                if not _is_reward_link(link_url):
+                    continue
                 
-                next_elem = next_elem.find_next_sibling()
+                seen_urls.add(link_url)
+                link = _make_link(link_url, link_elem.get_text().strip() or link_url, today_iso)
+                if link is not None:
+                    yield link
             
-            # Found and processed today's section, stop
-            break
+            next_elem = next_elem.find_next_sibling()
 
     # Strategy 2: Traditional heading-based extraction (for other sites)
-    for heading in soup.find_all(["h1", "h2", "h3", "h4", "h5", "h6"]):
+    for heading in soup.find_all(_HEADING_TAGS):
         text = (heading.get_text() or "").strip().lower()
-        if any(term in text for term in match_terms):
-            for sibling in heading.find_all_next():
-                if sibling.name in ["h1", "h2", "h3", "h4", "h5", "h6"]:
+        if match_terms_re.search(text):
+            # Walk the section after the heading in document order: anchors
+            # inside the heading itself, then its following siblings, then
+            # those of each enclosing wrapper, up to the next heading
+            at_next_heading = False
+            for node in (heading, *heading.parents):
+                section = [heading] if node is heading else []
+                section.extend(node.find_next_siblings())
+                for sibling in section:
+                    # The sibling itself, then its anchors, in document order; a
+                    # nested heading ends the section just like a sibling one
+                    candidates = sibling.find_all(["a", *_HEADING_TAGS])
+                    if sibling is not heading:
+                        candidates.insert(0, sibling)
+                    for link_tag in candidates:
+                        if link_tag.name in _HEADING_TAGS:
+                            at_next_heading = True
+                            break
+                        if link_tag.name != "a":
+                            continue
+                        href = link_tag.get("href")
+                        if not href or href.startswith('#') or href.startswith('javascript:') or href in seen_urls:
+                            continue
+                        seen_urls.add(href)
+                        link = _make_link(href, link_tag.get_text().strip() or href, today_iso)
+                        if link is not None:
+                            yield link
+                    if at_next_heading:
+                        break
+                if at_next_heading:
                     break
-                if sibling.name == "a" and sibling.get("href"):
-                    anchors.append(
-                        Link(
-                            url=sibling["href"],
-                            title=sibling.get_text().strip() or sibling["href"],
-                            published_date_iso=today_iso,
-                            summary=None,
-                            category=None,
-                        )
-                    )
-                for link_tag in sibling.find_all("a"):
-                    href = link_tag.get("href")
-                    if not href or href.startswith('#') or href.startswith('javascript:'):
-                        continue
-                    try:
-                        anchors.append(
-                            Link(
-                                url=href,
-                                title=link_tag.get_text().strip() or href,
-                                published_date_iso=today_iso,
-                            )
-                        )
-                    except Exception:
-                        # Skip malformed URLs
-                        continue
-    
-    return anchors
@@ -5,10 +5,13 @@ This file shows various patterns for creating extractors.
 Copy this template and modify for your needs!
 """
 
+from datetime import datetime
 from typing import List
 from bs4 import BeautifulSoup
 from .base import BaseExtractor, ExtractedLink
 from ..extractors import register_extractor
+from ..extraction import HTML_PARSER
+import json
 import re
 
 
@@ -27,7 +30,7 @@ class CssSelectorExtractor(BaseExtractor):
         return "example.com" in url
     
     def extract(self, html: str, date: str) -> List[ExtractedLink]:
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, HTML_PARSER)
         links = []
         
         # Find all links with class="reward-link"
@@ -60,9 +63,7 @@ class DateSectionExtractor(BaseExtractor):
         return "rewards.example.com" in url
     
     def extract(self, html: str, date: str) -> List[ExtractedLink]:
-        from datetime import datetime
-        
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, HTML_PARSER)
         links = []
         
         # Convert date to various formats to match
@@ -109,21 +110,23 @@ class RegexExtractor(BaseExtractor):
     Good for: Links embedded in JavaScript or JSON.
     """
     
+    # Compile once at class scope, not on every extract() call
+    # Pattern to match reward URLs in JavaScript
+    _REWARD_RE = re.compile(r'rewardUrl:\s*["\']([^"\']+)["\']')
+    _TITLE_RE = re.compile(r'title:\s*["\']([^"\']+)["\']')
+    
     def can_handle(self, url: str) -> bool:
         return "api.example.com" in url
     
     def extract(self, html: str, date: str) -> List[ExtractedLink]:
         links = []
         
-        # Pattern to match reward URLs in JavaScript
-        pattern = r'rewardUrl:\s*["\']([^"\']+)["\']'
-        
-        for match in re.finditer(pattern, html):
+        for match in self._REWARD_RE.finditer(html):
             url = match.group(1)
             
-            # Extract title from nearby text
-            title_pattern = r'title:\s*["\']([^"\']+)["\']'
-            title_match = re.search(title_pattern, html[max(0, match.start()-200):match.start()+200])
+            # Extract title from nearby text (pos/endpos search, no slice copy)
+            start = match.start()
+            title_match = self._TITLE_RE.search(html, max(0, start - 200), start + 200)
             title = title_match.group(1) if title_match else "Reward Link"
             
             links.append(ExtractedLink(
@@ -146,17 +149,17 @@ class GamingNetworkExtractor(BaseExtractor):
     Good for: Sites with similar structure under different domains.
     """
     
-    SUPPORTED_DOMAINS = [
+    SUPPORTED_DOMAINS = frozenset({
         "site1.example.com",
         "site2.example.com",
         "site3.example.com"
-    ]
+    })
     
     def can_handle(self, url: str) -> bool:
         return any(domain in url for domain in self.SUPPORTED_DOMAINS)
     
     def extract(self, html: str, date: str) -> List[ExtractedLink]:
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, HTML_PARSER)
         links = []
         
         # All sites in network use this structure
@@ -193,8 +196,6 @@ class ApiExtractor(BaseExtractor):
         return "api.rewards.example.com" in url
     
     def extract(self, html: str, date: str) -> List[ExtractedLink]:
-        import json
-        
         links = []
         
         try:
@@ -19,38 +19,60 @@ Example:
 """
 
 from typing import Dict, Type, List
+from urllib.parse import urlparse
 from .base import BaseExtractor
 
-# Global registry of extractors
-_EXTRACTOR_REGISTRY: Dict[str, Type[BaseExtractor]] = {}
+# Global registry of extractors. Extractors are stateless, so each one is
+# instantiated once at registration and the instance is shared.
+_EXTRACTOR_REGISTRY: Dict[str, BaseExtractor] = {}
+
+# Host -> extractor name, built from HANDLED_DOMAINS at registration
+_DOMAIN_INDEX: Dict[str, str] = {}
+
+
+def _register(name: str, extractor: BaseExtractor) -> None:
+    _EXTRACTOR_REGISTRY[name] = extractor
+    for domain in extractor.HANDLED_DOMAINS:
+        # First registration of a domain wins, like the can_handle scan order
+        _DOMAIN_INDEX.setdefault(domain.lower(), name)
 
 
 def register_extractor(name: str):
     """Decorator to register an extractor class."""
     def decorator(cls: Type[BaseExtractor]):
-        _EXTRACTOR_REGISTRY[name] = cls
+        _register(name, cls())
         cls._extractor_name = name
         return cls
     return decorator
 
 
 def get_extractor(name: str) -> BaseExtractor:
-    """Get an extractor instance by name."""
+    """Get the (shared) extractor instance by name."""
     if name not in _EXTRACTOR_REGISTRY:
         raise ValueError(f"Unknown extractor: {name}. Available: {list(_EXTRACTOR_REGISTRY.keys())}")
-    return _EXTRACTOR_REGISTRY[name]()
+    return _EXTRACTOR_REGISTRY[name]
 
 
 def get_extractor_for_url(url: str) -> BaseExtractor:
     """Auto-detect which extractor to use based on URL."""
-    for name, extractor_class in _EXTRACTOR_REGISTRY.items():
-        extractor = extractor_class()
-        if extractor.can_handle(url):
+    # Domain index first: the host and each parent domain (www.site.com -> site.com)
+    host = (urlparse(url).hostname or "").lower()
+    while host:
+        name = _DOMAIN_INDEX.get(host)
+        if name is not None:
+            return _EXTRACTOR_REGISTRY[name]
+        host = host.partition(".")[2]
+    
+    # Then extractors without HANDLED_DOMAINS, in registration order, sharing
+    # one lowercased copy of the URL
+    url_lower = url.lower()
+    for extractor in _EXTRACTOR_REGISTRY.values():
+        if not extractor.HANDLED_DOMAINS and extractor.can_handle_lower(url_lower):
             return extractor
     
     # Fallback to default extractor
     if "default" in _EXTRACTOR_REGISTRY:
-        return _EXTRACTOR_REGISTRY["default"]()
+        return _EXTRACTOR_REGISTRY["default"]
     
     raise ValueError(f"No extractor found for URL: {url}")
 
@@ -65,13 +87,13 @@ def list_extractors() -> List[str]:
 from . import simplegameguide, default, mosttechs, crazyashwin, techyhigher, wsop, gamesbie, coinscrazy, gamesbieLinks
 
 # Register them manually
-_EXTRACTOR_REGISTRY[simplegameguide.SimpleGameGuideExtractor._extractor_name] = simplegameguide.SimpleGameGuideExtractor
-_EXTRACTOR_REGISTRY[default.DefaultExtractor._extractor_name] = default.DefaultExtractor
-_EXTRACTOR_REGISTRY[mosttechs.MostTechsExtractor._extractor_name] = mosttechs.MostTechsExtractor
-_EXTRACTOR_REGISTRY[crazyashwin.CrazyAshwinExtractor._extractor_name] = crazyashwin.CrazyAshwinExtractor
-_EXTRACTOR_REGISTRY[techyhigher.TechyHigherExtractor._extractor_name] = techyhigher.TechyHigherExtractor
-_EXTRACTOR_REGISTRY[wsop.WSOPExtractor._extractor_name] = wsop.WSOPExtractor
-_EXTRACTOR_REGISTRY[gamesbie.GamesbieExtractor._extractor_name] = gamesbie.GamesbieExtractor
-_EXTRACTOR_REGISTRY[coinscrazy.CoinsCrazyExtractor._extractor_name] = coinscrazy.CoinsCrazyExtractor
-_EXTRACTOR_REGISTRY[gamesbieLinks.GamesbieLinksExtractor._extractor_name] = gamesbieLinks.GamesbieLinksExtractor
+_register(simplegameguide.SimpleGameGuideExtractor._extractor_name, simplegameguide.SimpleGameGuideExtractor())
+_register(default.DefaultExtractor._extractor_name, default.DefaultExtractor())
+_register(mosttechs.MostTechsExtractor._extractor_name, mosttechs.MostTechsExtractor())
+_register(crazyashwin.CrazyAshwinExtractor._extractor_name, crazyashwin.CrazyAshwinExtractor())
+_register(techyhigher.TechyHigherExtractor._extractor_name, techyhigher.TechyHigherExtractor())
+_register(wsop.WSOPExtractor._extractor_name, wsop.WSOPExtractor())
+_register(gamesbie.GamesbieExtractor._extractor_name, gamesbie.GamesbieExtractor())
+_register(coinscrazy.CoinsCrazyExtractor._extractor_name, coinscrazy.CoinsCrazyExtractor())
+_register(gamesbieLinks.GamesbieLinksExtractor._extractor_name, gamesbieLinks.GamesbieLinksExtractor())
 
@@ -11,17 +11,47 @@ Optional methods for promo code extraction:
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Literal
+from typing import Any, Dict, List, Literal, Optional, Tuple
+from bs4 import BeautifulSoup, SoupStrainer
+from pydantic import TypeAdapter
+from ..extraction import parse_html
 from ..models import Link, PromoCode
 
 
 # Extraction mode type hint
 ExtractionMode = Literal["links", "promo_codes", "both"]
 
+# Validates a whole list of link rows in one pydantic-core call
+_LINK_LIST = TypeAdapter(List[Link])
+
 
 class BaseExtractor(ABC):
     """Base class for all link extractors."""
     
+    # Hosts this extractor always handles (subdomains included). Lets the
+    # registry dispatch by host without calling can_handle; leave empty for
+    # extractors whose can_handle is not a plain domain check.
+    HANDLED_DOMAINS: Tuple[str, ...] = ()
+    
+    def _make_soup(self, html: str, parse_only: Optional[SoupStrainer] = None, mutable: bool = False) -> BeautifulSoup:
+        """
+        Parse page HTML for extraction.
+        
+        Uses the lxml parser when it is installed (html.parser otherwise) and
+        shares recently parsed trees, so the soup must be treated as read-only.
+        Pass mutable=True for a private copy that may be modified.
+        """
+        return parse_html(html, parse_only, mutable)
+    
+    def _validate_links(self, rows: List[Dict[str, Any]]) -> List[Link]:
+        """
+        Turn plain link dicts (url/title/published_date_iso) into Link objects.
+        
+        Collecting dicts while walking the page and validating them in one
+        batch is cheaper than constructing a Link per anchor.
+        """
+        return _LINK_LIST.validate_python(rows)
+    
     @abstractmethod
     def can_handle(self, url: str) -> bool:
         """
@@ -35,6 +65,16 @@ class BaseExtractor(ABC):
         """
         pass
     
+    def can_handle_lower(self, url_lower: str) -> bool:
+        """
+        can_handle() for a URL the registry has already lowercased.
+        
+        The registry lowercases each URL once and asks every extractor through
+        this hook. Extractors whose check is case-insensitive override it (and
+        have can_handle call it) so they don't lowercase the URL again.
+        """
+        return self.can_handle(url_lower)
+    
     @abstractmethod
     def extract(self, html: str, date: str) -> List[Link]:
         """
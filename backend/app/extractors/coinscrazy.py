@@ -5,15 +5,48 @@ Extracts daily links from dated sections with button-style links.
 
 from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import List
+from functools import lru_cache
+from typing import List, Optional, Tuple
 import logging
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 from .base import BaseExtractor
 from ..models import Link
 
 
 logger = logging.getLogger(__name__)
 
+# Only the date headings, the button columns after them and the anchors/spans
+# inside are read, so skip building the rest of the page
+_SECTION_STRAINER = SoupStrainer(['h4', 'div', 'a', 'span'])
+
+
+def _date_strings(d: datetime) -> Tuple[str, str, str, str]:
+    # Support both zero-padded and non-padded day formats.
+    # Examples: "06 February 2026" and "6 February 2026"
+    padded = d.strftime("%d %B %Y")
+    non_padded = f"{d.day} {d.strftime('%B %Y')}"
+    return padded, f"Updated On: {padded}", non_padded, f"Updated On: {non_padded}"
+
+
+@lru_cache(maxsize=512)
+def _date_variants(date: str) -> Optional[Tuple[Tuple[str, str, str, str], str, Tuple[str, str, str, str], str]]:
+    """
+    Heading strings and ISO dates for `date` and the day before, or None if
+    `date` is not YYYY-MM-DD. Scheduled runs ask for the same few dates over
+    and over, so the formatting is done once per date.
+    """
+    try:
+        target_date = datetime.strptime(date, "%Y-%m-%d")
+    except ValueError:
+        return None
+    yesterday_date = target_date - timedelta(days=1)
+    return (
+        _date_strings(target_date),
+        target_date.strftime("%Y-%m-%d"),
+        _date_strings(yesterday_date),
+        yesterday_date.strftime("%Y-%m-%d"),
+    )
+
 
 def register_extractor(name):
     """Local registration decorator - will be imported by __init__.py"""
@@ -29,7 +62,10 @@ class CoinsCrazyExtractor(BaseExtractor):
     
     def can_handle(self, url: str) -> bool:
         """Check if this extractor can handle the given URL."""
-        return "coinscrazy.com" in url.lower()
+        return self.can_handle_lower(url.lower())
+
+    def can_handle_lower(self, url_lower: str) -> bool:
+        return "coinscrazy.com" in url_lower
     
     def extract(self, html: str, date: str) -> List[Link]:
         """
@@ -49,39 +85,31 @@ class CoinsCrazyExtractor(BaseExtractor):
             List of Link objects matching the date
         """
         logger.info("[COINSCRAZY] Starting extraction for date=%s, html_size=%d", date, len(html or ""))
-        soup = BeautifulSoup(html, 'html.parser')
-        
+
         # Parse the date string (YYYY-MM-DD format)
-        try:
-            target_date = datetime.strptime(date, "%Y-%m-%d")
-        except ValueError:
+        variants = _date_variants(date)
+        if variants is None:
             logger.warning("[COINSCRAZY] Invalid date format received: %s", date)
             return []
 
-        yesterday_date = target_date - timedelta(days=1)
-
-        def _date_strings(d: datetime) -> tuple[str, str, str, str]:
-            # Support both zero-padded and non-padded day formats.
-            # Examples: "06 February 2026" and "6 February 2026"
-            padded = d.strftime("%d %B %Y")
-            non_padded = f"{d.day} {d.strftime('%B %Y')}"
-            return padded, f"Updated On: {padded}", non_padded, f"Updated On: {non_padded}"
-
         (
-            target_date_str,
-            target_updated_on_str,
-            target_date_str_no_pad,
-            target_updated_on_str_no_pad,
-        ) = _date_strings(target_date)
-        (
-            yesterday_date_str,
-            yesterday_updated_on_str,
-            yesterday_date_str_no_pad,
-            yesterday_updated_on_str_no_pad,
-        ) = _date_strings(yesterday_date)
-
-        target_date_iso = target_date.strftime("%Y-%m-%d")
-        yesterday_date_iso = yesterday_date.strftime("%Y-%m-%d")
+            (
+                target_date_str,
+                target_updated_on_str,
+                target_date_str_no_pad,
+                target_updated_on_str_no_pad,
+            ),
+            target_date_iso,
+            (
+                yesterday_date_str,
+                yesterday_updated_on_str,
+                yesterday_date_str_no_pad,
+                yesterday_updated_on_str_no_pad,
+            ),
+            yesterday_date_iso,
+        ) = variants
+
+        soup = self._make_soup(html, _SECTION_STRAINER)
 
         # Keep insertion order and avoid duplicate URLs (today first, then yesterday)
         links_map = OrderedDict()
@@ -91,7 +119,15 @@ class CoinsCrazyExtractor(BaseExtractor):
         h4_tags = soup.find_all('h4', class_='wp-block-heading')
         logger.info("[COINSCRAZY] Found %d h4 date headings", len(h4_tags))
 
+        # Dates whose section has been read. The page keeps months of daily
+        # sections, so stop once both wanted ones are done instead of
+        # reading every older heading.
+        sections_done = set()
+
         for h4 in h4_tags:
+            if len(sections_done) == 2:
+                break
+
             # Keep spaces between nested text nodes (<strong> inside <strong>)
             # and normalize repeated whitespace for stable matching.
             h4_text = " ".join(h4.get_text(" ", strip=True).split())
@@ -114,24 +150,28 @@ class CoinsCrazyExtractor(BaseExtractor):
 
             if not section_date_iso:
                 continue
+            sections_done.add(section_date_iso)
 
             logger.info("[COINSCRAZY] Processing section heading='%s' mapped_date=%s", h4_text, section_date_iso)
 
-            # Collect links after this heading until next heading
-            current_element = h4.find_next_sibling()
-            while current_element:
+            # Collect links after this heading until next heading; only h4
+            # and div siblings matter, so let bs4 skip the rest
+            for sibling in h4.find_next_siblings(['h4', 'div']):
+                classes = frozenset(sibling.get('class') or ())
+
                 # Stop at next date header
-                if current_element.name == 'h4' and 'wp-block-heading' in current_element.get('class', []):
+                if sibling.name == 'h4' and 'wp-block-heading' in classes:
                     break
 
-                if current_element.name == 'div' and 'wp-block-columns' in current_element.get('class', []):
-                    anchors = current_element.find_all('a', href=True)
+                if sibling.name == 'div' and 'wp-block-columns' in classes:
+                    anchors = sibling.find_all('a', href=True)
                     logger.debug("[COINSCRAZY] Found %d anchors in wp-block-columns section", len(anchors))
                     for anchor in anchors:
-                        href = anchor.get('href', '').strip()
+                        # find_all(href=True) guarantees the attribute
+                        href = anchor['href'].strip()
 
                         # Skip empty or invalid links
-                        if not href or href.startswith('#'):
+                        if not href or href[0] == '#':
                             continue
 
                         button_span = anchor.find('span', class_='ub-button-block-btn')
@@ -139,21 +179,19 @@ class CoinsCrazyExtractor(BaseExtractor):
 
                         # Prefer today's version if same URL appears in both sections
                         if href not in links_map:
-                            links_map[href] = Link(
-                                url=href,
-                                title=button_text,
-                                published_date_iso=section_date_iso
-                            )
+                            links_map[href] = {
+                                'url': href,
+                                'title': button_text,
+                                'published_date_iso': section_date_iso,
+                            }
                         else:
                             duplicate_count += 1
                             logger.debug("[COINSCRAZY] Duplicate URL skipped: %s", href)
 
-                current_element = current_element.find_next_sibling()
-
         logger.info(
             "[COINSCRAZY] Extraction complete. unique_links=%d duplicates_skipped=%d",
             len(links_map),
             duplicate_count,
         )
-        return list(links_map.values())
+        return self._validate_links(list(links_map.values()))
 
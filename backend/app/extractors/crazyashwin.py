@@ -8,22 +8,72 @@ Handles link extraction from crazyashwin.com pages with specific patterns:
 - Links in maxbutton format with onelink URLs
 """
 
-from typing import List
-from bs4 import BeautifulSoup
+from functools import lru_cache
+from typing import Dict, List, Optional, Set, Tuple
+from bs4 import BeautifulSoup, Tag
 from .base import BaseExtractor
 from ..models import Link
 from ..extractors import register_extractor
+from ..extraction import _validated_url
 from datetime import datetime
+import logging
 import re
 
 
+logger = logging.getLogger(__name__)
+
+# Date headings like "06.11.25" or "05.11.2025"
+_DATE_HEADING_RE = re.compile(r'\d{1,2}\.\d{1,2}\.(?:\d{2}|\d{4})')
+
+# Ads, social media and promo shorteners (bit.ly is usually just promo, not rewards)
+_NON_REWARD_RE = re.compile(
+    r'telegram\.me|bit\.ly|googlesyndication\.com|adsbygoogle'
+    r'|facebook\.com|twitter\.com|instagram\.com|youtube\.com',
+    re.IGNORECASE,
+)
+# Known reward domains (any *.onelink.me) and reward-like query parameters;
+# "reward" also covers "rewardkey"
+_REWARD_RE = re.compile(
+    r'hititrich\.com|cashfrenzy\.co|coinmaster\.com|\.onelink\.me|reward|gift|bonus',
+    re.IGNORECASE,
+)
+
+
+@lru_cache(maxsize=512)
+def _date_variants(date: str) -> Optional[Tuple[str, str, str]]:
+    """
+    The "06.11.25", "06.11.2025" and ISO forms of `date`, or None if it is
+    not YYYY-MM-DD. Cached since every run asks for the same dates.
+    """
+    try:
+        date_obj = datetime.strptime(date, "%Y-%m-%d")
+    except ValueError:
+        return None
+    return date_obj.strftime("%d.%m.%y"), date_obj.strftime("%d.%m.%Y"), date_obj.strftime("%Y-%m-%d")
+
+
+def _url_key(href: str) -> str:
+    """
+    Dedupe key for an href: the URL as Link.url normalizes it, so hrefs that
+    differ only in trailing slash or percent-encoding count once. Malformed
+    hrefs (dropped later by validation) are keyed as-is.
+    """
+    url = _validated_url(href)
+    return href if url is None else str(url)
+
+
 @register_extractor("crazyashwin")
 class CrazyAshwinExtractor(BaseExtractor):
     """Extractor for crazyashwin.com pages with date-based and 'Today' sections."""
 
+    HANDLED_DOMAINS = ("crazyashwin.com",)
+
     def can_handle(self, url: str) -> bool:
         """Check if URL is from crazyashwin.com."""
-        return "crazyashwin.com" in url.lower()
+        return self.can_handle_lower(url.lower())
+
+    def can_handle_lower(self, url_lower: str) -> bool:
+        return "crazyashwin.com" in url_lower
 
     def extract(self, html: str, date: str) -> List[Link]:
         """
@@ -34,112 +84,106 @@ class CrazyAshwinExtractor(BaseExtractor):
         2. <h3> with date patterns like "06.11.25" or "05.11.2025"
         3. Extracts all links between today's section and the next date section
         """
-        soup = BeautifulSoup(html, 'html.parser')
         links = []
 
         # Parse the target date
-        try:
-            date_obj = datetime.strptime(date, "%Y-%m-%d")
-        except ValueError:
+        variants = _date_variants(date)
+        if variants is None:
             return links
+        date_short, date_long, date_iso = variants
 
-        # Create date format variations for matching
-        # DD.MM.YY format: "06.11.25"
-        date_short = date_obj.strftime("%d.%m.%y")
-        # DD.MM.YYYY format: "06.11.2025"
-        date_long = date_obj.strftime("%d.%m.%Y")
-        # Alternative formats
-        date_iso = date_obj.strftime("%Y-%m-%d")
+        soup = self._make_soup(html)
         
-        print(f"[CrazyAshwinExtractor] Looking for dates: {date_short}, {date_long}")
+        logger.debug("[CrazyAshwinExtractor] Looking for dates: %s, %s", date_short, date_long)
+
+        # One pass over the headings finds both kinds of section markers
+        today_headings = []
+        date_headings = []
+        for heading in soup.find_all(['h2', 'h3']):
+            heading_text = heading.get_text()
+            if heading.name == 'h2':
+                if 'today' in heading_text.lower():
+                    today_headings.append(heading)
+            elif date_short in heading_text or date_long in heading_text:
+                date_headings.append(heading)
+
+        # Normalized URLs already collected (see _url_key); shared by both
+        # strategies so each link is kept once
+        seen: Set[str] = set()
 
         # Strategy 1: Look for "Today" section first
-        today_section = self._extract_from_today_section(soup, date_obj, date_iso)
+        today_section = self._extract_from_today_section(today_headings, date_iso, seen)
         if today_section:
             links.extend(today_section)
-            print(f"[CrazyAshwinExtractor] Found {len(today_section)} links in 'Today' section")
+            logger.debug("[CrazyAshwinExtractor] Found %d links in 'Today' section", len(today_section))
 
         # Strategy 2: Look for specific date headings (h3 with date patterns)
-        date_section = self._extract_from_date_heading(soup, date_short, date_long, date_iso)
+        date_section = self._extract_from_date_heading(date_headings, date_iso, seen)
         if date_section:
             links.extend(date_section)
-            print(f"[CrazyAshwinExtractor] Found {len(date_section)} links in date heading section")
-
-        # Remove duplicates based on URL
-        seen_urls = set()
-        unique_links = []
-        for link in links:
-            if str(link.url) not in seen_urls:
-                seen_urls.add(str(link.url))
-                unique_links.append(link)
+            logger.debug("[CrazyAshwinExtractor] Found %d links in date heading section", len(date_section))
 
-        print(f"[CrazyAshwinExtractor] Total unique links found: {len(unique_links)}")
-        return unique_links
+        logger.debug("[CrazyAshwinExtractor] Total unique links found: %d", len(links))
+        return self._validate_links(links)
 
-    def _extract_from_today_section(self, soup: BeautifulSoup, date_obj: datetime, date_iso: str) -> List[Link]:
+    def _extract_from_today_section(self, today_headings: List[Tag], date_iso: str, seen: Set[str]) -> List[Dict[str, str]]:
         """
         Extract links from sections with 'Today' in the heading.
-        Looks for <h2> tags containing 'Today' keyword.
+        Takes the <h2> tags containing 'Today' keyword.
         """
         links = []
         
-        # Find all h2 tags that contain "Today"
-        for h2 in soup.find_all('h2'):
-            if 'today' in h2.get_text().lower():
-                print(f"[CrazyAshwinExtractor] Found 'Today' section: {h2.get_text()[:50]}")
+        for h2 in today_headings:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[CrazyAshwinExtractor] Found 'Today' section: %s", h2.get_text()[:50])
+            
+            # Extract links from subsequent elements until we hit another h2/h3 date marker
+            for sibling in h2.find_next_siblings():
+                # Stop at next major heading or date marker
+                if sibling.name in ['h2', 'h3']:
+                    # Check if this is a date heading (stop boundary)
+                    if self._is_date_heading(sibling.get_text()):
+                        break
                 
-                # Extract links from subsequent elements until we hit another h2/h3 date marker
-                for sibling in h2.find_next_siblings():
-                    # Stop at next major heading or date marker
-                    if sibling.name in ['h2', 'h3']:
-                        # Check if this is a date heading (stop boundary)
-                        if self._is_date_heading(sibling.get_text()):
-                            break
+                # Extract all links from this element
+                a_tags = sibling.find_all('a', href=True)
+                for a_tag in a_tags:
+                    href = a_tag['href']
+                    key = _url_key(href)
                     
-                    # Extract all links from this element
-                    a_tags = sibling.find_all('a', href=True)
-                    for a_tag in a_tags:
-                        href = a_tag.get('href', '')
-                        
-                        # Filter out non-reward links
-                        if self._is_valid_reward_link(href):
-                            title = self._extract_title(a_tag)
-                            links.append(Link(
-                                title=title,
-                                url=href,
-                                published_date_iso=date_iso
-                            ))
+                    if key in seen:
+                        continue
+                    
+                    # Filter out non-reward links
+                    if self._is_valid_reward_link(href):
+                        seen.add(key)
+                        title = self._extract_title(a_tag)
+                        links.append({
+                            'url': href,
+                            'title': title,
+                            'published_date_iso': date_iso,
+                        })
         
         return links
 
-    def _extract_from_date_heading(self, soup: BeautifulSoup, date_short: str, date_long: str, date_iso: str) -> List[Link]:
+    def _extract_from_date_heading(self, date_headings: List[Tag], date_iso: str, seen: Set[str]) -> List[Dict[str, str]]:
         """
         Extract links from sections with specific date headings.
-        Looks for <h3> tags with date patterns like "06.11.25" or "↟ 06.11.25 ↟".
+        Takes the <h3> tags with the target date, like "06.11.25" or "↟ 06.11.25 ↟".
         """
         links = []
         
-        # Date patterns to match in headings
-        date_patterns = [
-            date_short,      # "06.11.25"
-            date_long,       # "06.11.2025"
-        ]
-        
-        # Find all h3 tags
-        for h3 in soup.find_all('h3'):
-            h3_text = h3.get_text()
+        for h3 in date_headings:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[CrazyAshwinExtractor] Found date heading: %s", h3.get_text()[:80])
             
-            # Check if this h3 contains our target date
-            if any(pattern in h3_text for pattern in date_patterns):
-                print(f"[CrazyAshwinExtractor] Found date heading: {h3_text[:80]}")
-                
-                # Look backwards from this h3 to collect links until we hit previous date heading
-                links_before_h3 = self._extract_links_before_heading(h3, date_iso)
-                links.extend(links_before_h3)
+            # Look backwards from this h3 to collect links until we hit previous date heading
+            links_before_h3 = self._extract_links_before_heading(h3, date_iso, seen)
+            links.extend(links_before_h3)
         
         return links
 
-    def _extract_links_before_heading(self, heading: BeautifulSoup, date_iso: str) -> List[Link]:
+    def _extract_links_before_heading(self, heading: BeautifulSoup, date_iso: str, seen: Set[str]) -> List[Dict[str, str]]:
         """
         Extract links that appear BEFORE a date heading (going backwards).
         Stops when hitting another h3 date heading.
@@ -159,63 +203,36 @@ class CrazyAshwinExtractor(BaseExtractor):
             # Extract links from this element
             a_tags = sibling.find_all('a', href=True)
             for a_tag in a_tags:
-                href = a_tag.get('href', '')
+                href = a_tag['href']
+                key = _url_key(href)
+                if key in seen:
+                    continue
                 
                 if self._is_valid_reward_link(href):
+                    seen.add(key)
                     title = self._extract_title(a_tag)
-                    links.append(Link(
-                        title=title,
-                        url=href,
-                        published_date_iso=date_iso
-                    ))
+                    links.append({
+                        'url': href,
+                        'title': title,
+                        'published_date_iso': date_iso,
+                    })
         
         return links
 
     def _is_date_heading(self, text: str) -> bool:
         """Check if text looks like a date heading."""
-        # Pattern for DD.MM.YY or DD.MM.YYYY
-        date_pattern = re.compile(r'\d{1,2}\.\d{1,2}\.(\d{2}|\d{4})')
-        return bool(date_pattern.search(text))
+        return _DATE_HEADING_RE.search(text) is not None
 
     def _is_valid_reward_link(self, url: str) -> bool:
         """
         Check if URL is a valid reward link (not ads, social media, etc.).
         """
-        url_lower = url.lower()
-        
         # Exclude known non-reward URLs
-        exclude_patterns = [
-            'telegram.me',
-            'bit.ly',  # Often just promo links, not actual rewards
-            'googlesyndication.com',
-            'adsbygoogle',
-            'facebook.com',
-            'twitter.com',
-            'instagram.com',
-            'youtube.com',
-        ]
-        
-        if any(pattern in url_lower for pattern in exclude_patterns):
+        if _NON_REWARD_RE.search(url):
             return False
         
-        # Include known reward domains
-        reward_patterns = [
-            'hititrich.com',
-            'cashfrenzy.co',
-            'grandharvest.onelink.me',
-            'coinmaster.com',
-            '.onelink.me',  # Generic onelink domains
-        ]
-        
-        # Accept if it's a known reward domain
-        if any(pattern in url_lower for pattern in reward_patterns):
-            return True
-        
-        # Accept if it has reward-like query parameters
-        if any(param in url_lower for param in ['rewardkey', 'reward', 'gift', 'bonus']):
-            return True
-        
-        return False
+        # Accept known reward domains or reward-like query parameters
+        return _REWARD_RE.search(url) is not None
 
     def _extract_title(self, a_tag: BeautifulSoup) -> str:
         """
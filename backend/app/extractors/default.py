@@ -8,11 +8,32 @@ This extractor is used when no specific extractor matches the URL.
 """
 
 import asyncio
+import logging
+import threading
 from typing import List
 from .base import BaseExtractor
 from ..llm import parse_links_with_gemini
 
 
+logger = logging.getLogger(__name__)
+
+# One long-lived event loop, on a daemon thread, runs every Gemini call
+# instead of creating (and tearing down) a loop per extraction
+_LLM_LOOP = None
+_LLM_LOOP_LOCK = threading.Lock()
+
+
+def _get_llm_loop() -> asyncio.AbstractEventLoop:
+    """Start the shared worker loop on first use and return it."""
+    global _LLM_LOOP
+    with _LLM_LOOP_LOCK:
+        if _LLM_LOOP is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="gemini-extractor-loop", daemon=True).start()
+            _LLM_LOOP = loop
+    return _LLM_LOOP
+
+
 def register_extractor(name):
     """Local registration decorator - will be imported by __init__.py"""
     def decorator(cls):
@@ -35,6 +56,9 @@ class DefaultExtractor(BaseExtractor):
         """Default extractor handles everything as fallback."""
         return True
     
+    def can_handle_lower(self, url_lower: str) -> bool:
+        return True
+    
     def extract(self, html: str, date: str) -> List:
         """
         Use Gemini AI to intelligently extract links from HTML.
@@ -50,27 +74,17 @@ class DefaultExtractor(BaseExtractor):
         - Confidence below threshold
         - API error occurs
         """
-        # Gemini function is async, so we need to run it
-        # Create a new event loop for this synchronous context
+        # Gemini function is async; run it on the shared worker loop, which
+        # works whether or not the caller is inside an event loop itself
+        future = asyncio.run_coroutine_threadsafe(
+            parse_links_with_gemini(html, date, "UTC"),
+            _get_llm_loop()
+        )
         try:
-            # Try to get existing loop
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # We're in an async context - this shouldn't happen in extractors
-                # Create a new loop in a thread instead
-                import concurrent.futures
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(
-                        asyncio.run,
-                        parse_links_with_gemini(html, date, "UTC")
-                    )
-                    result = future.result(timeout=30)
-                    return result.links if result else []
-            else:
-                # No running loop - we can use asyncio.run
-                result = asyncio.run(parse_links_with_gemini(html, date, "UTC"))
-                return result.links if result else []
+            result = future.result(timeout=30)
+            return result.links if result else []
         except Exception as e:
             # If anything goes wrong, return empty list
-            print(f"Gemini extraction error: {e}")
+            future.cancel()
+            logger.warning("Gemini extraction error: %s", e)
             return []
@@ -17,11 +17,28 @@ How it works:
 """
 
 from typing import List
-from bs4 import BeautifulSoup
 from .base import BaseExtractor
 from ..models import Link, PromoCode
 import re
 from datetime import datetime
+import soupsieve as sv
+
+
+# "Code: XXXX", "Use coupon XXXX", "promo XXXX"
+_CODE_RE = re.compile(r'(?:code|coupon|promo)[:\s]+([A-Z0-9]{3,20})', re.IGNORECASE)
+# "Expires: ...", "Valid until ...", "Ends ..." up to the end of the sentence
+_EXPIRY_RE = re.compile(r'(?:expires?|valid\s+until|ends?)[:\s]+(.+?)(?:\.|$)', re.IGNORECASE)
+
+# Elements whose class contains a keyword, in any case (e.g. "Reward-Link",
+# "promo-box", "btn-copy"); compiled once instead of a Python callback per tag
+_REWARD_LINK_SELECTOR = sv.compile('a[class*="reward-link" i]')
+_PROMO_CONTAINER_SELECTOR = sv.compile('div[class*="promo" i], section[class*="promo" i]')
+_COPY_BUTTON_SELECTOR = sv.compile('button[class*="copy" i], span[class*="copy" i]')
+# Everything the element-based promo patterns look at, found in one pass
+_PROMO_CANDIDATE_SELECTOR = sv.compile(
+    'div[class*="promo" i], section[class*="promo" i], [data-code], '
+    'button[class*="copy" i], span[class*="copy" i]'
+)
 
 
 def register_extractor(name):
@@ -47,8 +64,11 @@ class ExamplePromoExtractor(BaseExtractor):
         
         Modify this to match your target domain(s).
         """
+        return self.can_handle_lower(url.lower())
+    
+    def can_handle_lower(self, url_lower: str) -> bool:
         # Example: matches example-promo-site.com
-        return "example-promo-site.com" in url.lower()
+        return "example-promo-site.com" in url_lower
     
     def supports_promo_codes(self) -> bool:
         """
@@ -64,11 +84,11 @@ class ExamplePromoExtractor(BaseExtractor):
         
         This is the standard link extraction method - modify for your site's HTML structure.
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = self._make_soup(html)
         links = []
         
         # Example: look for links with specific class or data attributes
-        for a in soup.find_all('a', class_=lambda c: c and 'reward-link' in c.lower()):
+        for a in _REWARD_LINK_SELECTOR.select(soup):
             href = a.get('href')
             title = a.get_text(strip=True) or "Reward Link"
             
@@ -100,8 +120,12 @@ class ExamplePromoExtractor(BaseExtractor):
         Returns:
             List of PromoCode objects
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        # Unstrained: pattern 3 reads text anywhere on the page (li, headings,
+        # table cells...). This also shares extract()'s cached parse.
+        soup = self._make_soup(html)
         promo_codes = []
+        # Upper-cased codes found so far, for the text-pattern duplicate check
+        seen_codes = set()
         
         # Convert ISO date to display formats for matching
         try:
@@ -113,17 +137,34 @@ class ExamplePromoExtractor(BaseExtractor):
         except ValueError:
             date_formats = []
         
+        # One document pass collects the elements for patterns 1, 2 and 4; an
+        # element can belong to more than one of them
+        containers = []
+        data_code_elems = []
+        copy_buttons = []
+        for elem in _PROMO_CANDIDATE_SELECTOR.select(soup):
+            if _PROMO_CONTAINER_SELECTOR.match(elem):
+                containers.append(elem)
+            if elem.has_attr('data-code'):
+                data_code_elems.append(elem)
+            if _COPY_BUTTON_SELECTOR.match(elem):
+                copy_buttons.append(elem)
+        
         # ================================================================
         # PATTERN 1: Look for <code> tags within promo code containers
         # ================================================================
-        for container in soup.find_all(['div', 'section'], class_=lambda c: c and 'promo' in c.lower()):
+        for container in containers:
             code_tags = container.find_all('code')
+            if not code_tags:
+                continue
+            # Description candidates and expiry are per container, not per code
+            desc_candidates = [elem.get_text(strip=True) for elem in container.find_all(['p', 'span', 'div'])]
+            expiry = self._find_expiry(container)
             for code_tag in code_tags:
                 code_text = code_tag.get_text(strip=True)
                 if code_text and len(code_text) >= 3:  # Min 3 chars for a code
                     # Look for description in nearby elements
-                    description = self._find_description(container, code_tag)
-                    expiry = self._find_expiry(container)
+                    description = self._find_description(desc_candidates, code_text)
                     
                     promo_codes.append(PromoCode(
                         code=code_text,
@@ -132,11 +173,12 @@ class ExamplePromoExtractor(BaseExtractor):
                         expiry_date=expiry,
                         category="promo"
                     ))
+                    seen_codes.add(code_text.upper())
         
         # ================================================================
         # PATTERN 2: Look for elements with data-code attribute
         # ================================================================
-        for elem in soup.find_all(attrs={"data-code": True}):
+        for elem in data_code_elems:
             code_text = elem.get("data-code")
             if code_text:
                 description = elem.get("data-description") or elem.get_text(strip=True)
@@ -146,28 +188,31 @@ class ExamplePromoExtractor(BaseExtractor):
                     published_date_iso=date,
                     category="promo"
                 ))
+                seen_codes.add(code_text.upper())
         
         # ================================================================
         # PATTERN 3: Look for "Code: XXXX" or "Use code XXXX" text patterns
         # ================================================================
-        code_pattern = re.compile(r'(?:code|coupon|promo)[:\s]+([A-Z0-9]{3,20})', re.IGNORECASE)
-        
-        for text_elem in soup.find_all(text=code_pattern):
-            matches = code_pattern.findall(str(text_elem))
-            for match in matches:
+        # Matched per text node, so a keyword ending one element never pairs
+        # with the first word of the next ("<h3>Promo</h3><p>Details")
+        for text_node in soup.find_all(string=_CODE_RE):
+            for match in _CODE_RE.finditer(text_node):
+                code_upper = match.group(1).upper()
                 # Avoid duplicates
-                if not any(pc.code.upper() == match.upper() for pc in promo_codes):
-                    promo_codes.append(PromoCode(
-                        code=match.upper(),
-                        description=None,
-                        published_date_iso=date,
-                        category="promo"
-                    ))
+                if code_upper in seen_codes:
+                    continue
+                seen_codes.add(code_upper)
+                promo_codes.append(PromoCode(
+                    code=code_upper,
+                    description=None,
+                    published_date_iso=date,
+                    category="promo"
+                ))
         
         # ================================================================
         # PATTERN 4: Look for copy-button elements (common pattern)
         # ================================================================
-        for btn in soup.find_all(['button', 'span'], class_=lambda c: c and 'copy' in c.lower()):
+        for btn in copy_buttons:
             code_text = btn.get('data-clipboard-text') or btn.get('data-code')
             if code_text and len(code_text) >= 3:
                 promo_codes.append(PromoCode(
@@ -179,13 +224,12 @@ class ExamplePromoExtractor(BaseExtractor):
         
         return promo_codes
     
-    def _find_description(self, container, code_element) -> str:
-        """Helper to find description text near a code element."""
+    def _find_description(self, candidates: List[str], code_text: str) -> str:
+        """Helper to find description text near a code, given the container's p/span/div texts."""
         # Look for nearby paragraph or span with description
-        for elem in container.find_all(['p', 'span', 'div']):
-            text = elem.get_text(strip=True)
+        for text in candidates:
             # Skip if it's the code itself
-            if text == code_element.get_text(strip=True):
+            if text == code_text:
                 continue
             # Look for descriptive text (contains common keywords)
             if any(keyword in text.lower() for keyword in ['free', 'bonus', 'discount', '%', 'off', 'spins']):
@@ -194,9 +238,8 @@ class ExamplePromoExtractor(BaseExtractor):
     
     def _find_expiry(self, container) -> str:
         """Helper to find expiry date near a promo code."""
-        expiry_pattern = re.compile(r'(?:expires?|valid\s+until|ends?)[:\s]+(.+?)(?:\.|$)', re.IGNORECASE)
         text = container.get_text()
-        match = expiry_pattern.search(text)
+        match = _EXPIRY_RE.search(text)
         if match:
             return match.group(1).strip()[:50]
         return None
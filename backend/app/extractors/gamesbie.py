@@ -18,17 +18,80 @@ Example HTML structure:
 </ul>
 """
 
+import calendar
 import re
 import logging
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Optional
-from bs4 import BeautifulSoup, Tag
+from bs4 import SoupStrainer, Tag
 
 from .base import BaseExtractor
 from ..models import PromoCode, ExtractionResult
 
 logger = logging.getLogger(__name__)
 
+# Tags the active-codes walk reads. div is kept so content wrappers stay
+# intact and the walk cannot run past the end of the post.
+_CODES_STRAINER = SoupStrainer(['div', 'h2', 'p', 'ul', 'li', 'strong', 'em'])
+
+_VALID_UNTIL_RE = re.compile(r"valid until:?\s*", re.IGNORECASE)
+_ORDINAL_RE = re.compile(r"(\d+)(st|nd|rd|th)")
+
+# "5 January 2026" / "5 Jan 2026", the formats gamesbie uses
+_DAY_MONTH_YEAR_RE = re.compile(r"(\d{1,2})\s+([A-Za-z]+)\s+(\d{4})")
+# Full and abbreviated month names -> month number
+_MONTH_LOOKUP = {name.lower(): i for i, name in enumerate(calendar.month_name) if name}
+_MONTH_LOOKUP.update({abbr.lower(): i for i, abbr in enumerate(calendar.month_abbr) if abbr})
+
+# Expiry formats, most common first
+_EXPIRY_DATE_FORMATS = (
+    "%d %B %Y",      # 5 January 2026
+    "%d %b %Y",      # 5 Jan 2026
+    "%B %d, %Y",     # January 5, 2026
+    "%b %d, %Y",     # Jan 5, 2026
+    "%d/%m/%Y",      # 05/01/2026
+    "%m/%d/%Y",      # 01/05/2026
+    "%Y-%m-%d",      # 2026-01-05
+)
+
+
+@lru_cache(maxsize=1024)
+def _parse_expiry_date_cached(text: str) -> Optional[datetime]:
+    """
+    Parse an expiry <em> text into a datetime (None if unparseable).
+    
+    Keyed on the raw text: the same handful of expiry strings recur across
+    codes and runs, so each is cleaned up and strptime'd only once.
+    """
+    # Remove parentheses and "Valid until:" prefix
+    text = text.strip("()").strip()
+    text = _VALID_UNTIL_RE.sub("", text).strip()
+    
+    # Remove ordinal suffixes (st, nd, rd, th)
+    text = _ORDINAL_RE.sub(r"\1", text).strip()
+    
+    # Fast path for "5 January 2026" / "5 Jan 2026" without strptime
+    match = _DAY_MONTH_YEAR_RE.fullmatch(text)
+    if match:
+        day, month_name, year = match.groups()
+        month = _MONTH_LOOKUP.get(month_name.lower())
+        if month:
+            try:
+                return datetime(int(year), month, int(day))
+            except ValueError:
+                pass
+    
+    # Anything else (or an invalid day) goes through the full format list
+    for fmt in _EXPIRY_DATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+    
+    logger.debug(f"[Gamesbie] Could not parse expiry date: {text}")
+    return None
+
 
 def register_extractor(name):
     """Local registration decorator - will be imported by __init__.py"""
@@ -79,7 +142,7 @@ class GamesbieExtractor(BaseExtractor):
         Returns:
             List of PromoCode objects
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = self._make_soup(html, _CODES_STRAINER)
         promo_codes: List[PromoCode] = []
         
         # Find the active codes section header
@@ -175,29 +238,4 @@ class GamesbieExtractor(BaseExtractor):
         
         Handles ordinal suffixes (1st, 2nd, 3rd, 4th, etc.)
         """
-        # Remove parentheses and "Valid until:" prefix
-        text = text.strip("()").strip()
-        text = re.sub(r"valid until:?\s*", "", text, flags=re.IGNORECASE).strip()
-        
-        # Remove ordinal suffixes (st, nd, rd, th)
-        text = re.sub(r"(\d+)(st|nd|rd|th)", r"\1", text)
-        
-        # Try parsing common date formats
-        date_formats = [
-            "%d %B %Y",      # 5 January 2026
-            "%d %b %Y",      # 5 Jan 2026
-            "%B %d, %Y",     # January 5, 2026
-            "%b %d, %Y",     # Jan 5, 2026
-            "%d/%m/%Y",      # 05/01/2026
-            "%m/%d/%Y",      # 01/05/2026
-            "%Y-%m-%d",      # 2026-01-05
-        ]
-        
-        for fmt in date_formats:
-            try:
-                return datetime.strptime(text.strip(), fmt)
-            except ValueError:
-                continue
-        
-        logger.debug(f"[Gamesbie] Could not parse expiry date: {text}")
-        return None
+        return _parse_expiry_date_cached(text)
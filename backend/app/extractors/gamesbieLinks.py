@@ -12,13 +12,37 @@ Extraction Logic:
 """
 
 from typing import List
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 from .base import BaseExtractor
 from ..models import Link
 import re
 from datetime import datetime
 
 
+# Tags the date-section walk reads. div is kept so content wrappers (and
+# the lists nested in them) keep their structure.
+_SECTION_STRAINER = SoupStrainer(['div', 'p', 'ul', 'li', 'a', 'span'])
+
+# Date header text like "...: Today, 8th February" or "...: 7th February"
+_DATE_HDR_RE = re.compile(r':\s*(Today,\s*)?\d{1,2}(st|nd|rd|th)\s+\w+')
+
+
+def _emit_from_ul(ul, links: List[Link], date: str) -> None:
+    """Append a Link for each http(s) anchor in a wp-block-list <ul>."""
+    for li in ul.find_all('li'):
+        a = li.find('a')
+        if a:
+            href = a.get('href')
+            title = a.get_text(strip=True) or "Collect Energy"
+            
+            if href and href.startswith('http'):
+                links.append(Link(
+                    title=title,
+                    url=href,
+                    published_date_iso=date
+                ))
+
+
 def register_extractor(name):
     """Local registration decorator - will be imported by __init__.py"""
     def decorator(cls):
@@ -47,7 +71,7 @@ class GamesbieLinksExtractor(BaseExtractor):
         Then extracts links from <ul class="wp-block-list"> following the heading.
         Stops when it encounters the previous day's date.
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = self._make_soup(html, _SECTION_STRAINER)
         links = []
         
         # Convert ISO date (2026-02-10) to display format
@@ -62,60 +86,36 @@ class GamesbieLinksExtractor(BaseExtractor):
         except ValueError:
             return links
         
-        # Find all <p> tags that might contain date headers
-        date_paragraphs = []
+        # Find all <p> tags that might contain date headers, and the first
+        # one for today's date, in one pass. Headers are tracked by id():
+        # Tag.__hash__ serializes the whole tag.
+        date_paragraph_ids = set()
+        start_element = None
         for p in soup.find_all('p'):
             p_text = p.get_text(strip=True)
             # Look for patterns like "Animals & Coins Free Energy: Today, 8th February"
-            if re.search(r':\s*(Today,\s*)?\d{1,2}(st|nd|rd|th)\s+\w+', p_text):
-                date_paragraphs.append(p)
-        
-        # Find the start element for today's date
-        start_element = None
-        for p in date_paragraphs:
-            p_text = p.get_text(strip=True)
-            if date_pattern_1 in p_text or date_pattern_2 in p_text:
-                start_element = p
-                break
+            if _DATE_HDR_RE.search(p_text):
+                date_paragraph_ids.add(id(p))
+                if start_element is None and (date_pattern_1 in p_text or date_pattern_2 in p_text):
+                    start_element = p
         
         # If today's date header is found, process the following <ul> elements
         if start_element:
             for sibling in start_element.find_next_siblings():
                 # If we hit another date paragraph, stop
-                if sibling in date_paragraphs:
+                if id(sibling) in date_paragraph_ids:
                     break
                 
                 # Look for <ul class="wp-block-list"> elements
-                if sibling.name == 'ul' and 'wp-block-list' in sibling.get('class', []):
-                    # Extract all links from the list
-                    for li in sibling.find_all('li'):
-                        a = li.find('a')
-                        if a:
-                            href = a.get('href')
-                            title = a.get_text(strip=True) or "Collect Energy"
-                            
-                            if href and href.startswith('http'):
-                                links.append(Link(
-                                    title=title,
-                                    url=href,
-                                    published_date_iso=date
-                                ))
+                if sibling.name == 'ul':
+                    if 'wp-block-list' in sibling.get('class', []):
+                        _emit_from_ul(sibling, links, date)
                 
-                # Also check if the sibling contains ul elements (nested structure)
-                elif sibling.name != 'ul':
+                # Also check any other sibling (div, section, figure, ...) for
+                # nested lists
+                else:
                     for ul in sibling.find_all('ul', class_='wp-block-list'):
-                        for li in ul.find_all('li'):
-                            a = li.find('a')
-                            if a:
-                                href = a.get('href')
-                                title = a.get_text(strip=True) or "Collect Energy"
-                                
-                                if href and href.startswith('http'):
-                                    links.append(Link(
-                                        title=title,
-                                        url=href,
-                                        published_date_iso=date
-                                    ))
+                        _emit_from_ul(ul, links, date)
         
         return links
     
@@ -1,6 +1,6 @@
-from typing import List
+from typing import List, Tuple
 from collections import OrderedDict
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 from .base import BaseExtractor
 from ..models import Link
 from ..extractors import register_extractor
@@ -8,6 +8,37 @@ from datetime import datetime, timedelta
 import re
 import logging
 
+
+# Tags the heading and link walks read. div is kept so ad/code blocks stay
+# whole and can be skipped, instead of their links being flattened into
+# the section.
+_SECTION_STRAINER = SoupStrainer(['div', 'p', 'ul', 'li', 'a', 'span'])
+
+# "25.11.2025" in old-style link text
+_DD_MM_YYYY_RE = re.compile(r'(\d{1,2})\.(\d{1,2})\.(\d{4})')
+# Numbered link prefix like "5." or "4. "
+_NUMBER_PREFIX_RE = re.compile(r'^\d+\.\s*')
+_YEAR_RE = re.compile(r'\d{4}')
+
+# Common month name typos (and lowercase month names) -> proper month name
+_MONTH_FIXES = {
+    'januray': 'January',
+    'febuary': 'February',
+    'feburary': 'February',
+    'march': 'March',
+    'april': 'April',
+    'may': 'May',
+    'june': 'June',
+    'july': 'July',
+    'august': 'August',
+    'september': 'September',
+    'october': 'October',
+    'november': 'November',
+    'december': 'December',
+}
+_MONTH_FIX_RE = re.compile(r'\b(?:' + '|'.join(_MONTH_FIXES) + r')\b', re.IGNORECASE)
+
+
 @register_extractor("mosttechs")
 class MostTechsExtractor(BaseExtractor):
     """
@@ -18,6 +49,8 @@ class MostTechsExtractor(BaseExtractor):
     2. NEW: Date as heading above links - <p><span><strong>30 December 2025</strong></span></p>
     """
 
+    HANDLED_DOMAINS = ("mosttechs.com",)
+
     def can_handle(self, url: str) -> bool:
         """Check if URL is from mosttechs.com."""
         return "mosttechs.com" in url.lower()
@@ -30,7 +63,7 @@ class MostTechsExtractor(BaseExtractor):
         Like WSOP, this extractor searches for both today's and yesterday's date headings
         to prevent missing late additions and avoid duplicates through fingerprinting.
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = self._make_soup(html, _SECTION_STRAINER)
         
         # Parse the target date (today)
         try:
@@ -52,9 +85,11 @@ class MostTechsExtractor(BaseExtractor):
         logging.info(f"[MostTechsExtractor] Today's links will be marked with: {date_iso}")
         logging.info(f"[MostTechsExtractor] Yesterday's links will be marked with: {yesterday_iso}")
         
-        # Try NEW pattern first (date headings)
-        today_links = self._extract_with_date_headings(soup, date_obj, date, date_iso)
-        yesterday_links = self._extract_with_date_headings(soup, yesterday_obj, date, yesterday_iso)
+        # Try NEW pattern first (date headings). Headings are read once and
+        # matched against both days.
+        headings = self._find_headings(soup)
+        today_links = self._extract_with_date_headings(headings, date_obj, date, date_iso)
+        yesterday_links = self._extract_with_date_headings(headings, yesterday_obj, date, yesterday_iso)
         
         # If no links found with NEW pattern, try OLD pattern
         if not today_links and not yesterday_links:
@@ -77,7 +112,23 @@ class MostTechsExtractor(BaseExtractor):
         logging.info(f"[MostTechsExtractor] Total links: {len(today_links)} today + {len(yesterday_links)} yesterday = {len(all_links)} unique")
         return list(all_links.values())
 
-    def _extract_with_date_headings(self, soup: BeautifulSoup, date_obj: datetime, date: str, date_iso: str) -> List[Link]:
+    def _find_headings(self, soup: BeautifulSoup) -> List[Tuple[Tag, str, str]]:
+        """
+        Collect candidate headings as (p_tag, heading_text, lowercased
+        normalized text) so each <p> is read once per extract call.
+        """
+        headings = []
+        for p_tag in soup.find_all("p"):
+            # Check if this <p> contains a date heading (via span/strong or direct text)
+            heading_text = self._extract_heading_text(p_tag)
+            if not heading_text:
+                continue
+            # Normalize heading text to fix common typos; lowercased to support
+            # lowercase months (e.g., "8 february 2026")
+            headings.append((p_tag, heading_text, self._normalize_date_text(heading_text).lower()))
+        return headings
+
+    def _extract_with_date_headings(self, headings: List[Tuple[Tag, str, str]], date_obj: datetime, date: str, date_iso: str) -> List[Link]:
         """
         NEW PATTERN: Extract links grouped under date headings.
         Format: <p><span><strong>30 December 2025</strong></span></p>
@@ -86,22 +137,14 @@ class MostTechsExtractor(BaseExtractor):
         
         # Generate date format variations
         date_patterns = self._generate_date_patterns(date_obj)
+        # Lowercased once for the case-insensitive comparison below
+        wanted_headings = frozenset(pattern.lower() for pattern in date_patterns)
         
         logging.info(f"[MostTechsExtractor] Looking for date headings: {date_patterns[:3]}...")
         
-        # Find all <p> tags to locate date headings
-        for p_tag in soup.find_all("p"):
-            # Check if this <p> contains a date heading (via span/strong or direct text)
-            heading_text = self._extract_heading_text(p_tag)
-            
-            if not heading_text:
-                continue
-            
-            # Normalize heading text to fix common typos
-            normalized_heading = self._normalize_date_text(heading_text)
-            
-            # Case-insensitive comparison to support lowercase months (e.g., "8 february 2026")
-            if normalized_heading.lower() not in [p.lower() for p in date_patterns]:
+        for p_tag, heading_text, heading_key in headings:
+            # Case-insensitive comparison against the date variants
+            if heading_key not in wanted_headings:
                 continue
             
             logging.info(f"[MostTechsExtractor] Found date heading: '{heading_text}'")
@@ -118,7 +161,6 @@ class MostTechsExtractor(BaseExtractor):
         """
         links = []
         target_date_str = date_obj.strftime("%d.%m.%Y")
-        date_in_text_pattern = re.compile(r'(\d{1,2})\.(\d{1,2})\.(\d{4})')
         
         logging.info(f"[MostTechsExtractor] Looking for date in link text: {target_date_str}")
         
@@ -132,7 +174,7 @@ class MostTechsExtractor(BaseExtractor):
                 continue
             
             link_text = a_tag.get_text(strip=True)
-            date_match = date_in_text_pattern.search(link_text)
+            date_match = _DD_MM_YYYY_RE.search(link_text)
             
             if not date_match:
                 continue
@@ -146,7 +188,7 @@ class MostTechsExtractor(BaseExtractor):
             
             # Check if dates match
             if link_date_obj.date() == date_obj.date():
-                clean_title = re.sub(r'^\d+\.\s*', '', link_text)
+                clean_title = _NUMBER_PREFIX_RE.sub('', link_text)
                 links.append(Link(
                     title=clean_title,
                     url=href,
@@ -162,28 +204,7 @@ class MostTechsExtractor(BaseExtractor):
         Normalize date text by fixing common typos in month names.
         Handles case-insensitive replacements.
         """
-        # Common month name typos (case-insensitive)
-        typo_map = {
-            r'\bjanuray\b': 'January',
-            r'\bfebuary\b': 'February',
-            r'\bfeburary\b': 'February',
-            r'\bmarch\b': 'March',
-            r'\bapril\b': 'April',
-            r'\bmay\b': 'May',
-            r'\bjune\b': 'June',
-            r'\bjuly\b': 'July',
-            r'\baugust\b': 'August',
-            r'\bseptember\b': 'September',
-            r'\boctober\b': 'October',
-            r'\bnovember\b': 'November',
-            r'\bdecember\b': 'December',
-        }
-        
-        normalized = text
-        for typo_pattern, correct in typo_map.items():
-            normalized = re.sub(typo_pattern, correct, normalized, flags=re.IGNORECASE)
-        
-        return normalized
+        return _MONTH_FIX_RE.sub(lambda m: _MONTH_FIXES[m.group(0).lower()], text)
     
     def _generate_date_patterns(self, date_obj: datetime) -> List[str]:
         """Generate all possible date format variations."""
@@ -224,7 +245,7 @@ class MostTechsExtractor(BaseExtractor):
         if not p_tag.find("a"):
             text = p_tag.get_text(strip=True)
             # Basic validation: should look like a date (contains month name or numbers)
-            if re.search(r'\d{4}', text):  # Contains year
+            if _YEAR_RE.search(text):  # Contains year
                 return text
         
         return None
@@ -263,7 +284,7 @@ class MostTechsExtractor(BaseExtractor):
             raw_text = a_tag.get_text(strip=True)
             
             # Remove number prefix (e.g., "5." or "4.")
-            clean_title = re.sub(r'^\d+\.\s*', '', raw_text)
+            clean_title = _NUMBER_PREFIX_RE.sub('', raw_text)
             
             # Skip if title is empty after cleaning
             if not clean_title:
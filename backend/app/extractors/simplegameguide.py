@@ -32,6 +32,8 @@ def register_extractor(name):
 class SimpleGameGuideExtractor(BaseExtractor):
     """Extractor for SimpleGameGuide.com pages with date-based h4 headings."""
     
+    HANDLED_DOMAINS = ("simplegameguide.com",)
+    
     def can_handle(self, url: str) -> bool:
         """Check if URL is from simplegameguide.com."""
         return "simplegameguide.com" in url.lower()
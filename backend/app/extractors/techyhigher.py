@@ -21,6 +21,8 @@ import re
 class TechyHigherExtractor(BaseExtractor):
     """Extractor for techyhigher.com pages with date-based sections."""
 
+    HANDLED_DOMAINS = ("techyhigher.com",)
+
     def can_handle(self, url: str) -> bool:
         """Check if URL is from techyhigher.com."""
         return "techyhigher.com" in url.lower()
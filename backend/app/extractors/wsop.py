@@ -12,9 +12,11 @@ import logging
 class WSOPExtractor(BaseExtractor):
     """Extractor for wsopga.me links grouped by date headings."""
 
+    HANDLED_DOMAINS = ("wsopga.me", "freechipswsop.com", "wsopchipsfree.com")
+
     def can_handle(self, url: str) -> bool:
         url_lower = url.lower()
-        return any(domain in url_lower for domain in ["wsopga.me", "freechipswsop.com", "wsopchipsfree.com"])
+        return any(domain in url_lower for domain in self.HANDLED_DOMAINS)
 
     def check_previous_days(self) -> int:
         """
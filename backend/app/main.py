@@ -3,11 +3,12 @@ import logging
 logging.basicConfig(level=logging.INFO)
 
 from fastapi import FastAPI, Body, HTTPException, BackgroundTasks
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, HttpUrl
 from typing import List, Optional, Dict, Any
 import os
+import json
 from dotenv import load_dotenv
 import asyncio
 from pathlib import Path
@@ -574,14 +575,20 @@ async def get_batch_status(request_id: str):
 
 @app.get("/api/batch-logs/{request_id}/{post_id}")
 async def get_post_logs(request_id: str, post_id: int, tail: int = 50):
-    """Get logs for specific post in batch update."""
+    """
+    Get logs for specific post in batch update.
+
+    `legacy` is true for requests saved before logs moved to their own
+    collection; their lines come from the request document (if it kept any).
+    """
     manager = get_batch_manager()
-    state = manager.get_post_state(request_id, post_id)
+    logs = manager.get_logs(request_id, post_id, tail=tail)
 
-    if not state:
+    if logs is None:
         raise HTTPException(status_code=404, detail="Post state not found")
 
-    return {"post_id": post_id, "logs": state.logs[-tail:] if tail > 0 else state.logs}
+    state = manager.get_post_state(request_id, post_id)
+    return {"post_id": post_id, "logs": logs, "legacy": state.is_legacy()}
 
 
 @app.get("/api/batch-history")
@@ -2651,6 +2658,20 @@ async def get_analytics_dashboard(days: int = 30):
     return analytics.get_dashboard_summary(days=days)
 
 
+@app.get("/api/analytics/dashboard-bundle")
+async def get_analytics_dashboard_bundle(days: int = 30):
+    """
+    Get summary, timeline, posts, sites and sources panels in one response
+
+    Query params:
+    - days: Number of days to analyze (default 30)
+
+    All panels are computed against the same cutoff date.
+    """
+    analytics = get_analytics_engine()
+    return analytics.get_dashboard_bundle(days=days)
+
+
 @app.get("/api/analytics/timeline")
 async def get_analytics_timeline(days: int = 30, granularity: str = "daily"):
     """
@@ -2670,6 +2691,22 @@ async def get_analytics_timeline(days: int = 30, granularity: str = "daily"):
     }
 
 
+@app.get("/api/analytics/timeline/stream")
+async def stream_analytics_timeline(days: int = 30, granularity: str = "daily"):
+    """
+    Stream timeline data points as newline-delimited JSON
+
+    Same query params and per-point fields as /api/analytics/timeline, but rows
+    are sent as the MongoDB cursor delivers them instead of in one response body.
+    """
+    analytics = get_analytics_engine()
+    rows = analytics.iter_update_timeline(days=days, granularity=granularity)
+    return StreamingResponse(
+        (json.dumps(row) + "\n" for row in rows),
+        media_type="application/x-ndjson",
+    )
+
+
 @app.get("/api/analytics/posts")
 async def get_post_analytics(days: int = 30):
     """
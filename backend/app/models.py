@@ -1,4 +1,4 @@
-from pydantic import BaseModel, HttpUrl, field_validator
+from pydantic import BaseModel, ConfigDict, HttpUrl, field_validator
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 
@@ -11,10 +11,13 @@ class Link(BaseModel):
     category: Optional[str] = None
     target: Optional[str] = "_blank"  # "_blank" for new tab, "_self" for same tab
 
-    class Config:
-        json_encoders = {
+    # Links are never mutated after extraction; frozen makes them hashable
+    model_config = ConfigDict(
+        frozen=True,
+        json_encoders={
             HttpUrl: str
-        }
+        },
+    )
 
 
 class PromoCode(BaseModel):
@@ -25,11 +28,14 @@ class PromoCode(BaseModel):
     expiry_date: Optional[str] = None  # When the code expires (YYYY-MM-DD or descriptive)
     source_url: Optional[str] = None  # Where the code came from
     category: Optional[str] = None  # Type of code (discount, bonus, free spins, etc.)
-    
-    class Config:
-        json_encoders = {
+
+    # Like Link, promo codes are read-only records once extracted
+    model_config = ConfigDict(
+        frozen=True,
+        json_encoders={
             HttpUrl: str
-        }
+        },
+    )
 
 
 class ExtractionResult(BaseModel):
@@ -6,7 +6,7 @@ Replaces JSON file-based storage with MongoDB for all data operations.
 
 from typing import List, Optional, Set, Dict, Any
 from datetime import datetime
-from pymongo import MongoClient, ASCENDING, DESCENDING
+from pymongo import MongoClient, ASCENDING, DESCENDING, UpdateOne
 from pymongo.errors import DuplicateKeyError
 import os
 import logging
@@ -27,6 +27,27 @@ from .mongo_models import (
 env_path = Path(__file__).parent.parent.parent / ".env"
 load_dotenv(dotenv_path=env_path)
 
+# Compound index that covers the analytics $match on the native `date` field
+# plus the post_id / site_key group keys. Pipelines do not hint it: the
+# planner picks it when it exists, and queries still run if it could not be built.
+FINGERPRINTS_ANALYTICS_INDEX = [("date", ASCENDING), ("post_id", ASCENDING), ("site_key", ASCENDING)]
+
+# batch_logs entries expire a week after they are written
+BATCH_LOG_TTL_SECONDS = 7 * 86400
+
+
+def _native_date(date_iso: str) -> Optional[datetime]:
+    """
+    Convert a "YYYY-MM-DD" string to a datetime stored as a BSON Date.
+    
+    `date_iso` stays the lookup key used for deduplication; the native `date`
+    copy lets analytics range-match and bucket dates without string compares.
+    """
+    try:
+        return datetime.strptime(date_iso, "%Y-%m-%d")
+    except (TypeError, ValueError):
+        return None
+
 
 class MongoDBStorage:
     """MongoDB storage manager with connection pooling"""
@@ -86,9 +107,36 @@ class MongoDBStorage:
         
         # Create indexes
         self._create_indexes()
+        self._backfill_rollups()
+    
+    def _backfill_rollups(self):
+        """
+        Fill empty analytics rollup collections from raw fingerprints.
+        
+        Deployments upgraded from before the rollups existed would otherwise
+        show blank timelines until scripts/backfill_daily_rollups.py is run.
+        Non-empty collections are left alone (save_new_links keeps them current).
+        """
+        try:
+            if self._db.daily_rollups.estimated_document_count() == 0:
+                written = rebuild_daily_rollups(self._db)
+                print(f"Backfilled {written} daily rollup document(s) from fingerprints")
+            if self._db.hourly_rollups.estimated_document_count() == 0:
+                written = seed_hourly_rollups(self._db)
+                print(f"Backfilled {written} hourly rollup document(s) from fingerprints")
+        except Exception as e:
+            print(f"Warning: Failed to backfill analytics rollups: {e}")
     
     def _create_indexes(self):
         """Create all necessary indexes"""
+        # Analytics index first and on its own, so a failure elsewhere (e.g. the
+        # unique fingerprint index clashing with existing duplicates) cannot
+        # keep it from being built
+        try:
+            self._db.fingerprints.create_index(FINGERPRINTS_ANALYTICS_INDEX)
+        except Exception as e:
+            print(f"Warning: Failed to create fingerprints analytics index: {e}")
+        
         try:
             # Posts collection
             self._db.posts.create_index("post_id", unique=True)
@@ -102,9 +150,18 @@ class MongoDBStorage:
             self._db.fingerprints.create_index("date_iso")
             self._db.fingerprints.create_index("site_key")
             
+            # Daily rollups collection - derived per-day link counts for analytics
+            self._db.daily_rollups.create_index([("date_iso", ASCENDING), ("site_key", ASCENDING), ("post_id", ASCENDING)], unique=True)
+            self._db.daily_rollups.create_index("date")
+            
+            # Hourly rollups collection - links added per write hour, for the hourly timeline
+            self._db.hourly_rollups.create_index([("hour", ASCENDING), ("date_iso", ASCENDING), ("site_key", ASCENDING), ("post_id", ASCENDING)], unique=True)
+            self._db.hourly_rollups.create_index("date")
+            
             # Monitoring collection
             self._db.monitoring.create_index("url", unique=True)
             self._db.monitoring.create_index("last_checked")
+            self._db.source_monitoring.create_index("source_url")
             
             # Alerts collection
             self._db.alerts.create_index("alert_type")
@@ -115,6 +172,10 @@ class MongoDBStorage:
             self._db.batch_requests.create_index("request_id", unique=True)
             self._db.batch_requests.create_index("created_at")
             
+            # Batch logs collection - one doc per log line, expired after 7 days
+            self._db.batch_logs.create_index([("request_id", ASCENDING), ("post_id", ASCENDING), ("ts", ASCENDING)])
+            self._db.batch_logs.create_index("ts", expireAfterSeconds=BATCH_LOG_TTL_SECONDS)
+            
             # Update history collection
             self._db.update_history.create_index("post_id")
             self._db.update_history.create_index("date_iso")
@@ -386,6 +447,35 @@ def get_known_fingerprints(post_id: int, date_iso: str, site_key: str = None) ->
         return set()
 
 
+def get_known_fingerprints_range(post_id: int, start_iso: str, end_iso: str, site_key: str = None) -> Set[str]:
+    """
+    Get the union of known fingerprints for a post over an inclusive date range.
+    
+    One query replaces a get_known_fingerprints call per day.
+    
+    Args:
+        post_id: The post ID
+        start_iso: First date in ISO format (inclusive)
+        end_iso: Last date in ISO format (inclusive)
+        site_key: Optional site key to get site-specific fingerprints
+        
+    Returns:
+        Set of known fingerprints across the range
+    """
+    try:
+        query = {"post_id": post_id, "date_iso": {"$gte": start_iso, "$lte": end_iso}}
+        if site_key:
+            query["site_key"] = site_key
+        
+        known: Set[str] = set()
+        for doc in _get_storage().db.fingerprints.find(query, {"fingerprints": 1, "_id": 0}):
+            known.update(doc.get("fingerprints", []))
+        return known
+    except Exception as e:
+        print(f"Database error in get_known_fingerprints_range: {e}")
+        return set()
+
+
 def save_new_links(post_id: int, date_iso: str, fingerprints: Set[str], site_key: str = None) -> None:
     """
     Save new link fingerprints (merge with existing) for a specific site.
@@ -405,14 +495,17 @@ def save_new_links(post_id: int, date_iso: str, fingerprints: Set[str], site_key
     existing_list = existing_doc["fingerprints"] if existing_doc and "fingerprints" in existing_doc else []
     existing_set = set(existing_list)
     # Append only truly new fingerprints at the end — preserves historical order
-    merged = existing_list + [fp for fp in fingerprints if fp not in existing_set]
+    new_fps = [fp for fp in fingerprints if fp not in existing_set]
+    merged = existing_list + new_fps
+    now = datetime.utcnow()
     
     _get_storage().db.fingerprints.update_one(
         query,
         {
             "$set": {
                 "fingerprints": merged,
-                "updated_at": datetime.utcnow().isoformat()
+                "date": _native_date(date_iso),
+                "updated_at": now.isoformat()
             },
             "$setOnInsert": {
                 "created_at": datetime.utcnow().isoformat(),
@@ -421,6 +514,117 @@ def save_new_links(post_id: int, date_iso: str, fingerprints: Set[str], site_key
         },
         upsert=True
     )
+    
+    # Keep the derived per-day rollup in step with the raw fingerprints, and
+    # count this write's links against the hour they were added. The
+    # fingerprint doc holds a whole day, so the hour has to be recorded here.
+    if new_fps:
+        _get_storage().db.daily_rollups.update_one(
+            {"date_iso": date_iso, "site_key": site_key, "post_id": post_id},
+            {"$inc": {"links_added": len(new_fps)}, "$set": {"date": _native_date(date_iso)}},
+            upsert=True
+        )
+        _get_storage().db.hourly_rollups.update_one(
+            {"hour": now.replace(minute=0, second=0, microsecond=0), "date_iso": date_iso, "site_key": site_key, "post_id": post_id},
+            {"$inc": {"links_added": len(new_fps)}, "$set": {"date": _native_date(date_iso)}},
+            upsert=True
+        )
+    
+    # New links change the post's known fingerprints. Analytics is left to its
+    # short TTL: clearing it on every write kept it cold while batches ran.
+    from .dedupe import invalidate_fingerprint_cache
+    invalidate_fingerprint_cache(post_id, site_key)
+
+
+def rebuild_daily_rollups(db=None) -> int:
+    """
+    Recompute the daily_rollups collection from raw fingerprints.
+    
+    Fingerprints are the source of truth; daily_rollups is a derived
+    {date_iso, site_key, post_id, links_added} summary that save_new_links
+    keeps up to date incrementally. Use this to backfill or repair it.
+    Promo-code fingerprints are not links and are not counted. Runs
+    automatically on connect when the collection is empty.
+    
+    Args:
+        db: Database to use (defaults to the shared storage's)
+    
+    Returns:
+        Number of rollup documents written
+    """
+    if db is None:
+        db = _get_storage().db
+    pipeline = [
+        {"$match": {"type": {"$ne": "promo_code"}}},
+        {"$group": {
+            "_id": {"date_iso": "$date_iso", "site_key": {"$ifNull": ["$site_key", None]}, "post_id": "$post_id"},
+            "links_added": {"$sum": {"$size": {"$ifNull": ["$fingerprints", []]}}}
+        }}
+    ]
+    operations = [
+        UpdateOne(
+            r["_id"],
+            {"$set": {"links_added": r["links_added"], "date": _native_date(r["_id"]["date_iso"])}},
+            upsert=True
+        )
+        for r in db.fingerprints.aggregate(pipeline, allowDiskUse=True)
+    ]
+    if not operations:
+        return 0
+    result = db.daily_rollups.bulk_write(operations, ordered=False)
+    return result.upserted_count + result.matched_count
+
+
+def seed_hourly_rollups(db=None) -> int:
+    """
+    Approximate hourly_rollups for fingerprints saved before it existed.
+    
+    Raw fingerprints do not keep the time each link was added, so every
+    document's links are counted against the hour of its last write
+    (`updated_at`). Only meant for an empty collection; runs automatically
+    on connect in that case.
+    
+    Args:
+        db: Database to use (defaults to the shared storage's)
+    
+    Returns:
+        Number of rollup documents written
+    """
+    if db is None:
+        db = _get_storage().db
+    # updated_at is an isoformat() string; its first 19 characters parse
+    # with or without microseconds
+    written_at = {"$dateFromString": {
+        "dateString": {"$substrBytes": ["$updated_at", 0, 19]},
+        "format": "%Y-%m-%dT%H:%M:%S",
+        "onError": None,
+        "onNull": None
+    }}
+    pipeline = [
+        {"$match": {"type": {"$ne": "promo_code"}, "updated_at": {"$type": "string"}}},
+        {"$group": {
+            "_id": {
+                "hour": {"$dateTrunc": {"date": written_at, "unit": "hour"}},
+                "date_iso": "$date_iso",
+                "site_key": {"$ifNull": ["$site_key", None]},
+                "post_id": "$post_id"
+            },
+            "links_added": {"$sum": {"$size": {"$ifNull": ["$fingerprints", []]}}}
+        }},
+        {"$match": {"_id.hour": {"$ne": None}, "links_added": {"$gt": 0}}}
+    ]
+    operations = [
+        UpdateOne(
+            r["_id"],
+            {"$set": {"links_added": r["links_added"], "date": _native_date(r["_id"]["date_iso"])}},
+            upsert=True
+        )
+        for r in db.fingerprints.aggregate(pipeline, allowDiskUse=True)
+    ]
+    if not operations:
+        return 0
+    result = db.hourly_rollups.bulk_write(operations, ordered=False)
+    return result.upserted_count + result.matched_count
 
 
 def get_post_fingerprints_history(post_id: int, limit: int = 30) -> List[Dict[str, Any]]:
@@ -486,6 +690,7 @@ def save_new_promo_codes(post_id: int, date_iso: str, fingerprints: Set[str], si
         {
             "$set": {
                 "fingerprints": merged,
+                "date": _native_date(date_iso),
                 "updated_at": datetime.utcnow().isoformat()
             },
             "$setOnInsert": {
@@ -591,6 +796,31 @@ def save_batch_request(batch_data: Dict[str, Any]) -> None:
     )
 
 
+def update_batch_request(request_id: str, set_fields: Dict[str, Any]) -> None:
+    """Apply a partial update (dotted $set paths) to a batch request"""
+    if set_fields:
+        _get_storage().db.batch_requests.update_one({"request_id": request_id}, {"$set": set_fields})
+
+
+def append_batch_logs(log_docs: List[Dict[str, Any]]) -> None:
+    """Append batch log lines ({request_id, post_id, ts, line} docs)"""
+    if log_docs:
+        _get_storage().db.batch_logs.insert_many(log_docs)
+
+
+def get_batch_logs(request_id: str, post_id: int, tail: int = 100) -> List[str]:
+    """Get the last `tail` log lines for a post in a batch request, oldest first (all if tail is 0)"""
+    cursor = (
+        _get_storage().db.batch_logs
+        .find({"request_id": request_id, "post_id": post_id}, {"line": 1, "_id": 0})
+        .sort([("ts", DESCENDING), ("_id", DESCENDING)])
+        .limit(tail)
+    )
+    lines = [doc["line"] for doc in cursor]
+    lines.reverse()
+    return lines
+
+
 def get_batch_request(request_id: str) -> Optional[Dict[str, Any]]:
     """Get batch request by ID"""
     result = _get_storage().db.batch_requests.find_one({"request_id": request_id})
@@ -637,6 +867,11 @@ def save_update_history(history_data: Dict[str, Any]) -> None:
     """Save link update history"""
     history_data["timestamp"] = datetime.utcnow().isoformat()
     _get_storage().db.update_history.insert_one(history_data)
+    
+    # History feeds the summary, which the dashboard bundle embeds; clear
+    # everything rather than tracking which cached getters depend on it
+    from .analytics import invalidate_analytics_cache
+    invalidate_analytics_cache()
 
 
 def get_update_history(
@@ -3,7 +3,7 @@ from typing import List
 from celery import shared_task
 from .scrape import fetch_html
 from .llm import parse_links_with_gemini
-from .dedupe import filter_only_today, dedupe_by_fingerprint, fingerprint
+from .dedupe import dedupe_today, fingerprint
 from .models import Link
 from .wp import update_post_links_section
 from .extraction import extract_links_with_heading_filter
@@ -45,10 +45,9 @@ def update_post_task(
                 links = extract_links_with_heading_filter(html, today_iso_local)
             all_links.extend(links)
 
-        # Filter to today and dedupe (placeholder known set empty; integrate with storage later)
-        only_today = filter_only_today(all_links, today_iso_local)
+        # Filter to today and dedupe in one pass
         known = get_known_fingerprints(post_id, today_iso_local)
-        deduped = dedupe_by_fingerprint(only_today, known_fingerprints=known)
+        deduped = dedupe_today(all_links, today_iso_local, known_fingerprints=known)
 
         if deduped:
             save_new_links(post_id, today_iso_local, {fingerprint(link) for link in deduped})
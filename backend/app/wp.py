@@ -518,7 +518,6 @@ async def update_post_links_section(
     # Create styled buttons grouped in threes (3 buttons per column block)
     # Using proper WordPress block format with block comments
     # Button style is determined by site configuration
-    column_blocks = []
 
     # Get button numbering mode (post config overrides site config)
     button_numbering = "auto"  # Default
@@ -538,38 +537,41 @@ async def update_post_links_section(
     # Split layouts stack vertically (1 per row), standard layouts use 3 per row
     buttons_per_row = 1 if is_split_layout else 3
 
+    # Every fragment goes into one list that is joined once
+    parts = []
     for i in range(0, len(merged_links), buttons_per_row):
         # Get buttons for this row
         group = merged_links[i : i + buttons_per_row]
 
+        # Open a column block for this group with proper block comments
+        if i:
+            parts.append("\n")
+        parts.append('<!-- wp:columns -->\n<div class="wp-block-columns">\n')
+
         # Create button HTML for this group using the button_styles module
-        buttons_in_group = []
-        for link in group:
+        for j, link in enumerate(group):
+            if j:
+                parts.append("\n")
+
             # Get target attribute (default to _blank for new tab)
             target = link.get("target", "_blank")
 
             # Generate button HTML with site-specific style and numbering mode
-            button_html = button_styles.generate_button_html(
-                link={
+            button_styles.write_button_html(
+                {
                     "url": link["url"],
                     "title": link["title"],
                     "order": link["order"],
                     "target": target,
                 },
-                style_name=button_style,
-                numbering_mode=button_numbering,
+                button_style,
+                button_numbering,
+                parts,
             )
-            buttons_in_group.append(button_html)
 
-        # Create a column block for this group with proper block comments
-        column_block = f"""<!-- wp:columns -->
-<div class="wp-block-columns">
-{chr(10).join(buttons_in_group)}
-</div>
-<!-- /wp:columns -->"""
-        column_blocks.append(column_block)
+        parts.append("\n</div>\n<!-- /wp:columns -->")
 
-    buttons_html = "\n".join(column_blocks)
+    buttons_html = "".join(parts)
 
     # Create a proper WordPress group block that wraps our links section
     # This ensures the entire section is treated as a single block
@@ -0,0 +1,29 @@
+"""
+Migration: Build the daily_rollups collection from existing fingerprints.
+
+Analytics timelines read per-day link counts from daily_rollups, which is
+maintained incrementally whenever new links are saved. The backend fills an
+empty collection from fingerprints by itself when it first connects, so this
+is only needed to repair the rollups. It is safe to re-run — counts are
+recomputed from fingerprints and overwritten.
+
+Usage:
+    python scripts/backfill_daily_rollups.py
+"""
+
+import sys
+from pathlib import Path
+
+# Ensure project root is on the path and .env is loaded
+env_path = Path(__file__).parent.parent / ".env"
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dotenv import load_dotenv
+load_dotenv(dotenv_path=env_path)
+
+from backend.app.mongo_storage import rebuild_daily_rollups
+
+
+if __name__ == "__main__":
+    written = rebuild_daily_rollups()
+    print(f"Rebuilt {written} daily rollup document(s) from fingerprints")
@@ -0,0 +1,58 @@
+"""
+Migration: Backfill the native `date` field on fingerprints and daily rollups.
+
+Analytics now range-matches on a BSON Date copy of `date_iso` (written by
+save_new_links / save_new_promo_codes). Documents stored before that change
+only have the "YYYY-MM-DD" string; this script derives `date` from it.
+`date_iso` itself is left untouched because deduplication looks it up by
+string. It is safe to re-run — documents that already have `date` are skipped.
+
+Running it is optional: analytics falls back to matching `date_iso` on
+documents without `date`, so history stays visible either way. Migrated
+documents are matched through the (date, post_id, site_key) index instead.
+
+Usage:
+    python scripts/migrate_fingerprint_dates.py
+"""
+
+import sys
+from pathlib import Path
+
+# Ensure project root is on the path and .env is loaded
+env_path = Path(__file__).parent.parent / ".env"
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dotenv import load_dotenv
+load_dotenv(dotenv_path=env_path)
+
+from backend.app.mongo_storage import _get_storage
+
+COLLECTIONS = ["fingerprints", "daily_rollups"]
+
+
+def migrate():
+    db = _get_storage().db
+
+    for name in COLLECTIONS:
+        collection = db[name]
+        query = {"date": {"$exists": False}, "date_iso": {"$type": "string"}}
+        missing_count = collection.count_documents(query)
+        print(f"{name}: {missing_count} document(s) missing native date")
+
+        if missing_count == 0:
+            continue
+
+        # Pipeline update so the conversion happens server-side in one call
+        result = collection.update_many(
+            query,
+            [{"$set": {"date": {"$dateFromString": {
+                "dateString": "$date_iso",
+                "format": "%Y-%m-%d",
+                "onError": None
+            }}}}]
+        )
+        print(f"{name}: migrated {result.modified_count} document(s)")
+
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,337 @@
+from datetime import datetime
+from types import SimpleNamespace
+
+from backend.app.analytics import AnalyticsEngine
+
+
+class FakeCollection:
+    def __init__(self, aggregate_results=None):
+        self.aggregate_results = aggregate_results or []
+        self.pipelines = []
+
+    def aggregate(self, pipeline, **kwargs):
+        self.pipelines.append(pipeline)
+        return iter(self.aggregate_results)
+
+
+def _engine(collections):
+    return AnalyticsEngine(storage=SimpleNamespace(db=collections))
+
+
+def test_dashboard_summary_uses_one_aggregation_per_collection():
+    db = {
+        "fingerprints": FakeCollection([{"total_links": 12, "active_posts": 3, "unique_dates": 4}]),
+        "update_history": FakeCollection([{"any": [{"n": 1}], "total": [{"n": 10}], "successful": [{"n": 8}]}]),
+        "source_monitoring": FakeCollection([]),
+    }
+    engine = _engine(db)
+    engine._get_health_distribution = lambda cutoff: {}
+
+    summary = engine.get_dashboard_summary(days=7)
+
+    assert len(db["fingerprints"].pipelines) == 1
+    assert len(db["update_history"].pipelines) == 1
+    assert summary["total_links_added"] == 12
+    assert summary["active_posts"] == 3
+    assert summary["total_updates"] == 10
+    assert summary["successful_updates"] == 8
+    assert summary["failed_updates"] == 2
+    assert summary["success_rate"] == 80.0
+
+
+def test_fingerprint_panels_count_links_like_rollups():
+    db = {
+        "fingerprints": FakeCollection([]),
+        "update_history": FakeCollection([]),
+        "daily_rollups": FakeCollection([]),
+        "source_monitoring": FakeCollection([{"health": [], "detail": []}]),
+    }
+    engine = _engine(db)
+
+    engine.get_dashboard_bundle(days=7)
+
+    summary, posts, sites = db["fingerprints"].pipelines
+    link_count = {"$sum": {"$size": {"$ifNull": ["$fingerprints", []]}}}
+    assert summary[1]["$group"]["total_links"] == link_count
+    assert posts[1]["$group"]["links"] == link_count
+    assert sites[1]["$group"]["total_links"] == link_count
+    for pipeline in (summary, posts, sites):
+        assert pipeline[0]["$match"]["type"] == {"$ne": "promo_code"}
+
+
+def test_fingerprint_window_falls_back_to_date_iso():
+    db = {
+        "fingerprints": FakeCollection([]),
+        "update_history": FakeCollection([]),
+    }
+    engine = _engine(db)
+    engine._get_health_distribution = lambda cutoff: {}
+
+    engine.get_dashboard_summary(days=7)
+
+    native, legacy = db["fingerprints"].pipelines[0][0]["$match"]["$or"]
+    assert native["date"]["$gte"] == datetime.combine(native["date"]["$gte"].date(), datetime.min.time())
+    assert legacy == {
+        "date": {"$exists": False},
+        "date_iso": {"$gte": native["date"]["$gte"].strftime("%Y-%m-%d")},
+    }
+
+
+def test_dashboard_summary_estimates_from_fingerprints_without_history():
+    db = {
+        "fingerprints": FakeCollection([{"total_links": 6, "active_posts": 2, "unique_dates": 3}]),
+        "update_history": FakeCollection([{"any": [], "total": [], "successful": []}]),
+    }
+    engine = _engine(db)
+    engine._get_health_distribution = lambda cutoff: {}
+
+    summary = engine.get_dashboard_summary(days=7)
+
+    assert summary["total_updates"] == 6
+    assert summary["successful_updates"] == 6
+    assert summary["avg_links_per_update"] == 1.0
+
+
+def test_dashboard_summary_handles_empty_collections():
+    db = {
+        "fingerprints": FakeCollection([]),
+        "update_history": FakeCollection([]),
+    }
+    engine = _engine(db)
+    engine._get_health_distribution = lambda cutoff: {}
+
+    summary = engine.get_dashboard_summary(days=7)
+
+    assert summary["total_updates"] == 0
+    assert summary["total_links_added"] == 0
+    assert summary["success_rate"] == 0
+
+
+def test_extractor_performance_joins_fingerprints_in_one_aggregation():
+    db = {
+        "posts": FakeCollection([
+            {"_id": "default", "posts_using": 1, "total_links": 3},
+            {"_id": "wsop", "posts_using": 2, "total_links": 10},
+        ]),
+    }
+    engine = _engine(db)
+
+    results = engine.get_extractor_performance(days=30)
+
+    assert len(db["posts"].pipelines) == 1
+    assert [r["extractor"] for r in results] == ["wsop", "default"]
+    assert results[0]["avg_links_per_post"] == 5.0
+    lookup = next(stage["$lookup"] for stage in db["posts"].pipelines[0] if "$lookup" in stage)
+    assert lookup["from"] == "fingerprints"
+
+
+def test_getters_are_served_from_cache_until_invalidated():
+    db = {
+        "posts": FakeCollection([{"_id": "wsop", "posts_using": 1, "total_links": 2}]),
+    }
+    engine = _engine(db)
+
+    first = engine.get_extractor_performance(days=30)
+    first[0]["posts_using"] = 99
+    second = engine.get_extractor_performance(30)
+    assert second[0]["posts_using"] == 1
+    assert len(db["posts"].pipelines) == 1
+
+    engine.get_extractor_performance(days=7)
+    assert len(db["posts"].pipelines) == 2
+
+    engine.invalidate("get_extractor")
+    engine.get_extractor_performance(days=30)
+    assert len(db["posts"].pipelines) == 3
+
+
+def test_cache_prunes_expired_entries(monkeypatch):
+    db = {"posts": FakeCollection([])}
+    engine = _engine(db)
+    clock = [1000.0]
+    monkeypatch.setattr("backend.app.analytics.time.monotonic", lambda: clock[0])
+
+    engine.get_extractor_performance(days=1)
+    engine.get_extractor_performance(days=2)
+    clock[0] += 3600
+    engine.get_extractor_performance(days=3)
+
+    assert list(engine._cache) == [("get_extractor_performance", ("days", 3))]
+
+
+def test_timeline_reads_daily_rollups():
+    db = {
+        "daily_rollups": FakeCollection([{"_id": "2026-01-02", "total_links": 9, "posts_updated": 2}]),
+    }
+    engine = _engine(db)
+
+    timeline = engine.get_update_timeline(days=30)
+
+    assert timeline[0]["date"] == "2026-01-02"
+    assert timeline[0]["total_links"] == 9
+    assert timeline[0]["total_updates"] == 2
+    per_post, per_day = (stage["$group"] for stage in db["daily_rollups"].pipelines[0][1:3])
+    assert per_post["_id"] == {"bucket": "$date_iso", "post": "$post_id"}
+    assert per_post["links"] == {"$sum": "$links_added"}
+    assert per_day == {"_id": "$_id.bucket", "posts_updated": {"$sum": 1}, "total_links": {"$sum": "$links"}}
+
+
+def test_source_performance_uses_server_side_reduction():
+    db = {
+        "source_monitoring": FakeCollection([{"health": [], "detail": [{
+            "source_url": "https://example.com/links",
+            "total": 4,
+            "successful": 3,
+            "total_links": 20,
+            "consecutive_failures": 0,
+            "total_extractions": 10,
+            "successful_extractions": 10,
+        }]}]),
+    }
+    engine = _engine(db)
+
+    sources = engine.get_source_performance(days=7)
+
+    assert sources == [{
+        "source_url": "https://example.com/links",
+        "total_extractions": 4,
+        "successful_extractions": 3,
+        "failed_extractions": 1,
+        "success_rate": 75.0,
+        "total_links_extracted": 20,
+        "avg_links_per_extraction": 5.0,
+        "consecutive_failures": 0,
+        "current_health": "healthy",
+        "last_success": None,
+    }]
+
+
+def test_weekly_timeline_buckets_with_date_trunc():
+    db = {"daily_rollups": FakeCollection([])}
+    engine = _engine(db)
+
+    engine.get_update_timeline(days=30, granularity="weekly")
+
+    bucket = db["daily_rollups"].pipelines[0][1]["$group"]["_id"]["bucket"]
+    assert bucket["$dateToString"]["date"]["$dateTrunc"]["unit"] == "week"
+
+
+def test_hourly_timeline_reads_hourly_rollups():
+    db = {"hourly_rollups": FakeCollection([{"_id": "2026-01-02T10:00", "total_links": 3, "posts_updated": 1}])}
+    engine = _engine(db)
+
+    timeline = engine.get_update_timeline(days=1, granularity="hourly")
+
+    assert timeline[0]["date"] == "2026-01-02T10:00"
+    per_post = db["hourly_rollups"].pipelines[0][1]["$group"]
+    assert per_post["_id"]["bucket"]["$dateToString"]["date"] == "$hour"
+    assert per_post["links"] == {"$sum": "$links_added"}
+
+
+def test_post_performance_joins_slug_in_pipeline():
+    db = {
+        "fingerprints": FakeCollection([{
+            "_id": 42, "post_id": 42, "content_slug": "coin-master",
+            "total_updates": 2, "successful_updates": 2, "total_links_added": 6, "sites_count": 1,
+        }]),
+        "posts": FakeCollection([]),
+    }
+    engine = _engine(db)
+
+    posts = engine.get_post_performance(days=30)
+
+    assert posts[0]["content_slug"] == "coin-master"
+    assert posts[0]["avg_links_per_update"] == 3.0
+    assert posts[0]["successful_updates"] == 2
+    assert (posts[0]["failed_updates"], posts[0]["success_rate"]) == (0, 100.0)
+    assert db["posts"].pipelines == []
+    assert any("$lookup" in stage for stage in db["fingerprints"].pipelines[0])
+
+
+def test_health_distribution_is_bucketed_server_side():
+    db = {"source_monitoring": FakeCollection([
+        {"health": [{"_id": "healthy", "n": 4}, {"_id": "critical", "n": 1}], "detail": []}
+    ])}
+    engine = _engine(db)
+
+    distribution = engine._get_health_distribution(datetime(2026, 1, 1))
+
+    assert distribution == {"healthy": 4, "warning": 0, "failing": 0, "critical": 1, "unknown": 0}
+    status = db["source_monitoring"].pipelines[0][0]["$facet"]["health"][0]["$project"]["status"]
+    assert status["$switch"]["default"] == "healthy"
+
+
+def test_source_getters_scan_once_per_uncached_call():
+    db = {
+        "fingerprints": FakeCollection([]),
+        "update_history": FakeCollection([]),
+        "source_monitoring": FakeCollection([{"health": [{"_id": "warning", "n": 2}], "detail": []}]),
+    }
+    engine = _engine(db)
+
+    assert engine.get_dashboard_summary(days=7)["health_distribution"]["warning"] == 2
+    assert engine.get_source_performance(days=7) == []
+    assert engine.get_source_performance(days=7) == []
+    assert len(db["source_monitoring"].pipelines) == 2
+    assert all(key[0].startswith("get_") for key in engine._cache)
+
+
+def test_timeline_generator_streams_rows_without_caching():
+    db = {"daily_rollups": FakeCollection([{"_id": "2026-01-02", "total_links": 4, "posts_updated": 1}])}
+    engine = _engine(db)
+
+    rows = engine.iter_update_timeline(days=7)
+    assert db["daily_rollups"].pipelines == []
+    assert next(rows)["total_links"] == 4
+    assert engine._cache == {}
+
+
+def test_dashboard_bundle_shares_one_cutoff():
+    db = {
+        "fingerprints": FakeCollection([]),
+        "update_history": FakeCollection([]),
+        "daily_rollups": FakeCollection([]),
+        "source_monitoring": FakeCollection([{"health": [], "detail": []}]),
+    }
+    engine = _engine(db)
+
+    bundle = engine.get_dashboard_bundle(days=14)
+
+    assert set(bundle) == {"period_days", "summary", "timeline", "posts", "sites", "sources"}
+    assert len(db["source_monitoring"].pipelines) == 1
+    fingerprint_matches = [pipeline[0]["$match"]["$or"] for pipeline in db["fingerprints"].pipelines]
+    cutoffs = {native["date"]["$gte"] for native, _ in fingerprint_matches}
+    cutoffs.update(pipeline[0]["$match"]["date"]["$gte"] for pipeline in db["daily_rollups"].pipelines)
+    assert len(cutoffs) == 1
+    assert len({legacy["date_iso"]["$gte"] for _, legacy in fingerprint_matches}) == 1
+
+
+class FakeRollups(FakeCollection):
+    def __init__(self, count):
+        super().__init__()
+        self.count = count
+        self.writes = []
+
+    def estimated_document_count(self):
+        return self.count
+
+    def bulk_write(self, operations, ordered=True):
+        self.writes.extend(operations)
+        return SimpleNamespace(upserted_count=len(operations), matched_count=0)
+
+
+def test_empty_rollups_are_backfilled_on_connect():
+    from backend.app.mongo_storage import MongoDBStorage
+
+    fingerprints = FakeCollection([{
+        "_id": {"date_iso": "2026-01-02", "site_key": None, "post_id": 7, "hour": datetime(2026, 1, 2, 9)},
+        "links_added": 3,
+    }])
+    daily, hourly = FakeRollups(0), FakeRollups(5)
+    storage = SimpleNamespace(_db=SimpleNamespace(fingerprints=fingerprints, daily_rollups=daily, hourly_rollups=hourly))
+
+    MongoDBStorage._backfill_rollups(storage)
+
+    assert len(fingerprints.pipelines) == 1
+    assert len(daily.writes) == 1
+    assert hourly.writes == []
@@ -0,0 +1,190 @@
+import asyncio
+
+from backend.app import batch_manager
+from backend.app.batch_manager import BatchUpdateManager, UpdateStatus
+
+
+def test_manager_init_does_not_touch_mongo(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("unexpected MongoDB read")
+
+    monkeypatch.setattr(batch_manager.mongo_storage, "get_recent_batch_requests", fail)
+    monkeypatch.setattr(batch_manager.mongo_storage, "get_batch_request", fail)
+
+    manager = BatchUpdateManager()
+
+    assert manager._cache == {}
+
+
+def test_get_request_loads_on_miss(monkeypatch):
+    calls = []
+
+    def fake_get(request_id):
+        calls.append(request_id)
+        return {
+            "request_id": request_id,
+            "post_ids": [7],
+            "created_at": "2026-01-01T00:00:00+05:30",
+            "overall_status": "success",
+            "posts": {"7": {
+                "status": "success", "progress": 100, "message": "Done",
+                "links_found": 3, "links_added": 2,
+            }},
+        }
+
+    monkeypatch.setattr(batch_manager.mongo_storage, "get_batch_request", fake_get)
+    manager = BatchUpdateManager()
+
+    request = manager.get_request("abc")
+    assert manager.get_request("abc") is request
+    assert calls == ["abc"]
+    assert request.posts[7].links_added == 2
+
+
+def test_progress_ticks_are_coalesced(monkeypatch):
+    saved = []
+    monkeypatch.setattr(batch_manager.mongo_storage, "save_batch_request", lambda data: saved.append(data))
+    monkeypatch.setattr(
+        batch_manager.mongo_storage, "update_batch_request",
+        lambda request_id, set_fields: saved.append(set_fields),
+    )
+    monkeypatch.setattr(batch_manager.mongo_storage, "cleanup_old_batch_requests", lambda keep_count: None)
+
+    async def run():
+        manager = BatchUpdateManager()
+        request = manager.create_request([1, 2])
+        saved.clear()
+
+        for pct in range(0, 100, 10):
+            await manager.update_post_state(request.request_id, 1, progress=pct)
+        assert saved == []
+
+        await manager.update_post_state(request.request_id, 2, status=UpdateStatus.SUCCESS)
+        assert len(saved) == 1
+
+        await manager.update_post_state(request.request_id, 1, progress=95)
+        await asyncio.sleep(batch_manager.FLUSH_INTERVAL * 2)
+        assert len(saved) == 2
+        assert saved[-1] == {"posts.1.progress": 95}
+
+    asyncio.run(run())
+
+
+def test_save_sends_only_changed_fields_and_appends_logs(monkeypatch):
+    full, partial, logs = [], [], []
+    monkeypatch.setattr(batch_manager.mongo_storage, "save_batch_request", full.append)
+    monkeypatch.setattr(
+        batch_manager.mongo_storage, "update_batch_request",
+        lambda request_id, set_fields: partial.append(set_fields),
+    )
+    monkeypatch.setattr(batch_manager.mongo_storage, "append_batch_logs", logs.extend)
+
+    request = batch_manager.BatchUpdateRequest("req", [1, 2])
+    request._save_to_db()
+    assert len(full) == 1
+
+    request.posts[2].progress = 40
+    request.posts[2].add_log("fetching")
+    request._save_to_db()
+    request._save_to_db()
+
+    assert len(full) == 1
+    assert partial == [{"posts.2.progress": 40, "posts.2.log_count": 1}]
+    assert len(logs) == 1
+    assert (logs[0]["request_id"], logs[0]["post_id"]) == ("req", 2)
+    assert logs[0]["line"].endswith("fetching")
+    assert "logs" not in request.to_dict()["posts"]["2"]
+
+
+def test_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(batch_manager, "CACHE_SIZE", 2)
+    monkeypatch.setattr(batch_manager.mongo_storage, "save_batch_request", lambda data: None)
+    monkeypatch.setattr(batch_manager.mongo_storage, "cleanup_old_batch_requests", lambda keep_count: None)
+
+    manager = BatchUpdateManager()
+    first = manager.create_request([1])
+    second = manager.create_request([2])
+    manager.get_request(first.request_id)
+    third = manager.create_request([3])
+
+    assert list(manager._cache) == [first.request_id, third.request_id]
+    assert second.request_id not in manager._cache
+
+
+def test_log_timestamps_use_ist():
+    from datetime import datetime
+
+    state = batch_manager.PostUpdateState(1)
+    expected = datetime.now(batch_manager.IST).strftime("%H:%M:%S")
+    state.add_log("hello")
+
+    line = state.pending_logs()[0]
+    assert line[1:9] in {expected, batch_manager._ist_clock()}
+    assert line.endswith("] hello")
+
+
+def test_get_logs_merges_stored_and_pending_lines(monkeypatch):
+    monkeypatch.setattr(batch_manager.mongo_storage, "save_batch_request", lambda data: None)
+    monkeypatch.setattr(batch_manager.mongo_storage, "cleanup_old_batch_requests", lambda keep_count: None)
+    monkeypatch.setattr(
+        batch_manager.mongo_storage, "get_batch_logs",
+        lambda request_id, post_id, tail: ["[10:00:00] one", "[10:00:01] two"],
+    )
+
+    manager = BatchUpdateManager()
+    request = manager.create_request([1])
+    request.posts[1].add_log("three")
+
+    logs = manager.get_logs(request.request_id, 1, tail=2)
+    assert logs[0] == "[10:00:01] two"
+    assert logs[1].endswith("three")
+    assert manager.get_logs(request.request_id, 99) is None
+
+
+def test_log_count_and_tail_are_capped(monkeypatch):
+    monkeypatch.setattr(batch_manager.mongo_storage, "save_batch_request", lambda data: None)
+    monkeypatch.setattr(batch_manager.mongo_storage, "cleanup_old_batch_requests", lambda keep_count: None)
+    tails = []
+    monkeypatch.setattr(
+        batch_manager.mongo_storage, "get_batch_logs",
+        lambda request_id, post_id, tail: tails.append(tail) or [],
+    )
+
+    manager = BatchUpdateManager()
+    request = manager.create_request([1])
+    for i in range(batch_manager.MAX_LOG_LINES + 5):
+        request.posts[1].add_log(f"line {i}")
+
+    assert request.posts[1].to_dict()["log_count"] == batch_manager.MAX_LOG_LINES
+    assert len(manager.get_logs(request.request_id, 1, tail=0)) == batch_manager.MAX_LOG_LINES
+    assert tails == [batch_manager.MAX_LOG_LINES]
+
+
+def test_legacy_request_serves_embedded_logs(monkeypatch):
+    monkeypatch.setattr(
+        batch_manager.mongo_storage, "get_batch_request",
+        lambda request_id: {
+            "request_id": request_id,
+            "post_ids": [7, 8],
+            "created_at": "2026-01-01T00:00:00+05:30",
+            "overall_status": "success",
+            "posts": {
+                "7": {
+                    "status": "success", "progress": 100, "message": "Done",
+                    "links_found": 1, "links_added": 1, "log_count": 2,
+                    "logs": ["[10:00:00] one", "[10:00:01] two"],
+                },
+                "8": {
+                    "status": "success", "progress": 100, "message": "Done",
+                    "links_found": 1, "links_added": 1, "log_count": 1,
+                },
+            },
+        },
+    )
+    monkeypatch.setattr(batch_manager.mongo_storage, "get_batch_logs", lambda request_id, post_id, tail: [])
+
+    manager = BatchUpdateManager()
+
+    assert manager.get_logs("old", 7) == ["[10:00:00] one", "[10:00:01] two"]
+    assert manager.get_post_state("old", 7).is_legacy()
+    assert not manager.get_post_state("old", 8).is_legacy()
@@ -0,0 +1,48 @@
+import pytest
+
+from backend.app import button_styles
+from backend.app.button_styles import generate_button_html
+
+
+def test_auto_numbering_respects_existing_numbers():
+    numbered = generate_button_html({"url": "https://a.com", "title": "07. Coins", "order": 2})
+    plain = generate_button_html({"url": "https://a.com", "title": "Coins", "order": 2})
+
+    assert ">07. Coins</a>" in numbered
+    assert ">02. Coins</a>" in plain
+
+
+def test_button_html_is_memoized_per_link_fields():
+    button_styles._render_button_html.cache_clear()
+    link = {"url": "https://a.com/spins", "title": "Spins", "order": 1}
+
+    first = generate_button_html(dict(link), "gradient_blue")
+    second = generate_button_html(dict(link), "gradient_blue")
+
+    assert first is second
+    assert button_styles._render_button_html.cache_info().hits == 1
+
+
+def test_split_layout_uses_button_text():
+    html = generate_button_html(
+        {"url": "https://a.com", "title": "Gift", "order": 3, "button_text": "Grab"},
+        "popbies_split_layout",
+    )
+
+    assert ">Grab</a>" in html
+    assert "<span" in html and ">03. Gift</span>" in html
+
+
+def test_button_styles_are_read_only():
+    with pytest.raises(TypeError):
+        button_styles.get_all_button_styles()["default"]["css"]["color"] = "red"
+
+
+def test_write_button_html_appends_to_buffer():
+    link = {"url": "https://a.com", "title": "Gift", "order": 1}
+    out = ["<div>"]
+
+    button_styles.write_button_html(link, "default", "auto", out)
+
+    assert out[0] == "<div>"
+    assert "".join(out[1:]) == generate_button_html(link, "default", "auto")
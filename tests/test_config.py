@@ -0,0 +1,26 @@
+import pytest
+
+from backend.app import config
+
+
+def test_missing_required_setting_is_named(monkeypatch):
+    monkeypatch.setattr(config, "load_dotenv", lambda *args, **kwargs: None)
+    monkeypatch.delenv("WP_BASE_URL", raising=False)
+    config.get_settings.cache_clear()
+
+    with pytest.raises(RuntimeError, match="WP_BASE_URL"):
+        config.get_settings()
+
+
+def test_settings_are_loaded_once(monkeypatch):
+    monkeypatch.setattr(config, "load_dotenv", lambda *args, **kwargs: None)
+    monkeypatch.setenv("WP_BASE_URL", "https://wp.example.com")
+    monkeypatch.setenv("WP_USERNAME", "editor")
+    monkeypatch.setenv("WP_APPLICATION_PASSWORD", "secret")
+    config.get_settings.cache_clear()
+
+    settings = config.get_settings()
+
+    assert settings.wp_base_url == "https://wp.example.com"
+    assert config.get_settings() is settings
+    config.get_settings.cache_clear()
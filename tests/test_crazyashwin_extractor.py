@@ -0,0 +1,46 @@
+from backend.app.extractors.crazyashwin import CrazyAshwinExtractor
+
+
+SAMPLE_HTML = """
+<article>
+<h2>Today's Hit it Rich links</h2>
+<p><a href="https://hititrich.com/r?a=1">HIR 1</a> <a href="https://t.me/x">Telegram</a></p>
+<div><a class="maxbutton" href="https://grandharvest.onelink.me/abc?reward=1"><span class="mb-text">GH Reward</span></a></div>
+<p><a href="https://telegram.me/x">Join</a></p>
+<h3>&#8607; 06.11.25 &#8607;</h3>
+<p><a href="https://hititrich.com/r?a=3">HIR 3</a></p>
+<h3>05.11.2025</h3>
+<p><a href="https://hititrich.com/r?a=1">HIR 1 again</a></p>
+<p><a href="https://coinmaster.com/x?c=5">CM</a></p>
+<h3>06.11.2025</h3>
+</article>
+"""
+
+
+def test_today_and_date_sections_are_merged_without_duplicates():
+    links = CrazyAshwinExtractor().extract(SAMPLE_HTML, "2025-11-06")
+
+    assert [str(link.url) for link in links] == [
+        "https://hititrich.com/r?a=1",
+        "https://grandharvest.onelink.me/abc?reward=1",
+        "https://coinmaster.com/x?c=5",
+    ]
+    assert [link.title for link in links] == ["HIR 1", "GH Reward", "CM"]
+    assert all(link.published_date_iso == "2025-11-06" for link in links)
+
+
+def test_invalid_date_returns_no_links():
+    assert CrazyAshwinExtractor().extract(SAMPLE_HTML, "06/11/2025") == []
+
+
+def test_hrefs_differing_only_in_trailing_slash_are_deduped():
+    html = """
+    <article>
+    <h2>Today's links</h2>
+    <p><a href="https://hititrich.com">HIR</a> <a href="https://hititrich.com/">HIR slash</a></p>
+    </article>
+    """
+
+    links = CrazyAshwinExtractor().extract(html, "2025-11-06")
+
+    assert [(str(link.url), link.title) for link in links] == [("https://hititrich.com/", "HIR")]
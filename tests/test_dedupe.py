@@ -0,0 +1,108 @@
+import pytest
+
+from backend.app.constants import FINGERPRINT_DELIMITER
+from backend.app.dedupe import (
+    dedupe_by_fingerprint,
+    dedupe_today,
+    filter_only_today,
+    fingerprint,
+    get_fingerprints_with_lookback,
+    invalidate_fingerprint_cache,
+)
+from backend.app.models import Link, PromoCode
+
+
+def _link(url, date, title="t"):
+    return Link(url=url, title=title, published_date_iso=date)
+
+
+def test_dedupe_today_matches_list_helpers():
+    links = [
+        _link("https://a.com/1", "2026-01-02"),
+        _link("https://a.com/2", "2026-01-01"),
+        _link("https://a.com/1", "2026-01-02", title="dup"),
+        _link("https://a.com/3", "2026-01-02"),
+    ]
+    known = {fingerprint(links[3])}
+
+    expected = dedupe_by_fingerprint(filter_only_today(links, "2026-01-02"), known)
+
+    assert dedupe_today(links, "2026-01-02", known) == expected
+    assert expected == [links[0]]
+
+
+class _Extractor:
+    def __init__(self, lookback_days):
+        self.lookback_days = lookback_days
+
+    def check_previous_days(self):
+        return self.lookback_days
+
+
+class _RangeStorage:
+    def __init__(self):
+        self.calls = []
+
+    def get_known_fingerprints(self, post_id, date_iso, site_key=None):
+        self.calls.append(("day", date_iso))
+        return {f"today{FINGERPRINT_DELIMITER}{date_iso}"}
+
+    def get_known_fingerprints_range(self, post_id, start_iso, end_iso, site_key=None):
+        self.calls.append(("range", start_iso, end_iso))
+        return {"a", "b"}
+
+
+@pytest.fixture(autouse=True)
+def _clear_lookback_cache():
+    invalidate_fingerprint_cache()
+    yield
+    invalidate_fingerprint_cache()
+
+
+def test_lookback_uses_one_ranged_query():
+    storage = _RangeStorage()
+
+    fps = get_fingerprints_with_lookback(_Extractor(3), 7, "2026-03-02", "site", storage)
+
+    assert fps == {"a", "b"}
+    assert storage.calls == [("range", "2026-02-27", "2026-03-02")]
+
+
+def test_no_lookback_reads_only_today():
+    storage = _RangeStorage()
+
+    get_fingerprints_with_lookback(_Extractor(0), 7, "2026-03-02", "site", storage)
+
+    assert storage.calls == [("day", "2026-03-02")]
+
+
+def test_lookback_is_cached_until_invalidated():
+    storage = _RangeStorage()
+
+    first = get_fingerprints_with_lookback(_Extractor(2), 7, "2026-03-02", "site", storage)
+    second = get_fingerprints_with_lookback(_Extractor(2), 7, "2026-03-02", "site", storage)
+    assert first is second
+    assert isinstance(first, frozenset)
+    assert len(storage.calls) == 1
+
+    invalidate_fingerprint_cache(7, "site")
+    get_fingerprints_with_lookback(_Extractor(2), 7, "2026-03-02", "site", storage)
+    assert len(storage.calls) == 2
+
+
+def test_links_are_frozen_and_still_validated():
+    link = _link("https://example.com/a", "2026-01-02")
+
+    with pytest.raises(Exception):
+        link.title = "changed"
+    with pytest.raises(Exception):
+        _link("not a url", "2026-01-02")
+    assert hash(link) == hash(_link("https://example.com/a", "2026-01-02"))
+
+
+def test_promo_codes_are_frozen():
+    code = PromoCode(code="SAVE20", published_date_iso="2026-01-02")
+
+    with pytest.raises(Exception):
+        code.code = "OTHER"
+    assert hash(code) == hash(PromoCode(code="SAVE20", published_date_iso="2026-01-02"))
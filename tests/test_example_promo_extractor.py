@@ -0,0 +1,26 @@
+from backend.app.extractors.example_promo import ExamplePromoExtractor
+
+
+def _codes(html):
+    return [pc.code for pc in ExamplePromoExtractor().extract_promo_codes(html, "2025-11-04")]
+
+
+def test_text_codes_do_not_span_elements():
+    html = """
+    <div>
+      <h3>Promo</h3><p>Details for this week's offers.</p>
+      <p>Use code SPIN50 for free spins.</p>
+    </div>
+    """
+
+    assert _codes(html) == ["SPIN50"]
+
+
+def test_text_codes_in_list_items_and_headings_are_found():
+    html = """
+    <h2>Coupon WELCOME10</h2>
+    <ul><li>Code: BONUS777 gives extra coins</li></ul>
+    <div class="promo-box"><code>BOXCODE</code><p>Free bonus spins</p></div>
+    """
+
+    assert _codes(html) == ["BOXCODE", "WELCOME10", "BONUS777"]
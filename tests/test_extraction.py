@@ -0,0 +1,178 @@
+from backend.app import extraction
+from backend.app.extraction import extract_links_with_heading_filter
+
+
+TODAY = "2025-10-26"
+
+STRONG_DATE_PAGE = """
+<html><body>
+<div class="entry">
+  <p><strong>Oct 26, 2025:</strong></p>
+  <p><a href="https://rewards.coinmaster.com/rewards/rewards.html?c=pe_a">Free spins</a></p>
+  <div class="links"><div data-link="https://rewards.coinmaster.com/rewards/rewards.html?c=pe_b"><span>Coins</span></div></div>
+  <p><a href="https://example.com/about">About</a> <a href="#top">Top</a></p>
+  <p><a href="https://rewards.coinmaster.com/rewards/rewards.html?c=pe_a">Free spins again</a></p>
+  <p><strong>Oct 25, 2025:</strong></p>
+  <p><a href="https://rewards.coinmaster.com/rewards/rewards.html?c=pe_old">Old</a></p>
+</div>
+</body></html>
+"""
+
+HEADING_PAGE = """
+<html><body>
+<h2>Links for today</h2>
+<ul>
+  <li><a href="https://game.example.com/gift?c=1">Gift 1</a></li>
+  <li><a href="https://game.example.com/gift?c=2">Gift 2</a></li>
+  <li><a href="javascript:void(0)">Share</a></li>
+</ul>
+<h2>Older links</h2>
+<ul><li><a href="https://game.example.com/gift?c=0">Gift 0</a></li></ul>
+</body></html>
+"""
+
+
+def _urls(links):
+    return [str(link.url) for link in links]
+
+
+def test_strong_date_section_stops_at_next_date():
+    links = extract_links_with_heading_filter(STRONG_DATE_PAGE, TODAY)
+
+    urls = _urls(links)
+    assert "https://rewards.coinmaster.com/rewards/rewards.html?c=pe_a" in urls
+    assert "https://rewards.coinmaster.com/rewards/rewards.html?c=pe_b" in urls
+    assert len(urls) == len(set(urls))
+    assert not any("pe_old" in u or "about" in u for u in urls)
+    assert all(link.published_date_iso == TODAY for link in links)
+
+
+def test_strong_date_section_stops_at_deeply_nested_next_date():
+    html = """
+    <div class="entry">
+      <p><strong>Oct 26, 2025:</strong></p>
+      <p><a href="https://rewards.coinmaster.com/rewards/rewards.html?c=pe_today">Today</a></p>
+      <div>
+        <p><strong>Note</strong> <strong>Tip</strong> <strong>Hint</strong></p>
+        <p><strong>Oct 25, 2025:</strong></p>
+        <p><a href="https://rewards.coinmaster.com/rewards/rewards.html?c=pe_old">Old</a></p>
+      </div>
+    </div>
+    """
+
+    assert _urls(extract_links_with_heading_filter(html, TODAY)) == [
+        "https://rewards.coinmaster.com/rewards/rewards.html?c=pe_today"
+    ]
+
+
+def test_strong_date_section_emits_data_link_buttons_before_anchors():
+    html = """
+    <div class="entry">
+      <p><strong>Oct 26, 2025:</strong></p>
+      <div>
+        <a href="https://rewards.coinmaster.com/rewards/rewards.html?c=pe_anchor">Anchor</a>
+        <div data-link="https://rewards.coinmaster.com/rewards/rewards.html?c=pe_button"><span>Button</span></div>
+      </div>
+    </div>
+    """
+
+    assert _urls(extract_links_with_heading_filter(html, TODAY)) == [
+        "https://rewards.coinmaster.com/rewards/rewards.html?c=pe_button",
+        "https://rewards.coinmaster.com/rewards/rewards.html?c=pe_anchor",
+    ]
+
+
+def test_heading_section_stops_at_next_heading():
+    links = extract_links_with_heading_filter(HEADING_PAGE, TODAY)
+
+    assert _urls(links) == ["https://game.example.com/gift?c=1", "https://game.example.com/gift?c=2"]
+    assert "Gift 1" in [link.title for link in links]
+
+
+def test_page_without_today_section_yields_nothing():
+    assert extract_links_with_heading_filter("<p><strong>Oct 1, 2020</strong></p>", TODAY) == []
+
+
+def test_heading_section_in_wrapper_stops_at_nested_heading():
+    html = """
+    <div><h3>Links for today</h3></div>
+    <div>
+      <p><a href="https://x.example.com/gift?a=1">A</a></p>
+      <h4>Yesterday</h4>
+      <p><a href="https://x.example.com/gift?a=2">B</a></p>
+    </div>
+    """
+
+    assert _urls(extract_links_with_heading_filter(html, TODAY)) == ["https://x.example.com/gift?a=1"]
+
+
+def test_heading_section_continues_past_its_wrapper():
+    html = """
+    <section><h3>Links for today</h3><p>Collect these:</p></section>
+    <p><a href="https://x.example.com/gift?a=9">A</a></p>
+    <h4>Yesterday</h4>
+    <p><a href="https://x.example.com/gift?a=8">B</a></p>
+    """
+
+    assert _urls(extract_links_with_heading_filter(html, TODAY)) == ["https://x.example.com/gift?a=9"]
+
+
+def test_heading_section_includes_links_inside_the_heading():
+    html = """
+    <h2><a href="https://x.example.com/gift?a=7">Links for today</a></h2>
+    <p><a href="https://x.example.com/gift?a=6">A</a></p>
+    <h2>Yesterday</h2>
+    """
+
+    assert _urls(extract_links_with_heading_filter(html, TODAY)) == [
+        "https://x.example.com/gift?a=7",
+        "https://x.example.com/gift?a=6",
+    ]
+
+
+def test_date_header_inside_inline_wrapper():
+    em_page = """
+    <html><head><script>var a = 1;</script></head><body><div>
+      <em><strong>26 October 2025</strong></em>
+      <ul><li><a href="https://rewards.coinmaster.com/rewards/rewards.html?c=pe_em">Spins</a></li></ul>
+    </div></body></html>
+    """
+    center_page = """
+    <center><strong>26 October 2025</strong></center>
+    <center><a href="https://rewards.coinmaster.com/rewards/rewards.html?c=pe_center">Coins</a></center>
+    """
+
+    assert _urls(extract_links_with_heading_filter(em_page, TODAY)) == [
+        "https://rewards.coinmaster.com/rewards/rewards.html?c=pe_em"
+    ]
+    assert _urls(extract_links_with_heading_filter(center_page, TODAY)) == [
+        "https://rewards.coinmaster.com/rewards/rewards.html?c=pe_center"
+    ]
+
+
+def test_parse_html_reuses_recent_trees():
+    html = "<p><strong>parse cache</strong></p>"
+
+    assert extraction.parse_html(html) is extraction.parse_html(str(html))
+    for i in range(extraction.PARSE_CACHE_SIZE + 1):
+        extraction.parse_html(f"<p>{i}</p>")
+    assert len(extraction._parse_cache) == extraction.PARSE_CACHE_SIZE
+
+
+def test_parse_html_mutable_returns_a_private_tree():
+    html = "<p><strong>mutable parse</strong></p>"
+
+    shared = extraction.parse_html(html)
+    private = extraction.parse_html(html, mutable=True)
+    private.strong.decompose()
+
+    assert private is not shared
+    assert shared.strong is not None
+    assert extraction.parse_html(html) is shared
+
+
+def test_iter_links_streams_the_same_links():
+    links = extraction.iter_links_with_heading_filter(HEADING_PAGE, TODAY)
+
+    assert next(links).title == "Gift 1"
+    assert _urls(links) == ["https://game.example.com/gift?c=2"]
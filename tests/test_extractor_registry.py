@@ -0,0 +1,23 @@
+from backend.app.extractors import get_extractor, get_extractor_for_url
+
+
+def test_registry_returns_shared_instances():
+    assert get_extractor("wsop") is get_extractor("wsop")
+
+
+def test_domain_index_matches_hosts_and_subdomains():
+    assert get_extractor_for_url("https://mosttechs.com/coin-master") is get_extractor("mosttechs")
+    assert get_extractor_for_url("https://www.wsopchipsfree.com/") is get_extractor("wsop")
+    assert get_extractor_for_url("https://WSOPGA.ME/x") is get_extractor("wsop")
+
+
+def test_unindexed_urls_fall_back_to_can_handle_order():
+    assert get_extractor_for_url("https://unknown.example.org/page") is get_extractor("default")
+
+
+def test_can_handle_matches_case_insensitively():
+    extractor = get_extractor("coinscrazy")
+
+    assert extractor.can_handle("https://CoinsCrazy.com/bingo-blitz-free-credits/")
+    assert extractor.can_handle_lower("https://coinscrazy.com/bingo-blitz-free-credits/")
+    assert not extractor.can_handle("https://example.com/page")
@@ -3,6 +3,7 @@ Test for Gamesbie Promo Code Extractor
 """
 
 import pytest
+from datetime import datetime
 from bs4 import BeautifulSoup
 from backend.app.extractors.gamesbie import GamesbieExtractor
 
@@ -113,6 +114,13 @@ class TestGamesbieExtractor:
         assert code_9ac5 is not None
         assert code_9ac5.expiry_date == "2026-01-31"
     
+    def test_expiry_date_formats(self, extractor):
+        """Test month-name fast path and the strptime fallback formats."""
+        assert extractor._parse_expiry_date("(Valid until: 3rd Feb 2026)") == datetime(2026, 2, 3)
+        assert extractor._parse_expiry_date("(Valid until: January 22nd, 2026)") == datetime(2026, 1, 22)
+        assert extractor._parse_expiry_date("(valid until 05/03/2026)") == datetime(2026, 3, 5)
+        assert extractor._parse_expiry_date("(Valid until: 31st February 2026)") is None
+    
     def test_promo_code_structure(self, extractor):
         """Test that extracted promo codes have correct structure."""
         result = extractor.extract_promo_codes(
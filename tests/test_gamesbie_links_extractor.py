@@ -0,0 +1,24 @@
+from backend.app.extractors.gamesbieLinks import GamesbieLinksExtractor
+
+
+SAMPLE_HTML = """
+<div class="entry-content">
+<p><strong>Animals &amp; Coins Free Energy: Today, 8th February</strong></p>
+<ul class="wp-block-list"><li><a href="https://example.com/energy?a=1">Energy 1</a></li></ul>
+<section><ul class="wp-block-list"><li><a href="https://example.com/energy?a=2">Energy 2</a></li></ul></section>
+<figure><ul class="wp-block-list"><li><a href="https://example.com/energy?a=3"></a></li></ul></figure>
+<p><strong>Animals &amp; Coins Free Energy: 7th February</strong></p>
+<ul class="wp-block-list"><li><a href="https://example.com/energy?a=0">Old</a></li></ul>
+</div>
+"""
+
+
+def test_lists_nested_in_any_sibling_are_collected_until_next_date():
+    links = GamesbieLinksExtractor().extract(SAMPLE_HTML, "2026-02-08")
+
+    assert [str(link.url) for link in links] == [
+        "https://example.com/energy?a=1",
+        "https://example.com/energy?a=2",
+        "https://example.com/energy?a=3",
+    ]
+    assert [link.title for link in links] == ["Energy 1", "Energy 2", "Collect Energy"]
@@ -24,9 +24,8 @@ def test_update_post_task_sends_notification_when_enabled(monkeypatch):
     monkeypatch.setattr(tasks, "fetch_html", fake_fetch_html)
     monkeypatch.setattr(tasks, "parse_links_with_gemini", fake_parse_links_with_gemini)
     monkeypatch.setattr(tasks, "extract_links_with_heading_filter", lambda html, today_iso: [])
-    monkeypatch.setattr(tasks, "filter_only_today", lambda links, today_iso: links)
     monkeypatch.setattr(tasks, "get_known_fingerprints", lambda post_id, today_iso: set())
-    monkeypatch.setattr(tasks, "dedupe_by_fingerprint", lambda only_today, known_fingerprints: only_today)
+    monkeypatch.setattr(tasks, "dedupe_today", lambda links, today_iso, known_fingerprints: links)
     monkeypatch.setattr(tasks, "save_new_links", lambda post_id, today_iso, fps: None)
     monkeypatch.setattr(tasks, "update_post_links_section", fake_update_post_links_section)
     monkeypatch.setattr(tasks, "notify_rewards_update_for_post", fake_notify)
@@ -62,9 +61,8 @@ def test_update_post_task_does_not_send_notification_when_disabled(monkeypatch):
     monkeypatch.setattr(tasks, "fetch_html", fake_fetch_html)
     monkeypatch.setattr(tasks, "parse_links_with_gemini", fake_parse_links_with_gemini)
     monkeypatch.setattr(tasks, "extract_links_with_heading_filter", lambda html, today_iso: [])
-    monkeypatch.setattr(tasks, "filter_only_today", lambda links, today_iso: links)
     monkeypatch.setattr(tasks, "get_known_fingerprints", lambda post_id, today_iso: set())
-    monkeypatch.setattr(tasks, "dedupe_by_fingerprint", lambda only_today, known_fingerprints: only_today)
+    monkeypatch.setattr(tasks, "dedupe_today", lambda links, today_iso, known_fingerprints: links)
     monkeypatch.setattr(tasks, "save_new_links", lambda post_id, today_iso, fps: None)
     monkeypatch.setattr(tasks, "update_post_links_section", fake_update_post_links_section)
     monkeypatch.setattr(tasks, "notify_rewards_update_for_post", fake_notify)